@@ -221,6 +221,9 @@ class ConfigManager:
         self.REDIS_PASSWORD: Optional[str] = self.get_env(
             "REDIS_PASSWORD", None
         )  # no default password
+        self.REDIS_MAX_CONNECTIONS: int = int(
+            self.get_env("REDIS_MAX_CONNECTIONS", "16")
+        )
 
         # Logging
         self.LOG_LEVEL: str = self.get_env("LOG_LEVEL", "INFO")  # type: ignore[assignment]
@@ -230,6 +233,11 @@ class ConfigManager:
             (self.get_env("STRUCTURED_LOGGING_ENABLED", "") or "").lower()
             in ("1", "true", "yes")
         ) or self.LOG_FORMAT == "json"
+        # Console logging feeds container log collection (ContainerLogV2), so
+        # it stays on unless explicitly disabled where only the file is read
+        self.LOG_TO_CONSOLE: bool = (
+            self.get_env("LOG_TO_CONSOLE", "true") or "true"
+        ).lower() in ("1", "true", "yes")
 
         # Runtime
         self.SYNC_INTERVAL_MINUTES: int = int(
@@ -247,6 +255,18 @@ class ConfigManager:
         self.CACHE_REFRESH_INTERVAL_HOURS: int = int(
             self.get_env("CACHE_REFRESH_INTERVAL_HOURS", "4")
         )
+        # "json" or "msgpack"; msgpack keeps non-string map keys as-is
+        self.CACHE_SERIALIZER: str = (
+            self.get_env("CACHE_SERIALIZER", "json") or "json"
+        ).lower()
+        # Cache payloads at least this many bytes are zstd-compressed; 0 disables
+        self.CACHE_COMPRESS_MIN_BYTES: int = int(
+            self.get_env("CACHE_COMPRESS_MIN_BYTES", "4096")
+        )
+        # Seconds a worker reuses a cache read without asking Redis; 0 disables
+        self.CACHE_LOCAL_TTL_SECONDS: int = int(
+            self.get_env("CACHE_LOCAL_TTL_SECONDS", "30")
+        )
         self.API_RATE_LIMIT_CALLS: int = int(self.get_env("API_RATE_LIMIT_CALLS", "60"))
         self.API_RATE_LIMIT_PERIOD: int = int(
             self.get_env("API_RATE_LIMIT_PERIOD", "61")
@@ -254,12 +274,21 @@ class ConfigManager:
         self.MAX_RETRY_ATTEMPTS: int = int(self.get_env("MAX_RETRY_ATTEMPTS", "3"))
         self.RETRY_DELAY_SECONDS: int = int(self.get_env("RETRY_DELAY_SECONDS", "30"))
         self.HTTP_REQUEST_TIMEOUT: int = int(self.get_env("HTTP_REQUEST_TIMEOUT", "15"))
+        self.HEALTH_CHECK_CACHE_SECONDS: int = int(
+            self.get_env("HEALTH_CHECK_CACHE_SECONDS", "2")
+        )
+        self.ENTITY_COUNTS_CACHE_SECONDS: int = int(
+            self.get_env("ENTITY_COUNTS_CACHE_SECONDS", "300")
+        )
 
         # Failed Sync Tracker
         self.FAILED_SYNC_TRACKER_ENABLED: bool = (
             self.get_env("FAILED_SYNC_TRACKER_ENABLED", "true") or "true"
         ).lower() in ("1", "true", "yes")
         self.FAILED_SYNC_TTL_DAYS: int = int(self.get_env("FAILED_SYNC_TTL_DAYS", "7"))
+        self.FAILED_SYNC_INDEX_REFRESH_MINUTES: int = int(
+            self.get_env("FAILED_SYNC_INDEX_REFRESH_MINUTES", "5")
+        )
 
     def _build_viewpoint_connection_string(self) -> str:
         if self.SQL_AUTH_MODE == "managed_identity":
@@ -363,6 +392,7 @@ class ConfigManager:
                 "REDIS_PORT": self.REDIS_PORT,
                 "LOG_FORMAT": self.LOG_FORMAT,
                 "STRUCTURED_LOGGING_ENABLED": self.STRUCTURED_LOGGING_ENABLED,
+                "LOG_TO_CONSOLE": self.LOG_TO_CONSOLE,
                 "PRODUCTION": self.PRODUCTION,
             },
         }
@@ -409,11 +439,13 @@ REDIS_HOST = config.REDIS_HOST
 REDIS_PORT = config.REDIS_PORT
 REDIS_DB = config.REDIS_DB
 REDIS_PASSWORD = config.REDIS_PASSWORD
+REDIS_MAX_CONNECTIONS = config.REDIS_MAX_CONNECTIONS
 
 LOG_LEVEL = config.LOG_LEVEL
 LOG_DIR = config.LOG_DIR
 LOG_FORMAT = config.LOG_FORMAT
 STRUCTURED_LOGGING_ENABLED = config.STRUCTURED_LOGGING_ENABLED
+LOG_TO_CONSOLE = config.LOG_TO_CONSOLE
 
 SYNC_INTERVAL_MINUTES = config.SYNC_INTERVAL_MINUTES
 PRODUCTION = config.PRODUCTION
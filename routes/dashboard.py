@@ -27,10 +27,11 @@ import os
 import re
 import secrets
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from functools import wraps
-from flask import Blueprint, jsonify, request, Response
-from typing import Optional, Callable, List, Dict, Any
+from flask import Blueprint, jsonify, request, Response, stream_with_context
+from typing import Optional, Callable, Iterator, List, Dict, Any
 
 from utils.logger import get_logger
 
@@ -45,6 +46,7 @@ RATE_LIMIT_STATE_CHANGE = "5/minute"  # For state-changing operations (pause/res
 MAX_HOURS = 4320  # 6 months in hours
 MAX_LIMIT = 1000  # Max records to return
 MAX_AUDIT_LOG_ENTRIES = 1000  # Max audit log entries to keep
+MAX_RATE_LIMIT_KEYS = 1024  # Max client/endpoint keys tracked for rate limiting
 MAX_PAUSED_BY_LENGTH = 64  # Max length for paused_by identifier
 PAUSED_BY_PATTERN = re.compile(r"^[\w@.\-]+$")  # Allowed chars: alphanumeric, @, ., -
 
@@ -112,8 +114,10 @@ def _get_dashboard_token() -> Optional[str]:
     return os.getenv("DASHBOARD_API_TOKEN")
 
 
-# Simple rate limiting for state-changing operations
-_rate_limit_tracker: Dict[str, List[float]] = {}
+# Simple rate limiting for state-changing operations. Keys are per endpoint and
+# client IP, so the tracker is kept in LRU order and capped at
+# MAX_RATE_LIMIT_KEYS to stop a long-running process from leaking entries.
+_rate_limit_tracker: "OrderedDict[str, List[float]]" = OrderedDict()
 
 
 def _reset_rate_limit_tracker() -> None:
@@ -137,19 +141,22 @@ def rate_limit_state_change(max_calls: int = 5, period_seconds: int = 60):
             key = f"{f.__name__}:{client_ip}"
             current_time = time.time()
 
-            # Get or create request history for this client
-            if key not in _rate_limit_tracker:
-                _rate_limit_tracker[key] = []
-
-            # Remove old requests outside the window
-            _rate_limit_tracker[key] = [
-                t for t in _rate_limit_tracker[key] if current_time - t < period_seconds
+            # Get request history for this client, dropping requests outside
+            # the window, and mark it most recently used
+            history = [
+                t
+                for t in _rate_limit_tracker.get(key, ())
+                if current_time - t < period_seconds
             ]
+            _rate_limit_tracker[key] = history
+            _rate_limit_tracker.move_to_end(key)
+            if len(_rate_limit_tracker) > MAX_RATE_LIMIT_KEYS:
+                _rate_limit_tracker.popitem(last=False)
 
             # Check if limit exceeded
-            if len(_rate_limit_tracker[key]) >= max_calls:
+            if len(history) >= max_calls:
                 logger.warning(
-                    f"Rate limit exceeded for {key}: {len(_rate_limit_tracker[key])} calls in {period_seconds}s"
+                    f"Rate limit exceeded for {key}: {len(history)} calls in {period_seconds}s"
                 )
                 return (
                     jsonify(
@@ -162,7 +169,7 @@ def rate_limit_state_change(max_calls: int = 5, period_seconds: int = 60):
                 )
 
             # Record this request
-            _rate_limit_tracker[key].append(current_time)
+            history.append(current_time)
 
             return f(*args, **kwargs)
 
@@ -1037,9 +1044,8 @@ def create_dashboard_blueprint(
             )
 
             if output_format == "csv":
-                csv_content = _convert_to_csv(data)
                 return Response(
-                    csv_content,
+                    stream_with_context(_iter_csv(data)),
                     mimetype="text/csv",
                     headers={
                         "Content-Disposition": f"attachment; filename={filename}.csv"
@@ -1431,12 +1437,10 @@ def _get_export_data(
     return []
 
 
-def _convert_to_csv(data: List[Dict[str, Any]]) -> str:
-    """Convert list of dicts to CSV string."""
+def _iter_csv(data: List[Dict[str, Any]]) -> Iterator[str]:
+    """Yield CSV text one row at a time so exports are never held whole."""
     if not data:
-        return ""
-
-    output = io.StringIO()
+        return
 
     # Get all unique keys from all records
     all_keys = set()
@@ -1445,8 +1449,18 @@ def _convert_to_csv(data: List[Dict[str, Any]]) -> str:
             all_keys.update(record.keys())
     fieldnames = sorted(all_keys)
 
-    writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction="ignore")
+    # One small buffer is reused for every row
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+
+    def drain() -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
     writer.writeheader()
+    yield drain()
 
     for record in data:
         if isinstance(record, dict):
@@ -1454,9 +1468,13 @@ def _convert_to_csv(data: List[Dict[str, Any]]) -> str:
             flat_record = {}
             for k, v in record.items():
                 if isinstance(v, (dict, list)):
-                    flat_record[k] = json.dumps(v)
+                    flat_record[k] = json.dumps(v, default=str)
                 else:
                     flat_record[k] = v
             writer.writerow(flat_record)
+            yield drain()
+
 
-    return output.getvalue()
+def _convert_to_csv(data: List[Dict[str, Any]]) -> str:
+    """Convert list of dicts to CSV string."""
+    return "".join(_iter_csv(data))
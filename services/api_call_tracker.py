@@ -8,7 +8,7 @@ using a Redis ring buffer for efficient storage and retrieval.
 import json
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import redis
 
@@ -19,6 +19,45 @@ logger = get_logger("api_call_tracker")
 # Redis key for the API calls list
 REDIS_KEY = "safetyamp:api_calls"
 
+# Maximum stored length of request/response summaries
+SUMMARY_MAX_LENGTH = 200
+
+
+def _iter_repr(value: Any) -> Iterator[str]:
+    """Yield repr(value) piecewise so callers can stop once they have enough."""
+    if type(value) is dict:
+        yield "{"
+        for index, (key, item) in enumerate(value.items()):
+            if index:
+                yield ", "
+            yield repr(key)
+            yield ": "
+            yield from _iter_repr(item)
+        yield "}"
+    elif type(value) is list:
+        yield "["
+        for index, item in enumerate(value):
+            if index:
+                yield ", "
+            yield from _iter_repr(item)
+        yield "]"
+    else:
+        yield repr(value)
+
+
+def _summarize(value: Any, limit: int = SUMMARY_MAX_LENGTH) -> str:
+    """Return str(value)[:limit] without rendering all of a large payload."""
+    if type(value) not in (dict, list):
+        return str(value)[:limit]
+    parts = []
+    size = 0
+    for part in _iter_repr(value):
+        parts.append(part)
+        size += len(part)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
 
 class ApiCallTracker:
     """
@@ -130,9 +169,9 @@ class ApiCallTracker:
 
         # Optionally include payload/response summaries (truncated for storage)
         if request_payload:
-            call_record["request_summary"] = str(request_payload)[:200]
+            call_record["request_summary"] = _summarize(request_payload)
         if response_summary:
-            call_record["response_summary"] = str(response_summary)[:200]
+            call_record["response_summary"] = _summarize(response_summary)
 
         try:
             # Push to head of list (newest first)
@@ -1,9 +1,12 @@
 import asyncio
+import hashlib
 import json
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple
 
 import redis
 
@@ -12,12 +15,175 @@ from utils.metrics import metrics
 from utils.data_validator import validator
 from config import config
 
+try:
+    # orjson is optional; stdlib json is used when unavailable
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    # msgspec is optional; preferred MessagePack codec when installed
+    import msgspec  # type: ignore
+
+    # enc_hook mirrors msgpack's default=str for otherwise unsupported types
+    _MSGSPEC_ENCODER = msgspec.msgpack.Encoder(enc_hook=str)
+    _MSGSPEC_DECODER = msgspec.msgpack.Decoder()
+except Exception:  # pragma: no cover
+    msgspec = None  # type: ignore
+    _MSGSPEC_ENCODER = _MSGSPEC_DECODER = None
+
+try:
+    # msgpack is optional; fallback MessagePack codec without msgspec
+    import msgpack  # type: ignore
+except Exception:  # pragma: no cover
+    msgpack = None  # type: ignore
+
+try:
+    # zstandard is optional; large payloads are stored uncompressed without it
+    import zstandard  # type: ignore
+except Exception:  # pragma: no cover
+    zstandard = None  # type: ignore
+
 logger = get_logger("data_manager")
 
 # Prometheus gauges for cache telemetry (low-cardinality per cache name)
 _cache_last_updated_ts = metrics.cache_last_updated_ts
 _cache_items_total = metrics.cache_items_total
 _cache_ttl_seconds = metrics.cache_ttl_seconds
+_cache_hits_total = metrics.cache_hits_total
+_cache_misses_total = metrics.cache_misses_total
+_cache_refresh_total = metrics.cache_refresh_total
+_cache_read_latency_seconds = metrics.cache_read_latency_seconds
+
+
+# Leading byte of MessagePack cache payloads. JSON text never starts with a
+# control byte, so both formats can be read back without versioned keys.
+_MSGPACK_TAG = b"\x01"
+# Leading byte of zstd-compressed payloads; the frame wraps a JSON or
+# MessagePack payload that is decoded as usual once decompressed.
+_ZSTD_TAG = b"\x02"
+_ZSTD_LEVEL = 3
+
+# zstd contexts must not be used by two threads at once, so each thread keeps
+# its own pair instead of allocating fresh contexts for every payload
+_zstd_local = threading.local()
+
+
+def _zstd_codecs() -> Tuple[Any, Any]:
+    """Return this thread's (compressor, decompressor) pair."""
+    codecs = getattr(_zstd_local, "codecs", None)
+    if codecs is None:
+        codecs = _zstd_local.codecs = (
+            zstandard.ZstdCompressor(level=_ZSTD_LEVEL),
+            zstandard.ZstdDecompressor(),
+        )
+    return codecs
+
+
+def _dumps(value: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize a cache value to UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; stdlib handles these
+    return json.dumps(value, default=default).encode("utf-8")
+
+
+def _loads(raw: Any) -> Any:
+    """Deserialize JSON read from Redis, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _encode_cache_payload(
+    value: Any,
+    serializer: str = "json",
+    compress_min_bytes: int = 0,
+    json_bytes: Optional[bytes] = None,
+) -> bytes:
+    """Encode a cache payload as tagged MessagePack or plain JSON.
+
+    Payloads of at least compress_min_bytes (0 disables) are zstd-compressed
+    and tagged when zstandard is installed. json_bytes, when given, is
+    _dumps(value) already computed by the caller and is reused for JSON.
+    """
+    if serializer == "msgpack" and _MSGSPEC_ENCODER is not None:
+        raw = _MSGPACK_TAG + _MSGSPEC_ENCODER.encode(value)
+    elif serializer == "msgpack" and msgpack is not None:
+        raw = _MSGPACK_TAG + msgpack.packb(value, use_bin_type=True, default=str)
+    else:
+        raw = json_bytes if json_bytes is not None else _dumps(value)
+    if compress_min_bytes > 0 and len(raw) >= compress_min_bytes and zstandard:
+        return _ZSTD_TAG + _zstd_codecs()[0].compress(raw)
+    return raw
+
+
+def _decode_cache_payload(raw: bytes) -> Any:
+    """Decode a payload written by _encode_cache_payload, whatever its format."""
+    if raw[:1] == _ZSTD_TAG:
+        if zstandard is None:
+            raise ValueError(
+                "compressed cache payload found but zstandard is not installed"
+            )
+        raw = _zstd_codecs()[1].decompress(raw[1:])
+    if raw[:1] == _MSGPACK_TAG:
+        if _MSGSPEC_DECODER is not None:
+            return _MSGSPEC_DECODER.decode(raw[1:])
+        if msgpack is None:
+            raise ValueError("msgpack cache payload found but msgpack is not installed")
+        return msgpack.unpackb(raw[1:], raw=False, strict_map_key=False)
+    return _loads(raw)
+
+
+def _payload_digest(payload: bytes) -> str:
+    """Fingerprint of an encoded payload for the save script's change check.
+
+    Hashes the stored bytes, so large payloads are scanned after compression.
+    Only compared for equality, never a security boundary.
+    """
+    return hashlib.blake2b(payload, digest_size=16, usedforsecurity=False).hexdigest()
+
+
+def _metadata_fields(metadata: Dict[str, Any]) -> Dict[str, bytes]:
+    """Cache metadata as Redis hash fields, one JSON-encoded value per field."""
+    return {field: _dumps(value, default=str) for field, value in metadata.items()}
+
+
+# Writes a cache entry in one round trip. When the stored data_hash matches,
+# the unchanged payload only has its TTL extended instead of being rewritten.
+# The metadata hash is always replaced: UNLINK drops stale fields and entries
+# written before metadata hashes, which are plain strings.
+# KEYS: cache key, metadata key
+# ARGV: JSON-encoded data_hash, TTL seconds, payload, metadata field/value pairs
+_SAVE_CACHE_SCRIPT = """
+local previous = false
+if redis.call('TYPE', KEYS[2]).ok == 'hash' then
+    previous = redis.call('HGET', KEYS[2], 'data_hash')
+end
+local outcome
+if previous == ARGV[1] and redis.call('EXPIRE', KEYS[1], ARGV[2]) == 1 then
+    outcome = 'EXTENDED'
+elseif previous then
+    outcome = 'UPDATED'
+else
+    outcome = 'STORED'
+end
+if outcome ~= 'EXTENDED' then
+    redis.call('SET', KEYS[1], ARGV[3], 'EX', ARGV[2])
+end
+redis.call('UNLINK', KEYS[2])
+redis.call('HSET', KEYS[2], unpack(ARGV, 4))
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return outcome
+"""
+
+
+# Connection pools shared by every DataManager in the process, keyed by
+# server and response decoding, so extra instances reuse open connections
+_REDIS_POOLS: Dict[Tuple[Any, ...], redis.ConnectionPool] = {}
+_REDIS_POOLS_LOCK = threading.Lock()
 
 
 class DataManager:
@@ -27,6 +193,19 @@ class DataManager:
     - Validation utilities bridge
     """
 
+    # Maximum keys fetched per MGET when reading records in bulk
+    MGET_BATCH_SIZE = 500
+    # SCAN hint and pipeline chunk size for keyspace-wide operations
+    SCAN_COUNT = 500
+    PIPELINE_BATCH_SIZE = 1000
+    # Entries kept in the per-instance cache of recent Redis reads
+    LOCAL_CACHE_MAX_ENTRIES = 128
+    # Sorted sets of failed sync records scored by expiry time; the global
+    # set holds "entity_type:entity_id" members, per-type sets hold entity ids
+    FAILED_SYNC_INDEX_KEY = "safetyamp:failed_sync_index"
+    # Hash of entity_id -> entity_type for resolving bare record ids
+    FAILED_SYNC_ENTITY_TYPE_KEY = "safetyamp:failed_sync_by_entity_id"
+
     def __init__(self):
         # Cache config
         self.cache_dir = Path("cache")
@@ -38,11 +217,34 @@ class DataManager:
         self.redis_password = config.REDIS_PASSWORD
 
         self.redis_client = None
+        # Client without response decoding, for binary cache payloads
+        self.redis_binary_client = None
+        self._save_cache_script = None
+        self.cache_serializer = getattr(config, "CACHE_SERIALIZER", "json")
+        if self.cache_serializer == "msgpack" and msgpack is None and msgspec is None:
+            logger.warning(
+                "CACHE_SERIALIZER=msgpack but neither msgspec nor msgpack is installed"
+            )
+        self.cache_compress_min_bytes = int(
+            getattr(config, "CACHE_COMPRESS_MIN_BYTES", 0)
+        )
+        if self.cache_compress_min_bytes > 0 and zstandard is None:
+            logger.warning(
+                "CACHE_COMPRESS_MIN_BYTES is set but zstandard is not installed"
+            )
         self._init_redis()
 
+        # Recent Redis reads by (cache_name, key) -> (monotonic fetch time, data)
+        self._local_cache: OrderedDict = OrderedDict()
+        self._local_cache_ttl = int(getattr(config, "CACHE_LOCAL_TTL_SECONDS", 0))
+        self._local_cache_lock = threading.Lock()
+
         # TTL settings
         self.cache_ttl_hours = int(config.CACHE_TTL_HOURS)
         self.cache_refresh_interval_hours = int(config.CACHE_REFRESH_INTERVAL_HOURS)
+        # Seconds are what Redis and the age checks use; derive them once
+        self.cache_ttl_seconds = self.cache_ttl_hours * 3600
+        self.cache_refresh_interval_seconds = self.cache_refresh_interval_hours * 3600
 
         # Vista in-memory lifecycle
         self._employee_data: List[Dict[str, Any]] = []
@@ -53,18 +255,53 @@ class DataManager:
         self._lock = asyncio.Lock()
 
     # ===== Redis/File cache =====
+    def _build_redis_pool(self, decode_responses: bool) -> redis.ConnectionPool:
+        """Connection pool shared by concurrent callers, with retry on drops.
+
+        Pools are created once per server and decoding mode and reused by
+        later DataManager instances.
+        """
+        pool_key = (
+            self.redis_host,
+            self.redis_port,
+            self.redis_db,
+            self.redis_password,
+            decode_responses,
+        )
+        with _REDIS_POOLS_LOCK:
+            pool = _REDIS_POOLS.get(pool_key)
+            if pool is None:
+                pool = _REDIS_POOLS[pool_key] = self._new_redis_pool(decode_responses)
+            return pool
+
+    def _new_redis_pool(self, decode_responses: bool) -> redis.ConnectionPool:
+        return redis.BlockingConnectionPool(
+            host=self.redis_host,
+            port=self.redis_port,
+            db=self.redis_db,
+            password=self.redis_password,
+            decode_responses=decode_responses,
+            max_connections=int(getattr(config, "REDIS_MAX_CONNECTIONS", 16)),
+            socket_connect_timeout=5,
+            socket_timeout=5,
+            health_check_interval=30,
+            retry=redis.retry.Retry(redis.backoff.ExponentialBackoff(), 3),
+            retry_on_error=[redis.ConnectionError, redis.TimeoutError],
+        )
+
     def _init_redis(self):
         try:
             self.redis_client = redis.Redis(
-                host=self.redis_host,
-                port=self.redis_port,
-                db=self.redis_db,
-                password=self.redis_password,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5,
+                connection_pool=self._build_redis_pool(decode_responses=True)
             )
             self.redis_client.ping()
+            self.redis_binary_client = redis.Redis(
+                connection_pool=self._build_redis_pool(decode_responses=False)
+            )
+            # redis-py runs this with EVALSHA, loading it on first NOSCRIPT
+            self._save_cache_script = self.redis_binary_client.register_script(
+                _SAVE_CACHE_SCRIPT
+            )
             logger.info(
                 f"Redis connected successfully to {self.redis_host}:{self.redis_port}"
             )
@@ -73,21 +310,135 @@ class DataManager:
                 f"Redis connection failed: {e}. Falling back to file-based caching."
             )
             self.redis_client = None
+            self.redis_binary_client = None
+            self._save_cache_script = None
+
+    @property
+    def _payload_client(self):
+        """Redis client for cache payloads; binary-safe when available."""
+        return self.redis_binary_client or self.redis_client
 
+    # The cache name is a {hash tag}, so an entry's payload and metadata keys
+    # share a Redis Cluster slot and the multi-key script and reads stay valid
     def _get_cache_key(self, cache_name: str, key: Optional[str] = None) -> str:
         if key is None or str(key).strip() == "":
-            return f"safetyamp:{cache_name}"
-        return f"safetyamp:{cache_name}:{key}"
+            return f"safetyamp:{{{cache_name}}}"
+        return f"safetyamp:{{{cache_name}}}:{key}"
 
     def _get_metadata_key(self, cache_name: str, key: Optional[str] = None) -> str:
         if key is None or str(key).strip() == "":
-            return f"safetyamp:{cache_name}:metadata"
-        return f"safetyamp:{cache_name}:{key}:metadata"
+            return f"safetyamp:{{{cache_name}}}:metadata"
+        return f"safetyamp:{{{cache_name}}}:{key}:metadata"
+
+    @staticmethod
+    def _cache_name_from_key(cache_key: str) -> str:
+        """Display name of a data key: its cache name and key, without the tag."""
+        return cache_key.replace("safetyamp:", "", 1).replace("{", "").replace("}", "")
+
+    # Cache metadata is a Redis hash with one JSON-encoded value per field, so
+    # single fields are read with HGET instead of parsing the whole record.
+    def _get_metadata_field(
+        self, cache_name: str, field: str, key: Optional[str] = None
+    ) -> Optional[Any]:
+        raw = self.redis_client.hget(self._get_metadata_key(cache_name, key), field)
+        return _loads(raw) if raw is not None else None
+
+    def _local_get(
+        self,
+        cache_name: str,
+        key: Optional[str],
+        max_age_seconds: Optional[float] = None,
+    ) -> Optional[Any]:
+        """Decode a locally kept payload, or None if absent or too old.
+
+        Entries hold the stored payload rather than decoded data, so every
+        caller gets its own copy. With max_age_seconds, only entries whose
+        last_updated is known and within that age are served.
+        """
+        if self._local_cache_ttl <= 0:
+            return None
+        local_key = (cache_name, key)
+        with self._local_cache_lock:
+            entry = self._local_cache.get(local_key)
+            if entry is None:
+                return None
+            inserted_at, payload, last_updated = entry
+            if time.monotonic() - inserted_at >= self._local_cache_ttl:
+                del self._local_cache[local_key]
+                return None
+            if max_age_seconds is not None and (
+                last_updated is None or time.time() - last_updated > max_age_seconds
+            ):
+                return None
+            self._local_cache.move_to_end(local_key)
+        return _decode_cache_payload(payload)
+
+    def _local_put(
+        self,
+        cache_name: str,
+        key: Optional[str],
+        payload: bytes,
+        last_updated: Optional[float] = None,
+    ) -> None:
+        if self._local_cache_ttl <= 0:
+            return
+        local_key = (cache_name, key)
+        with self._local_cache_lock:
+            self._local_cache[local_key] = (time.monotonic(), payload, last_updated)
+            self._local_cache.move_to_end(local_key)
+            while len(self._local_cache) > self.LOCAL_CACHE_MAX_ENTRIES:
+                self._local_cache.popitem(last=False)
+
+    def _local_discard(self, cache_name: str, key: Optional[str] = None) -> None:
+        """Drop local entries for one key, or for every key when key is None."""
+        with self._local_cache_lock:
+            if key is not None:
+                self._local_cache.pop((cache_name, key), None)
+                return
+            for local_key in [k for k in self._local_cache if k[0] == cache_name]:
+                del self._local_cache[local_key]
+
+    def _iter_keys(self, pattern: str):
+        """Iterate keys matching pattern with a non-blocking SCAN cursor."""
+        return self.redis_client.scan_iter(match=pattern, count=self.SCAN_COUNT)
+
+    def _describe_keys(self, keys: List[str]) -> List[Tuple[str, int, str, int]]:
+        """Return (key, ttl, key_type, size) for keys using pipelined lookups."""
+        described = []
+        for i in range(0, len(keys), self.PIPELINE_BATCH_SIZE):
+            batch = keys[i : i + self.PIPELINE_BATCH_SIZE]
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key in batch:
+                pipe.ttl(key)
+                pipe.type(key)
+            results = pipe.execute()
+            ttls, key_types = results[0::2], results[1::2]
+
+            # Size calculation depends on the key type
+            pipe = self.redis_client.pipeline(transaction=False)
+            size_commands = {
+                "string": pipe.strlen,
+                "list": pipe.llen,
+                "set": pipe.scard,
+                "hash": pipe.hlen,
+                "zset": pipe.zcard,
+            }
+            has_size = []
+            for key, key_type in zip(batch, key_types):
+                command = size_commands.get(key_type)
+                if command is not None:
+                    command(key)
+                has_size.append(command is not None)
+            sizes = iter(pipe.execute())
+
+            for key, ttl, key_type, sized in zip(batch, ttls, key_types, has_size):
+                described.append((key, ttl, key_type, next(sizes) if sized else 0))
+        return described
 
     def get_cache_info(self) -> Dict[str, Any]:
         if self.redis_client:
             try:
-                keys = self.redis_client.keys("safetyamp:*")
+                keys = list(self._iter_keys("safetyamp:*"))
                 cache_info: Dict[str, Any] = {
                     "type": "redis",
                     "host": self.redis_host,
@@ -96,38 +447,25 @@ class DataManager:
                     "total_keys": len(keys),
                     "caches": {},
                 }
-                for key in keys:
-                    if not key.endswith(":metadata"):
-                        cache_name = key.replace("safetyamp:", "")
-                        ttl = self.redis_client.ttl(key)
-                        # Check key type to use appropriate size calculation
-                        key_type = self.redis_client.type(key)
-                        if key_type == "string":
-                            size = len(self.redis_client.get(key) or "")
-                        elif key_type == "list":
-                            size = self.redis_client.llen(key)
-                        elif key_type == "set":
-                            size = self.redis_client.scard(key)
-                        elif key_type == "hash":
-                            size = self.redis_client.hlen(key)
-                        else:
-                            size = 0
-                        cache_info["caches"][cache_name] = {
-                            "ttl_seconds": ttl,
-                            "size_bytes": size,
-                            "key_type": key_type,
-                            "expires_in": (
-                                f"{ttl//3600}h {(ttl%3600)//60}m"
-                                if ttl and ttl > 0
-                                else "expired"
-                            ),
-                        }
-                        try:
-                            _cache_items_total.labels(cache=cache_name).set(size)
-                            if ttl is not None and ttl >= 0:
-                                _cache_ttl_seconds.labels(cache=cache_name).set(ttl)
-                        except Exception:
-                            pass
+                data_keys = [k for k in keys if not k.endswith(":metadata")]
+                for key, ttl, key_type, size in self._describe_keys(data_keys):
+                    cache_name = self._cache_name_from_key(key)
+                    cache_info["caches"][cache_name] = {
+                        "ttl_seconds": ttl,
+                        "size_bytes": size,
+                        "key_type": key_type,
+                        "expires_in": (
+                            f"{ttl//3600}h {(ttl%3600)//60}m"
+                            if ttl and ttl > 0
+                            else "expired"
+                        ),
+                    }
+                    try:
+                        _cache_items_total.labels(cache=cache_name).set(size)
+                        if ttl is not None and ttl >= 0:
+                            _cache_ttl_seconds.labels(cache=cache_name).set(ttl)
+                    except Exception:
+                        pass
                 return cache_info
             except Exception as e:
                 logger.error(f"Error getting Redis cache info: {e}")
@@ -146,12 +484,17 @@ class DataManager:
         self, cache_name: str, key: Optional[str] = None
     ) -> Optional[Any]:
         if self.redis_client:
+            local = self._local_get(cache_name, key)
+            if local is not None:
+                return local
             try:
                 cache_key = self._get_cache_key(cache_name, key)
-                cached_data = self.redis_client.get(cache_key)
+                cached_data = self._payload_client.get(cache_key)
                 if cached_data:
                     logger.info(f"Using cached data for {cache_name} from Redis")
-                    return json.loads(cached_data)
+                    data = _decode_cache_payload(cached_data)
+                    self._local_put(cache_name, key, cached_data)
+                    return data
             except Exception as e:
                 logger.warning(f"Redis get failed for {cache_name}: {e}")
 
@@ -159,14 +502,51 @@ class DataManager:
         cache_file = self.cache_dir / f"{cache_name}{safe_key}.json"
         if cache_file.exists():
             try:
-                with open(cache_file, "r") as f:
-                    data = json.load(f)
+                with open(cache_file, "rb") as f:
+                    data = _loads(f.read())
                 logger.info(f"Using cached data for {cache_name} from file")
                 return data
             except Exception as e:
                 logger.error(f"Error reading cache file {cache_file}: {e}")
         return None
 
+    def _get_fresh_cached_data(
+        self, cache_name: str, max_age_seconds: float, key: Optional[str] = None
+    ) -> Optional[Any]:
+        """Return cached data no older than max_age_seconds, or None.
+
+        The last_updated field and the payload are read in one pipelined
+        round trip, and the payload is only decoded when the entry is fresh.
+        Entries missing either half in Redis go through get_cached_data and
+        _is_cache_fresh.
+        """
+        if self.redis_client:
+            local = self._local_get(cache_name, key, max_age_seconds)
+            if local is not None:
+                return local
+            try:
+                pipe = self._payload_client.pipeline(transaction=False)
+                pipe.hget(self._get_metadata_key(cache_name, key), "last_updated")
+                pipe.get(self._get_cache_key(cache_name, key))
+                last_updated, payload = pipe.execute()
+                if last_updated and payload:
+                    updated_at = _loads(last_updated)
+                    if time.time() - updated_at > max_age_seconds:
+                        return None
+                    logger.info(f"Using cached data for {cache_name} from Redis")
+                    data = _decode_cache_payload(payload)
+                    self._local_put(cache_name, key, payload, updated_at)
+                    return data
+            except Exception as e:
+                logger.warning(f"Redis get failed for {cache_name}: {e}")
+
+        cached = self.get_cached_data(cache_name, key)
+        if cached is not None and self._is_cache_fresh(
+            cache_name, max_age_seconds, key
+        ):
+            return cached
+        return None
+
     def get_cached_data_with_fallback(
         self,
         cache_name: str,
@@ -175,18 +555,19 @@ class DataManager:
         force_refresh: bool = False,
     ) -> Optional[Any]:
         if not force_refresh:
-            cached_data = self.get_cached_data(cache_name)
+            with _cache_read_latency_seconds.labels(cache=cache_name).time():
+                cached_data = self._get_fresh_cached_data(
+                    cache_name, max_age_hours * 3600
+                )
             if cached_data is not None:
-                if self.is_cache_valid(cache_name, max_age_hours):
-                    logger.info(f"Using valid cached data for {cache_name}")
-                    return cached_data
-                else:
-                    logger.info(
-                        f"Cache for {cache_name} is expired, fetching fresh data"
-                    )
+                _cache_hits_total.labels(cache=cache_name).inc()
+                logger.info(f"Using valid cached data for {cache_name}")
+                return cached_data
+            _cache_misses_total.labels(cache=cache_name).inc()
 
         try:
             logger.info(f"Fetching fresh data for {cache_name}")
+            _cache_refresh_total.labels(cache=cache_name).inc()
             fresh_data = fetch_func()
             if fresh_data is not None:
                 self.save_cache(cache_name, fresh_data)
@@ -201,26 +582,85 @@ class DataManager:
             logger.error(f"Error fetching fresh data for {cache_name}: {e}")
             return self.get_cached_data(cache_name)
 
+    def get_many_cached_with_fallback(
+        self, requests: List[Tuple[str, Callable[[], Any], int]]
+    ) -> Dict[str, Any]:
+        """Batch get_cached_data_with_fallback over (name, fetch_func, max_age_hours).
+
+        Names fresh in the in-process cache are served from it; metadata and
+        payloads for the rest are read in one pipelined round trip. Stale
+        entries are refetched without reading Redis again; entries missing
+        from Redis take the single-name path and its file fallback.
+        """
+        results: Dict[str, Any] = {}
+        if self.redis_client:
+            remote = []
+            for request in requests:
+                local = self._local_get(request[0], None, request[2] * 3600)
+                if local is None:
+                    remote.append(request)
+                else:
+                    results[request[0]] = local
+                    _cache_hits_total.labels(cache=request[0]).inc()
+            requests = remote
+        # (name, fetch_func, max_age_hours, known_stale)
+        pending = [(*request, False) for request in requests]
+        if self.redis_client and requests:
+            try:
+                pipe = self._payload_client.pipeline(transaction=False)
+                for name, _, _ in requests:
+                    pipe.hget(self._get_metadata_key(name), "last_updated")
+                    pipe.get(self._get_cache_key(name))
+                replies = pipe.execute()
+                now = time.time()
+                fresh: Dict[str, Any] = {}
+                pending = []
+                for i, (name, fetch_func, max_age_hours) in enumerate(requests):
+                    last_updated, payload = replies[2 * i], replies[2 * i + 1]
+                    if not (last_updated and payload):
+                        pending.append((name, fetch_func, max_age_hours, False))
+                        continue
+                    updated_at = _loads(last_updated)
+                    if now - updated_at > max_age_hours * 3600:
+                        _cache_misses_total.labels(cache=name).inc()
+                        pending.append((name, fetch_func, max_age_hours, True))
+                    else:
+                        fresh[name] = _decode_cache_payload(payload)
+                        self._local_put(name, None, payload, updated_at)
+                        _cache_hits_total.labels(cache=name).inc()
+                results.update(fresh)
+                if fresh:
+                    logger.info(f"Using cached data from Redis for {', '.join(fresh)}")
+            except Exception as e:
+                logger.warning(f"Redis batch get failed: {e}")
+                pending = [(*request, False) for request in requests]
+        for name, fetch_func, max_age_hours, stale in pending:
+            results[name] = self.get_cached_data_with_fallback(
+                name, fetch_func, max_age_hours, force_refresh=stale
+            )
+        return results
+
     def is_cache_valid(
         self, cache_name: str, max_age_hours: int = 1, key: Optional[str] = None
+    ) -> bool:
+        return self._is_cache_fresh(cache_name, max_age_hours * 3600, key)
+
+    def _is_cache_fresh(
+        self, cache_name: str, max_age_seconds: float, key: Optional[str] = None
     ) -> bool:
         try:
             if self.redis_client:
-                metadata_key = self._get_metadata_key(cache_name, key)
-                metadata_json = self.redis_client.get(metadata_key)
-                if metadata_json:
-                    metadata = json.loads(metadata_json)
-                    cache_age_hours = (
-                        time.time() - metadata.get("last_updated", 0)
-                    ) / 3600
-                    return cache_age_hours <= max_age_hours
+                last_updated = self._get_metadata_field(
+                    cache_name, "last_updated", key
+                )
+                if last_updated is not None:
+                    return time.time() - last_updated <= max_age_seconds
             safe_key = f"_{key}" if key else ""
             metadata_file = self.cache_dir / f"{cache_name}{safe_key}_metadata.json"
             if metadata_file.exists():
                 with open(metadata_file, "r") as f:
                     metadata = json.load(f)
-                cache_age_hours = (time.time() - metadata.get("last_updated", 0)) / 3600
-                return cache_age_hours <= max_age_hours
+                return time.time() - metadata.get("last_updated", 0) <= max_age_seconds
         except Exception as e:
             logger.warning(f"Error checking cache validity for {cache_name}: {e}")
         return False
@@ -235,30 +675,41 @@ class DataManager:
     ) -> bool:
         success = True
         now_ts = time.time()
+        # The file cache always stores JSON; encode it once and reuse the
+        # bytes for a JSON Redis payload too
+        json_payload: Optional[bytes] = None
+        effective_ttl_seconds = (
+            int(ttl_seconds) if ttl_seconds is not None else self.cache_ttl_seconds
+        )
 
         if self.redis_client:
             try:
                 cache_key = self._get_cache_key(cache_name, key)
                 metadata_key = self._get_metadata_key(cache_name, key)
-                effective_ttl_seconds = (
-                    int(ttl_seconds)
-                    if ttl_seconds is not None
-                    else int(self.cache_ttl_hours * 3600)
-                )
-                self.redis_client.setex(
-                    cache_key, effective_ttl_seconds, json.dumps(data)
-                )
                 if metadata is None:
                     metadata = {"created": now_ts, "items": len(data), "source": "api"}
                 metadata["last_updated"] = now_ts
-                metadata["ttl_seconds"] = (
-                    int(ttl_seconds)
-                    if ttl_seconds is not None
-                    else int(self.cache_ttl_hours * 3600)
+                metadata["ttl_seconds"] = effective_ttl_seconds
+                json_payload = _dumps(data)
+                payload = _encode_cache_payload(
+                    data,
+                    self.cache_serializer,
+                    self.cache_compress_min_bytes,
+                    json_bytes=json_payload,
                 )
-                self.redis_client.setex(
-                    metadata_key, effective_ttl_seconds, json.dumps(metadata)
+                metadata["data_hash"] = _payload_digest(payload)
+                fields = _metadata_fields(metadata)
+                outcome = self._save_cache_script(
+                    keys=[cache_key, metadata_key],
+                    args=[
+                        fields["data_hash"],
+                        effective_ttl_seconds,
+                        payload,
+                        *(item for pair in fields.items() for item in pair),
+                    ],
                 )
+                logger.debug(f"Cache write for {cache_name}: {outcome!r}")
+                self._local_put(cache_name, key, payload, now_ts)
                 logger.info(f"Saved {len(data)} items to Redis cache: {cache_name}")
             except Exception as e:
                 logger.error(f"Redis save failed for {cache_name}: {e}")
@@ -268,16 +719,12 @@ class DataManager:
             safe_key = f"_{key}" if key else ""
             cache_file = self.cache_dir / f"{cache_name}{safe_key}.json"
             metadata_file = self.cache_dir / f"{cache_name}{safe_key}_metadata.json"
-            with open(cache_file, "w") as f:
-                json.dump(data, f, indent=2)
+            with open(cache_file, "wb") as f:
+                f.write(json_payload if json_payload is not None else _dumps(data))
             if metadata is None:
                 metadata = {"created": now_ts, "items": len(data), "source": "api"}
             metadata["last_updated"] = now_ts
-            metadata["ttl_seconds"] = (
-                int(ttl_seconds)
-                if ttl_seconds is not None
-                else int(self.cache_ttl_hours * 3600)
-            )
+            metadata["ttl_seconds"] = effective_ttl_seconds
             with open(metadata_file, "w") as f:
                 json.dump(metadata, f, indent=2)
             logger.info(f"Saved {len(data)} items to file cache: {cache_name}")
@@ -289,11 +736,7 @@ class DataManager:
             size = len(data) if hasattr(data, "__len__") else 1
             _cache_items_total.labels(cache=cache_name).set(size)
             _cache_last_updated_ts.labels(cache=cache_name).set(now_ts)
-            _cache_ttl_seconds.labels(cache=cache_name).set(
-                int(ttl_seconds)
-                if ttl_seconds is not None
-                else int(self.cache_ttl_hours * 3600)
-            )
+            _cache_ttl_seconds.labels(cache=cache_name).set(effective_ttl_seconds)
         except Exception:
             pass
         return success
@@ -322,18 +765,27 @@ class DataManager:
 
     def invalidate_cache(self, cache_name: str, key: Optional[str] = None) -> bool:
         success = True
+        self._local_discard(cache_name, key)
         if self.redis_client:
             try:
                 if key is None:
-                    # pattern delete for all keys under this cache_name
-                    for k in self.redis_client.scan_iter(
-                        match=f"safetyamp:{cache_name}*"
-                    ):
-                        self.redis_client.delete(k)
+                    # pattern delete for all keys under this cache_name,
+                    # pipelined in chunks rather than one command per key.
+                    # UNLINK frees large payloads off the server's main thread.
+                    pipe = self.redis_client.pipeline(transaction=False)
+                    pending = 0
+                    for k in self._iter_keys(f"safetyamp:{{{cache_name}}}*"):
+                        pipe.unlink(k)
+                        pending += 1
+                        if pending >= self.PIPELINE_BATCH_SIZE:
+                            pipe.execute()
+                            pending = 0
+                    if pending:
+                        pipe.execute()
                 else:
                     cache_key = self._get_cache_key(cache_name, key)
                     metadata_key = self._get_metadata_key(cache_name, key)
-                    self.redis_client.delete(cache_key, metadata_key)
+                    self.redis_client.unlink(cache_key, metadata_key)
                 logger.info(f"Invalidated Redis cache: {cache_name}")
             except Exception as e:
                 logger.error(f"Redis invalidation failed for {cache_name}: {e}")
@@ -364,31 +816,20 @@ class DataManager:
         }
         if self.redis_client:
             try:
-                keys = self.redis_client.keys("safetyamp:*")
-                for key in keys:
-                    if not key.endswith(":metadata"):
-                        cache_name = key.replace("safetyamp:", "")
-                        ttl = self.redis_client.ttl(key)
-                        # Check key type to use appropriate size calculation
-                        key_type = self.redis_client.type(key)
-                        if key_type == "string":
-                            data = self.redis_client.get(key)
-                            size = len(data) if data else 0
-                        elif key_type == "list":
-                            size = self.redis_client.llen(key)
-                        elif key_type == "set":
-                            size = self.redis_client.scard(key)
-                        elif key_type == "hash":
-                            size = self.redis_client.hlen(key)
-                        else:
-                            size = 0
-                        stats["caches"][cache_name] = {
-                            "type": "redis",
-                            "key_type": key_type,
-                            "ttl_seconds": ttl,
-                            "size_bytes": size,
-                            "valid": ttl > 0,
-                        }
+                data_keys = [
+                    k
+                    for k in self._iter_keys("safetyamp:*")
+                    if not k.endswith(":metadata")
+                ]
+                for key, ttl, key_type, size in self._describe_keys(data_keys):
+                    cache_name = self._cache_name_from_key(key)
+                    stats["caches"][cache_name] = {
+                        "type": "redis",
+                        "key_type": key_type,
+                        "ttl_seconds": ttl,
+                        "size_bytes": size,
+                        "valid": ttl > 0,
+                    }
             except Exception as e:
                 logger.error(f"Error getting Redis stats: {e}")
         cache_files = list(self.cache_dir.glob("*.json"))
@@ -397,7 +838,7 @@ class DataManager:
                 cache_name = cache_file.stem
                 if cache_name not in stats["caches"]:
                     file_age = time.time() - cache_file.stat().st_mtime
-                    max_age = self.cache_ttl_hours * 3600
+                    max_age = self.cache_ttl_seconds
                     stats["caches"][cache_name] = {
                         "type": "file",
                         "size_bytes": cache_file.stat().st_size,
@@ -409,16 +850,11 @@ class DataManager:
     def should_refresh_cache(self, cache_name: str, key: Optional[str] = None) -> bool:
         if self.redis_client:
             try:
-                metadata_key = self._get_metadata_key(cache_name, key)
-                metadata_json = self.redis_client.get(metadata_key)
-                if metadata_json:
-                    metadata = json.loads(metadata_json)
-                    last_refresh = metadata.get("last_refresh", 0)
-                    current_time = time.time()
-                    refresh_interval_seconds = self.cache_refresh_interval_hours * 3600
-                    return (current_time - last_refresh) >= refresh_interval_seconds
-                else:
+                last_refresh = self._get_metadata_field(cache_name, "last_refresh", key)
+                if last_refresh is None:
                     return True
+                elapsed = time.time() - last_refresh
+                return elapsed >= self.cache_refresh_interval_seconds
             except Exception as e:
                 logger.warning(
                     f"Error checking cache refresh time for {cache_name}: {e}"
@@ -433,8 +869,7 @@ class DataManager:
                 metadata = json.load(f)
             last_refresh = metadata.get("last_refresh", 0)
             current_time = time.time()
-            refresh_interval_seconds = self.cache_refresh_interval_hours * 3600
-            return (current_time - last_refresh) >= refresh_interval_seconds
+            return (current_time - last_refresh) >= self.cache_refresh_interval_seconds
         except Exception as e:
             logger.warning(
                 f"Error checking file cache refresh time for {cache_name}: {e}"
@@ -449,8 +884,13 @@ class DataManager:
             }
             if self.redis_client:
                 metadata_key = self._get_metadata_key(cache_name, key)
-                ttl_seconds = int(self.cache_ttl_hours * 3600)
-                self.redis_client.setex(metadata_key, ttl_seconds, json.dumps(metadata))
+                pipe = self.redis_client.pipeline(transaction=True)
+                pipe.hset(metadata_key, mapping=_metadata_fields(metadata))
+                # Only ever lengthen the TTL: NX covers a freshly created hash,
+                # GT skips the write when save_cache already set a longer one
+                pipe.expire(metadata_key, self.cache_ttl_seconds, nx=True)
+                pipe.expire(metadata_key, self.cache_ttl_seconds, gt=True)
+                pipe.execute()
             safe_key = f"_{key}" if key else ""
             metadata_file = self.cache_dir / f"{cache_name}{safe_key}_metadata.json"
             with open(metadata_file, "w") as f:
@@ -475,11 +915,10 @@ class DataManager:
         lock: bool = True,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> Any:
-        # Try cache first
-        cached = self.get_cached_data(name, key)
-        if cached is not None and self.is_cache_valid(
-            name, max_age_hours=max(1, ttl_seconds // 3600), key=key
-        ):
+        # Try cache first; entries are fresh for exactly ttl_seconds, not a
+        # whole-hour approximation of it
+        cached = self._get_fresh_cached_data(name, ttl_seconds, key=key)
+        if cached is not None:
             return cached
 
         if not lock or self.redis_client is None:
@@ -720,6 +1159,31 @@ class DataManager:
         logger.info("Job data refresh requested")
 
     # ===== Failed Sync Tracking =====
+    def _queue_failed_sync_record(
+        self,
+        pipe,
+        entity_type: str,
+        entity_id: str,
+        metadata: Dict[str, Any],
+        ttl_seconds: int,
+        now: float,
+    ) -> None:
+        """Queue the record write and its index updates on a pipeline."""
+        expires_at = now + ttl_seconds
+        pipe.setex(
+            f"safetyamp:failed_sync:{entity_type}:{entity_id}",
+            ttl_seconds,
+            _dumps(metadata),
+        )
+        pipe.zadd(
+            self.FAILED_SYNC_INDEX_KEY, {f"{entity_type}:{entity_id}": expires_at}
+        )
+        pipe.zadd(
+            f"{self.FAILED_SYNC_INDEX_KEY}:{entity_type}",
+            {str(entity_id): expires_at},
+        )
+        pipe.hset(self.FAILED_SYNC_ENTITY_TYPE_KEY, str(entity_id), entity_type)
+
     def save_failed_sync_record(
         self,
         entity_type: str,
@@ -743,11 +1207,14 @@ class DataManager:
             logger.warning("Redis not available, cannot save failed sync record")
             return False
 
-        key = f"safetyamp:failed_sync:{entity_type}:{entity_id}"
         ttl_seconds = ttl_days * 24 * 60 * 60
 
         try:
-            self.redis_client.setex(key, ttl_seconds, json.dumps(metadata))
+            pipe = self.redis_client.pipeline(transaction=False)
+            self._queue_failed_sync_record(
+                pipe, entity_type, entity_id, metadata, ttl_seconds, time.time()
+            )
+            pipe.execute()
             logger.debug(f"Saved failed sync record: {entity_type}/{entity_id}")
             return True
         except Exception as e:
@@ -756,6 +1223,44 @@ class DataManager:
             )
             return False
 
+    def save_failed_sync_records_bulk(
+        self,
+        records: List[Tuple[str, str, Dict[str, Any]]],
+        ttl_days: int = 7,
+    ) -> int:
+        """
+        Save many failed sync records in a single MULTI/EXEC round trip.
+
+        Args:
+            records: List of (entity_type, entity_id, metadata) tuples
+            ttl_days: Time to live in days (default: 7)
+
+        Returns:
+            Number of records saved (0 if Redis is unavailable or the
+            transaction failed)
+        """
+        if not records:
+            return 0
+        if not self.redis_client:
+            logger.warning("Redis not available, cannot save failed sync records")
+            return 0
+
+        ttl_seconds = ttl_days * 24 * 60 * 60
+        now = time.time()
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=True)
+            for entity_type, entity_id, metadata in records:
+                self._queue_failed_sync_record(
+                    pipe, entity_type, entity_id, metadata, ttl_seconds, now
+                )
+            pipe.execute()
+            logger.debug(f"Saved {len(records)} failed sync records")
+            return len(records)
+        except Exception as e:
+            logger.error(f"Failed to save {len(records)} failure records: {e}")
+            return 0
+
     def get_failed_sync_record(
         self, entity_type: str, entity_id: str
     ) -> Optional[Dict[str, Any]]:
@@ -777,7 +1282,7 @@ class DataManager:
         try:
             data = self.redis_client.get(key)
             if data:
-                return json.loads(data)
+                return _loads(data)
             return None
         except Exception as e:
             logger.error(
@@ -785,6 +1290,49 @@ class DataManager:
             )
             return None
 
+    def mget_failed_sync_records(
+        self, entity_type: str, entity_ids: List[str]
+    ) -> Optional[Dict[str, Optional[Dict[str, Any]]]]:
+        """
+        Retrieve failed sync metadata for many entities with batched MGET.
+
+        Args:
+            entity_type: Type of entity (e.g., "employee", "vehicle")
+            entity_ids: Identifiers of the entities to look up
+
+        Returns:
+            Dict mapping each entity_id to its failure metadata (None if not
+            found), or None if Redis is unavailable or the read failed
+        """
+        if not self.redis_client:
+            return None
+
+        ids = [str(entity_id) for entity_id in entity_ids]
+        keys = [f"safetyamp:failed_sync:{entity_type}:{entity_id}" for entity_id in ids]
+
+        try:
+            values: List[Optional[str]] = []
+            for i in range(0, len(keys), self.MGET_BATCH_SIZE):
+                values.extend(
+                    self.redis_client.mget(keys[i : i + self.MGET_BATCH_SIZE])
+                )
+        except Exception as e:
+            logger.error(f"Failed to get failure records for {entity_type}: {e}")
+            return None
+
+        records: Dict[str, Optional[Dict[str, Any]]] = {}
+        for entity_id, data in zip(ids, values):
+            record = None
+            if data:
+                try:
+                    record = _loads(data)
+                except Exception as e:
+                    logger.warning(
+                        f"Error parsing failed sync record {entity_type}/{entity_id}: {e}"
+                    )
+            records[entity_id] = record
+        return records
+
     def delete_failed_sync_record(self, entity_type: str, entity_id: str) -> bool:
         """
         Delete a failed sync record from Redis.
@@ -802,7 +1350,13 @@ class DataManager:
         key = f"safetyamp:failed_sync:{entity_type}:{entity_id}"
 
         try:
-            self.redis_client.delete(key)
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.delete(key)
+            pipe.zrem(self.FAILED_SYNC_INDEX_KEY, f"{entity_type}:{entity_id}")
+            pipe.zrem(f"{self.FAILED_SYNC_INDEX_KEY}:{entity_type}", str(entity_id))
+            pipe.execute()
+            # The lookup entry may point at a live record of another type
+            self._prune_entity_type_lookup([str(entity_id)], time.time(), entity_type)
             logger.debug(f"Deleted failed sync record: {entity_type}/{entity_id}")
             return True
         except Exception as e:
@@ -811,6 +1365,241 @@ class DataManager:
             )
             return False
 
+    def get_failed_sync_entity_type(self, entity_id: str) -> Optional[str]:
+        """
+        Look up the entity type of a failed sync record by entity id alone.
+
+        The lookup entry is only trusted while the record is still in its
+        per-type index, since entries outlive records that expire by TTL.
+
+        Args:
+            entity_id: Unique identifier for the entity
+
+        Returns:
+            Entity type of the most recently saved failure for this id, or
+            None if unknown, expired, or Redis is unavailable
+        """
+        if not self.redis_client:
+            return None
+
+        try:
+            entity_type = self.redis_client.hget(
+                self.FAILED_SYNC_ENTITY_TYPE_KEY, str(entity_id)
+            )
+            if not entity_type:
+                return None
+            expires_at = self.redis_client.zscore(
+                f"{self.FAILED_SYNC_INDEX_KEY}:{entity_type}", str(entity_id)
+            )
+            if expires_at is None or expires_at <= time.time():
+                return None
+            return entity_type
+        except Exception as e:
+            logger.error(f"Failed to look up entity type for {entity_id}: {e}")
+            return None
+
+    def get_failed_sync_keys(self) -> Optional[List[Tuple[str, str]]]:
+        """
+        List (entity_type, entity_id) pairs for all failed sync records.
+
+        Only key names are scanned; record values are not fetched.
+
+        Returns:
+            List of (entity_type, entity_id) tuples, or None if Redis is
+            unavailable or the scan failed
+        """
+        if not self.redis_client:
+            return None
+
+        try:
+            pairs = []
+            for key in self.redis_client.scan_iter(
+                match="safetyamp:failed_sync:*", count=1000
+            ):
+                parts = key.split(":", 3)
+                if len(parts) == 4:
+                    pairs.append((parts[2], parts[3]))
+            return pairs
+        except Exception as e:
+            logger.error(f"Failed to scan failed sync keys: {e}")
+            return None
+
+    def _failed_sync_index_key(self, entity_type: Optional[str]) -> str:
+        if entity_type:
+            return f"{self.FAILED_SYNC_INDEX_KEY}:{entity_type}"
+        return self.FAILED_SYNC_INDEX_KEY
+
+    def _prune_entity_type_lookup(
+        self, members: List[str], now: float, entity_type: Optional[str] = None
+    ) -> None:
+        """Drop lookup entries whose record is no longer in its per-type index.
+
+        ``members`` are index members: entity ids for a per-type index, or
+        "entity_type:entity_id" for the global one. Entries pointing at a
+        live record of another entity type are kept.
+        """
+        if entity_type:
+            ids = list(dict.fromkeys(members))
+        else:
+            ids = list(dict.fromkeys(m.split(":", 1)[-1] for m in members))
+        if not ids:
+            return
+        try:
+            types = self.redis_client.hmget(self.FAILED_SYNC_ENTITY_TYPE_KEY, ids)
+            candidates = [(i, t) for i, t in zip(ids, types) if t]
+            if not candidates:
+                return
+            pipe = self.redis_client.pipeline(transaction=False)
+            for entity_id, lookup_type in candidates:
+                pipe.zscore(f"{self.FAILED_SYNC_INDEX_KEY}:{lookup_type}", entity_id)
+            scores = pipe.execute()
+            stale = [
+                entity_id
+                for (entity_id, _), score in zip(candidates, scores)
+                if score is None or score <= now
+            ]
+            if stale:
+                self.redis_client.hdel(self.FAILED_SYNC_ENTITY_TYPE_KEY, *stale)
+        except Exception as e:
+            logger.warning(f"Failed to prune failed sync entity type lookup: {e}")
+
+    def count_failed_sync_records(
+        self, entity_type: Optional[str] = None
+    ) -> Optional[int]:
+        """
+        Count failed sync records using the expiry-scored index.
+
+        Index entries whose record TTL has passed are pruned first, along
+        with their entity type lookup entries, so the count matches the
+        records still present in Redis.
+
+        Args:
+            entity_type: Optional filter by entity type
+
+        Returns:
+            Number of failed records, or None if Redis is unavailable or the
+            index could not be read
+        """
+        if not self.redis_client:
+            return None
+
+        index_key = self._failed_sync_index_key(entity_type)
+
+        try:
+            now = time.time()
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.zrangebyscore(index_key, "-inf", now)
+            pipe.zremrangebyscore(index_key, "-inf", now)
+            pipe.zcard(index_key)
+            expired, _, count = pipe.execute()
+            self._prune_entity_type_lookup(expired, now, entity_type)
+            return int(count)
+        except Exception as e:
+            logger.error(f"Failed to count failure records: {e}")
+            return None
+
+    def get_failed_sync_records_page(
+        self, entity_type: Optional[str] = None, offset: int = 0, limit: int = 50
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get a page of failed sync records, most recently saved first.
+
+        Uses ZREVRANGE on the expiry-scored index followed by a single MGET,
+        so only the requested page is read from Redis.
+
+        Args:
+            entity_type: Optional filter by entity type
+            offset: Pagination offset
+            limit: Maximum records to return
+
+        Returns:
+            List of failure metadata dictionaries, or None if Redis is
+            unavailable or the index could not be read
+        """
+        if not self.redis_client:
+            return None
+
+        index_key = self._failed_sync_index_key(entity_type)
+
+        try:
+            now = time.time()
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.zrangebyscore(index_key, "-inf", now)
+            pipe.zremrangebyscore(index_key, "-inf", now)
+            pipe.zrevrange(index_key, offset, offset + limit - 1)
+            expired, _, members = pipe.execute()
+            self._prune_entity_type_lookup(expired, now, entity_type)
+            if not members:
+                return []
+
+            prefix = (
+                f"safetyamp:failed_sync:{entity_type}:"
+                if entity_type
+                else "safetyamp:failed_sync:"
+            )
+            values = self.redis_client.mget([prefix + m for m in members])
+        except Exception as e:
+            logger.error(f"Failed to get failure records page: {e}")
+            return None
+
+        records = []
+        for member, data in zip(members, values):
+            if not data:
+                continue
+            try:
+                records.append(_loads(data))
+            except Exception as e:
+                logger.warning(f"Error parsing failed sync record {member}: {e}")
+        return records
+
+    def rebuild_failed_sync_index(self) -> bool:
+        """
+        Rebuild the failed sync index from the records currently in Redis.
+
+        Needed once for records saved before the index existed; entries are
+        scored by each record's remaining TTL. Also fills the entity id to
+        entity type lookup hash.
+
+        Returns:
+            True if the index was rebuilt, False otherwise
+        """
+        if not self.redis_client:
+            return False
+
+        try:
+            keys = list(
+                self.redis_client.scan_iter(match="safetyamp:failed_sync:*", count=1000)
+            )
+            now = time.time()
+            for i in range(0, len(keys), self.MGET_BATCH_SIZE):
+                batch = keys[i : i + self.MGET_BATCH_SIZE]
+                pipe = self.redis_client.pipeline(transaction=False)
+                for key in batch:
+                    pipe.ttl(key)
+                ttls = pipe.execute()
+
+                pipe = self.redis_client.pipeline(transaction=False)
+                for key, ttl in zip(batch, ttls):
+                    parts = key.split(":", 3)
+                    if len(parts) != 4 or ttl is None or ttl < 0:
+                        continue
+                    expires_at = now + ttl
+                    pipe.zadd(
+                        self.FAILED_SYNC_INDEX_KEY,
+                        {f"{parts[2]}:{parts[3]}": expires_at},
+                    )
+                    pipe.zadd(
+                        f"{self.FAILED_SYNC_INDEX_KEY}:{parts[2]}",
+                        {parts[3]: expires_at},
+                    )
+                    pipe.hset(self.FAILED_SYNC_ENTITY_TYPE_KEY, parts[3], parts[2])
+                pipe.execute()
+            logger.info(f"Rebuilt failed sync index from {len(keys)} records")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to rebuild failed sync index: {e}")
+            return False
+
     def get_all_failed_records(
         self, entity_type: Optional[str] = None, limit: int = 100
     ) -> List[Dict[str, Any]]:
@@ -821,39 +1610,63 @@ class DataManager:
             entity_type: Optional filter by entity type
             limit: Maximum number of records to return
 
+        Returns:
+            List of failure metadata dictionaries
+        """
+        return self.get_all_failed_records_bulk(entity_type=entity_type, limit=limit)
+
+    def get_all_failed_records_bulk(
+        self, entity_type: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get failed sync records using SCAN + batched MGET.
+
+        Values are fetched with one MGET per batch of keys instead of one GET
+        per key, so reading N records costs O(N / batch) round trips.
+
+        Args:
+            entity_type: Optional filter by entity type
+            limit: Maximum number of records to return (None for all)
+
         Returns:
             List of failure metadata dictionaries
         """
         if not self.redis_client:
             return []
 
-        try:
-            # Build pattern for scanning
-            if entity_type:
-                pattern = f"safetyamp:failed_sync:{entity_type}:*"
-            else:
-                pattern = "safetyamp:failed_sync:*"
+        # Build pattern for scanning
+        if entity_type:
+            pattern = f"safetyamp:failed_sync:{entity_type}:*"
+        else:
+            pattern = "safetyamp:failed_sync:*"
 
-            # Scan for matching keys
-            records = []
+        try:
+            keys = []
             for key in self.redis_client.scan_iter(match=pattern, count=100):
-                if len(records) >= limit:
+                if limit is not None and len(keys) >= limit:
                     break
+                keys.append(key)
 
-                try:
-                    data = self.redis_client.get(key)
-                    if data:
-                        record = json.loads(data)
-                        records.append(record)
-                except Exception as e:
-                    logger.warning(f"Error parsing failed sync record {key}: {e}")
-                    continue
-
-            return records
+            values: List[Optional[str]] = []
+            for i in range(0, len(keys), self.MGET_BATCH_SIZE):
+                values.extend(
+                    self.redis_client.mget(keys[i : i + self.MGET_BATCH_SIZE])
+                )
         except Exception as e:
             logger.error(f"Failed to get all failure records: {e}")
             return []
 
+        records = []
+        for key, data in zip(keys, values):
+            # Keys may expire between SCAN and MGET
+            if not data:
+                continue
+            try:
+                records.append(_loads(data))
+            except Exception as e:
+                logger.warning(f"Error parsing failed sync record {key}: {e}")
+        return records
+
     # ===== Sync Pause/Resume =====
     def get_sync_paused(self) -> bool:
         """
@@ -76,6 +76,20 @@ FIELD_PATTERNS = [
     (r"(\w+)\s+is\s+required", 1),  # "email is required"
 ]
 
+
+def _compile_any(patterns: List[str]) -> "re.Pattern[str]":
+    """Combine patterns into one alternation so a message is scanned once."""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+_DUPLICATE_RE = _compile_any(DUPLICATE_PATTERNS)
+_RATE_LIMIT_RE = _compile_any(RATE_LIMIT_PATTERNS)
+_MISSING_FIELD_RE = _compile_any(MISSING_FIELD_PATTERNS)
+_VALIDATION_RE = _compile_any(VALIDATION_PATTERNS)
+_CONNECTIVITY_RE = _compile_any(CONNECTIVITY_PATTERNS)
+# Field patterns keep their priority order, so they are only precompiled
+_FIELD_RES = [(re.compile(pattern), group) for pattern, group in FIELD_PATTERNS]
+
 # Recommended actions by category
 RECOMMENDED_ACTIONS = {
     CATEGORY_DUPLICATE_FIELD: "Update the duplicate field value in Viewpoint/source system or manually resolve the conflict in SafetyAmp",
@@ -86,6 +100,13 @@ RECOMMENDED_ACTIONS = {
     CATEGORY_UNKNOWN: "Investigate the error logs for more details",
 }
 
+# Failed sync tracker failure reasons mapped to error categories
+FAILURE_REASON_CATEGORIES = {
+    "duplicate_fields": CATEGORY_DUPLICATE_FIELD,
+    "missing_required": CATEGORY_MISSING_FIELD,
+    "validation_error": CATEGORY_VALIDATION,
+}
+
 
 class ErrorAnalyzer:
     """
@@ -167,7 +188,11 @@ class ErrorAnalyzer:
 
             for error in errors:
                 try:
-                    timestamp_str = error.get("timestamp", "")
+                    # Coalesced repeats keep their first timestamp; filter on
+                    # the latest occurrence so long-running floods stay in view
+                    timestamp_str = error.get("last_timestamp") or error.get(
+                        "timestamp", ""
+                    )
                     if timestamp_str:
                         timestamp = datetime.fromisoformat(
                             timestamp_str.replace("Z", "+00:00")
@@ -202,11 +227,14 @@ class ErrorAnalyzer:
         """
         Group errors by pattern/category for aggregation.
 
+        Groups keep an occurrence count rather than the errors themselves,
+        since suggestions only report how many there were.
+
         Returns dict with group key -> group data
         """
         groups: Dict[str, Dict[str, Any]] = defaultdict(
             lambda: {
-                "errors": [],
+                "occurrences": 0,
                 "affected_records": set(),
                 "first_seen": None,
                 "last_seen": None,
@@ -215,6 +243,10 @@ class ErrorAnalyzer:
             }
         )
 
+        # Repeated failures usually share a message, so classify each distinct
+        # (message, type) pair once per analysis
+        classified: Dict[Tuple[str, str], Tuple[str, Optional[str]]] = {}
+
         # Process event manager errors
         for error in errors:
             message = error.get("error_message", "")
@@ -222,32 +254,41 @@ class ErrorAnalyzer:
             entity_id = error.get("entity_id", "")
             timestamp_str = error.get("timestamp", "")
 
-            category = self._categorize_error(message, error_type)
-            field = self._extract_field(message)
+            classification = classified.get((message, error_type))
+            if classification is None:
+                classification = (
+                    self._categorize_error(message, error_type),
+                    self._extract_field(message),
+                )
+                classified[(message, error_type)] = classification
+            category, field = classification
 
-            # Create group key based on category and field
-            group_key = f"{category}:{field or 'general'}"
+            # Create group key based on category and field; the group is
+            # looked up once per error rather than once per attribute
+            group = groups[f"{category}:{field or 'general'}"]
 
-            groups[group_key]["errors"].append(error)
-            groups[group_key]["category"] = category
-            groups[group_key]["field"] = field
+            # Repeats coalesced by the notifier carry how many times they occurred
+            group["occurrences"] += error.get("count", 1)
+            group["category"] = category
+            group["field"] = field
 
             if entity_id:
-                groups[group_key]["affected_records"].add(entity_id)
+                group["affected_records"].add(entity_id)
 
             # Track timestamps
             try:
                 timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                if (
-                    groups[group_key]["first_seen"] is None
-                    or timestamp < groups[group_key]["first_seen"]
-                ):
-                    groups[group_key]["first_seen"] = timestamp
-                if (
-                    groups[group_key]["last_seen"] is None
-                    or timestamp > groups[group_key]["last_seen"]
-                ):
-                    groups[group_key]["last_seen"] = timestamp
+                first_seen = group["first_seen"]
+                if first_seen is None or timestamp < first_seen:
+                    group["first_seen"] = timestamp
+                last_timestamp_str = error.get("last_timestamp")
+                if last_timestamp_str:
+                    timestamp = datetime.fromisoformat(
+                        last_timestamp_str.replace("Z", "+00:00")
+                    )
+                last_seen = group["last_seen"]
+                if last_seen is None or timestamp > last_seen:
+                    group["last_seen"] = timestamp
             except (ValueError, TypeError):
                 pass
 
@@ -259,39 +300,30 @@ class ErrorAnalyzer:
             first_failed_at = record.get("first_failed_at", "")
 
             # Map failure reason to category
-            category_map = {
-                "duplicate_fields": CATEGORY_DUPLICATE_FIELD,
-                "missing_required": CATEGORY_MISSING_FIELD,
-                "validation_error": CATEGORY_VALIDATION,
-            }
-            category = category_map.get(failure_reason, CATEGORY_UNKNOWN)
+            category = FAILURE_REASON_CATEGORIES.get(failure_reason, CATEGORY_UNKNOWN)
 
-            # Get field from failed_fields
-            field = None
-            if failed_fields:
-                field = list(failed_fields.keys())[0]
+            # Get the first field from failed_fields without copying its keys
+            field = next(iter(failed_fields), None) if failed_fields else None
 
-            group_key = f"{category}:{field or 'general'}"
+            group = groups[f"{category}:{field or 'general'}"]
 
-            groups[group_key]["category"] = category
-            groups[group_key]["field"] = field
+            group["category"] = category
+            group["field"] = field
 
             if entity_id:
-                groups[group_key]["affected_records"].add(entity_id)
+                group["affected_records"].add(entity_id)
 
-            # Add pseudo-error for counting
-            groups[group_key]["errors"].append(record)
+            # Count the record as an occurrence
+            group["occurrences"] += 1
 
             # Track timestamps
             try:
                 timestamp = datetime.fromisoformat(
                     first_failed_at.replace("Z", "+00:00")
                 )
-                if (
-                    groups[group_key]["first_seen"] is None
-                    or timestamp < groups[group_key]["first_seen"]
-                ):
-                    groups[group_key]["first_seen"] = timestamp
+                first_seen = group["first_seen"]
+                if first_seen is None or timestamp < first_seen:
+                    group["first_seen"] = timestamp
             except (ValueError, TypeError):
                 pass
 
@@ -301,12 +333,12 @@ class ErrorAnalyzer:
         self, group_key: str, group_data: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Generate a suggestion from a group of errors."""
-        if not group_data["errors"]:
+        if not group_data["occurrences"]:
             return None
 
         category = group_data["category"] or CATEGORY_UNKNOWN
         field = group_data["field"]
-        occurrence_count = len(group_data["errors"])
+        occurrence_count = group_data["occurrences"]
         affected_records = list(group_data["affected_records"])
 
         severity = self._calculate_severity(occurrence_count, category)
@@ -348,27 +380,22 @@ class ErrorAnalyzer:
         error_type_lower = error_type.lower()
 
         # Check patterns in order of specificity
-        for pattern in DUPLICATE_PATTERNS:
-            if re.search(pattern, message_lower):
-                return CATEGORY_DUPLICATE_FIELD
+        if _DUPLICATE_RE.search(message_lower):
+            return CATEGORY_DUPLICATE_FIELD
 
-        for pattern in RATE_LIMIT_PATTERNS:
-            if re.search(pattern, message_lower):
-                return CATEGORY_RATE_LIMIT
+        if _RATE_LIMIT_RE.search(message_lower):
+            return CATEGORY_RATE_LIMIT
 
-        for pattern in MISSING_FIELD_PATTERNS:
-            if re.search(pattern, message_lower):
-                return CATEGORY_MISSING_FIELD
+        if _MISSING_FIELD_RE.search(message_lower):
+            return CATEGORY_MISSING_FIELD
 
-        for pattern in CONNECTIVITY_PATTERNS:
-            if re.search(pattern, message_lower) or re.search(
-                pattern, error_type_lower
-            ):
-                return CATEGORY_CONNECTIVITY
+        if _CONNECTIVITY_RE.search(message_lower) or _CONNECTIVITY_RE.search(
+            error_type_lower
+        ):
+            return CATEGORY_CONNECTIVITY
 
-        for pattern in VALIDATION_PATTERNS:
-            if re.search(pattern, message_lower) or "validation" in error_type_lower:
-                return CATEGORY_VALIDATION
+        if _VALIDATION_RE.search(message_lower) or "validation" in error_type_lower:
+            return CATEGORY_VALIDATION
 
         return CATEGORY_UNKNOWN
 
@@ -376,8 +403,8 @@ class ErrorAnalyzer:
         """Extract field name from error message."""
         message_lower = message.lower()
 
-        for pattern, group_index in FIELD_PATTERNS:
-            match = re.search(pattern, message_lower)
+        for pattern, group_index in _FIELD_RES:
+            match = pattern.search(message_lower)
             if match:
                 return match.group(group_index).replace(" ", "_")
 
@@ -411,7 +438,9 @@ class ErrorAnalyzer:
         """Generate a unique ID for a suggestion."""
         # Use hash of group key and first few affected records
         content = f"{group_key}:{','.join(sorted(affected_records[:5]))}"
-        hash_val = hashlib.sha256(content.encode()).hexdigest()[:8]
+        hash_val = hashlib.blake2b(
+            content.encode(), digest_size=4, usedforsecurity=False
+        ).hexdigest()
         return f"sug_{hash_val}"
 
     def _generate_title(self, category: str, field: Optional[str], count: int) -> str:
@@ -3,9 +3,15 @@ from __future__ import annotations
 
 from typing import Dict, Any, Optional, List
 from pathlib import Path
+import atexit
 import json
+import mmap
+import queue
+import threading
 import time
+import weakref
 from datetime import datetime, timezone
+from utils import failed_sync_tracker
 from utils.logger import get_logger
 from utils.metrics import metrics
 
@@ -164,7 +170,7 @@ class _ChangeTracker:
         session_file = self.output_dir / f"{self.current_session['session_id']}.json"
         try:
             session_file.write_text(
-                json.dumps(self.current_session, indent=2, default=str),
+                json.dumps(self.current_session, separators=(",", ":"), default=str),
                 encoding="utf-8",
             )
         except Exception:
@@ -191,6 +197,11 @@ class _ChangeTracker:
         all_changes: List[Dict[str, Any]] = []
         for session_path in self._session_files():
             try:
+                # A session file is written when its session ends, so one last
+                # modified before the cutoff (like every older file after it
+                # in mtime order) cannot overlap the window; skip reading it
+                if session_path.stat().st_mtime < cutoff_ts:
+                    break
                 session = json.loads(session_path.read_text(encoding="utf-8"))
                 summary = session.get("summary", {})
                 # Include session if it overlaps the cutoff window
@@ -278,32 +289,272 @@ class _ChangeTracker:
         }
 
 
+# Notifiers with a running writer thread, flushed once at interpreter exit
+_open_notifiers: "weakref.WeakSet[_ErrorNotifier]" = weakref.WeakSet()
+
+
+def _flush_open_notifiers() -> None:
+    for notifier in list(_open_notifiers):
+        notifier.flush(1.0)
+
+
+atexit.register(_flush_open_notifiers)
+
+
 class _ErrorNotifier:
-    """Internal notifier (migrated from utils.error_notifier)."""
+    """Internal notifier (migrated from utils.error_notifier).
+
+    Error records are kept in memory and appended to ``error_log.json`` as
+    JSON lines by a single daemon writer thread, which also owns the hourly
+    notification so sync workers never block on file IO or email.
+    """
+
+    # Identical consecutive errors within this window are coalesced into one record
+    COALESCE_WINDOW_SECONDS = 60
+    # A coalesced run starts a new record after this long, so a steady flood
+    # keeps showing up in time-windowed reads with its count split by period
+    COALESCE_MAX_SPAN_SECONDS = 300
+    # Writer thread flushes after this many records or this many seconds
+    WRITE_BATCH_SIZE = 100
+    WRITE_BATCH_SECONDS = 0.5
+
+    _NOTIFY = object()
+    _REWRITE = object()
+    _STOP = object()
 
     def __init__(self, data_dir: str = "output/errors") -> None:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.errors_file = self.data_dir / "error_log.json"
         self.last_notification_file = self.data_dir / "last_notification.json"
-        if self.errors_file.exists():
+        # History is loaded on first use; records logged before then live in
+        # _new_errors and are merged in when the file is read
+        self._errors: Optional[List[Dict[str, Any]]] = None
+        self._new_errors: List[Dict[str, Any]] = []
+        self._lock = threading.RLock()
+        self._last_key: Optional[tuple] = None
+        self._last_record: Optional[Dict[str, Any]] = None
+        self._last_ts: float = 0.0
+        self._run_started: float = 0.0
+        # Count of _last_record as last queued for writing
+        self._last_written_count: int = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="error-notifier-writer", daemon=True
+        )
+        self._writer.start()
+        self._closed = False
+        # Flushed by the process-wide exit hook until closed
+        _open_notifiers.add(self)
+
+    @staticmethod
+    def _record_id(record: Dict[str, Any]) -> tuple:
+        return (
+            record.get("timestamp"),
+            record.get("error_type"),
+            record.get("entity_type"),
+            record.get("entity_id"),
+        )
+
+    @staticmethod
+    def _to_line(record: Dict[str, Any]) -> str:
+        return json.dumps(record, separators=(",", ":"), default=str) + "\n"
+
+    @property
+    def errors(self) -> List[Dict[str, Any]]:
+        if self._errors is None:
+            with self._lock:
+                if self._errors is None:
+                    records = {self._record_id(r): r for r in self._load()}
+                    for r in self._new_errors:
+                        records[self._record_id(r)] = r
+                    self._errors = list(records.values())
+                    self._new_errors = []
+        return self._errors
+
+    @errors.setter
+    def errors(self, value: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._errors = value
+            self._new_errors = []
+
+    def _load(self) -> List[Dict[str, Any]]:
+        if not self.errors_file.exists():
+            return []
+        try:
+            text = self.errors_file.read_text(encoding="utf-8")
+        except Exception:
+            return []
+        if text.lstrip().startswith("["):
+            # Legacy format: a single JSON array
             try:
-                self.errors: List[Dict[str, Any]] = json.loads(
-                    self.errors_file.read_text(encoding="utf-8")
-                )
+                return json.loads(text)
+            except Exception:
+                return []
+        # A coalesced record is re-appended when its count changes; keep the latest
+        records: Dict[tuple, Dict[str, Any]] = {}
+        for line in text.splitlines():
+            try:
+                record = json.loads(line)
             except Exception:
-                self.errors = []
-        else:
-            self.errors = []
+                continue
+            records[self._record_id(record)] = record
+        return list(records.values())
+
+    @staticmethod
+    def _last_seen(record: Dict[str, Any]) -> Any:
+        """When a record last occurred; coalesced repeats update last_timestamp."""
+        return record.get("last_timestamp") or record.get("timestamp", "")
+
+    @staticmethod
+    def _parse_ts(value: Any) -> Optional[float]:
+        try:
+            return datetime.fromisoformat(str(value)).timestamp()
+        except Exception:
+            return None
+
+    @classmethod
+    def _is_before(cls, value: Any, cutoff: float, cutoff_iso: str) -> Optional[bool]:
+        """Whether timestamp ``value`` is before ``cutoff``; None if unparseable.
+
+        Records written here carry UTC ``isoformat()`` strings, which sort in
+        time order, so those are compared to ``cutoff_iso`` without parsing.
+        """
+        if isinstance(value, str) and value.endswith("+00:00") and value[10:11] == "T":
+            return value < cutoff_iso
+        seen = cls._parse_ts(value)
+        return None if seen is None else seen < cutoff
+
+    def _tail_errors(self, cutoff: float) -> List[Dict[str, Any]]:
+        """Read records newer than ``cutoff`` by scanning the log backwards.
+
+        Avoids loading the whole history when only a recent window is needed.
+        Falls back to the full history for legacy (JSON array) logs.
+        """
+        records: Dict[tuple, Dict[str, Any]] = {}
+        cutoff_iso = datetime.fromtimestamp(cutoff, timezone.utc).isoformat()
+        try:
+            if self.errors_file.exists() and self.errors_file.stat().st_size > 0:
+                with open(self.errors_file, "rb") as f, mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mm:
+                    if mm[:1] == b"[":
+                        return self.errors
+                    end = len(mm)
+                    while end > 0:
+                        start = mm.rfind(b"\n", 0, end - 1) + 1
+                        line = mm[start:end].strip()
+                        end = start
+                        if not line:
+                            continue
+                        try:
+                            record = json.loads(line)
+                        except Exception:
+                            continue
+                        # Lines are written in emission order; a re-appended
+                        # coalesced record was emitted at its last_timestamp
+                        if self._is_before(self._last_seen(record), cutoff, cutoff_iso):
+                            break
+                        # Scanning backwards, the first line seen is the latest
+                        records.setdefault(self._record_id(record), record)
+        except Exception as e:
+            logger.warning(f"Failed to scan error log: {e}")
+        ordered = {k: records[k] for k in reversed(list(records))}
+        with self._lock:
+            if self._errors is not None:
+                return self._errors
+            # Unflushed or still-coalescing records take precedence over disk
+            for r in self._new_errors:
+                ordered[self._record_id(r)] = r
+        return list(ordered.values())
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        try:
+            with open(self.errors_file, "a", encoding="utf-8") as f:
+                f.write("".join(map(self._to_line, records)))
+        except Exception:
+            pass
 
     def _save(self) -> None:
+        with self._lock:
+            snapshot = list(self.errors)
         try:
             self.errors_file.write_text(
-                json.dumps(self.errors, indent=2, default=str), encoding="utf-8"
+                "".join(map(self._to_line, snapshot)),
+                encoding="utf-8",
             )
         except Exception:
             pass
 
+    # ----- Writer thread -----
+    def _writer_loop(self) -> None:
+        stopped = False
+        while not stopped:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.WRITE_BATCH_SECONDS
+            # Only records are batched; a command (flush, stop, ...) runs at once
+            while len(batch) < self.WRITE_BATCH_SIZE and isinstance(batch[-1], dict):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            stopped = any(item is self._STOP for item in batch)
+            try:
+                self._process_batch(batch)
+            except Exception as e:
+                logger.error(f"Error notifier writer failed: {e}")
+
+    def _process_batch(self, batch: List[Any]) -> None:
+        pending: List[Dict[str, Any]] = []
+        for item in batch:
+            if isinstance(item, dict):
+                pending.append(item)
+                continue
+            # Commands run after all records queued ahead of them are on disk
+            if pending:
+                self._append(pending)
+                pending = []
+            if item is self._NOTIFY:
+                self._send_hourly_notification_now()
+            elif item is self._REWRITE:
+                self._save()
+            elif isinstance(item, threading.Event):
+                item.set()
+        if pending:
+            self._append(pending)
+
+    def _queue_last_count(self) -> None:
+        """Queue the current repeat record if its count has not been written."""
+        with self._lock:
+            record = self._last_record
+            if record is not None and record["count"] != self._last_written_count:
+                self._queue.put(dict(record))
+                self._last_written_count = record["count"]
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until everything logged so far, including repeat counts, is written."""
+        if self._closed:
+            # close() already drained the queue; nothing else will be written
+            return not self._writer.is_alive()
+        self._queue_last_count()
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Write out everything logged so far and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue_last_count()
+        self._queue.put(self._STOP)
+        self._writer.join(timeout)
+        _open_notifiers.discard(self)
+
     def log_error(
         self,
         error_type: str,
@@ -313,18 +564,44 @@ class _ErrorNotifier:
         error_details: Optional[Dict[str, Any]] = None,
         source: str = "sync",
     ) -> None:
-        self.errors.append(
-            {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "error_type": error_type,
-                "entity_type": entity_type,
-                "entity_id": entity_id,
-                "error_message": error_message,
-                "error_details": error_details or {},
-                "source": source,
-            }
-        )
-        self._save()
+        now = time.monotonic()
+        key = (error_type, entity_type, entity_id)
+        with self._lock:
+            if (
+                key == self._last_key
+                and self._last_record is not None
+                and now - self._last_ts < self.COALESCE_WINDOW_SECONDS
+                and now - self._run_started < self.COALESCE_MAX_SPAN_SECONDS
+            ):
+                # Repeat of the previous error: bump its counter instead of appending
+                self._last_record["count"] = self._last_record.get("count", 1) + 1
+                self._last_record["last_timestamp"] = datetime.now(
+                    timezone.utc
+                ).isoformat()
+                self._last_ts = now
+            else:
+                # Persist the final count of the run that just ended
+                self._queue_last_count()
+                record = {
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "error_type": error_type,
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                    "error_message": error_message,
+                    "error_details": error_details or {},
+                    "source": source,
+                    "count": 1,
+                }
+                if self._errors is None:
+                    self._new_errors.append(record)
+                else:
+                    self._errors.append(record)
+                self._queue.put(dict(record))
+                self._last_written_count = 1
+                self._last_key = key
+                self._last_record = record
+                self._last_ts = now
+                self._run_started = now
         try:
             metrics.errors_total.labels(error_type=error_type, entity_type=entity_type, source=source).inc()  # type: ignore[attr-defined]
         except Exception:
@@ -332,15 +609,13 @@ class _ErrorNotifier:
 
     def get_errors_since(self, hours: int = 1) -> List[Dict[str, Any]]:
         cutoff = datetime.now(timezone.utc).timestamp() - hours * 3600
-        out: List[Dict[str, Any]] = []
-        for e in self.errors:
-            try:
-                ts = datetime.fromisoformat(e.get("timestamp", ""))
-                if ts.timestamp() >= cutoff:
-                    out.append(e)
-            except Exception:
-                continue
-        return out
+        cutoff_iso = datetime.fromtimestamp(cutoff, timezone.utc).isoformat()
+        source = self._errors if self._errors is not None else self._tail_errors(cutoff)
+        return [
+            e
+            for e in source
+            if self._is_before(self._last_seen(e), cutoff, cutoff_iso) is False
+        ]
 
     def _should_send(self) -> bool:
         if not self.last_notification_file.exists():
@@ -356,14 +631,15 @@ class _ErrorNotifier:
         try:
             self.last_notification_file.write_text(
                 json.dumps(
-                    {"timestamp": datetime.now(timezone.utc).isoformat()}, indent=2
+                    {"timestamp": datetime.now(timezone.utc).isoformat()},
+                    separators=(",", ":"),
                 ),
                 encoding="utf-8",
             )
         except Exception:
             pass
 
-    def send_hourly_notification(self) -> bool:
+    def _send_hourly_notification_now(self) -> bool:
         if not self._should_send():
             return False
         if len(self.get_errors_since(1)) == 0:
@@ -372,23 +648,33 @@ class _ErrorNotifier:
         self._mark_sent()
         return True
 
+    def send_hourly_notification(self) -> bool:
+        """Queue an hourly notification; the writer thread sends it if due.
+
+        Returns:
+            True if there were errors in the last hour and a notification was
+            queued, False if there was nothing to report
+        """
+        if not self.get_errors_since(1):
+            return False
+        self._queue.put(self._NOTIFY)
+        return True
+
     def cleanup_old_errors(self, days: int = 7) -> None:
         cutoff = datetime.now(timezone.utc).timestamp() - days * 86400
-        filtered: List[Dict[str, Any]] = []
-        for e in self.errors:
-            try:
-                ts = datetime.fromisoformat(e.get("timestamp", ""))
-                if ts.timestamp() >= cutoff:
-                    filtered.append(e)
-            except Exception:
-                continue
-        self.errors = filtered
-        self._save()
+        cutoff_iso = datetime.fromtimestamp(cutoff, timezone.utc).isoformat()
+        with self._lock:
+            self.errors = [
+                e
+                for e in self.errors
+                if self._is_before(self._last_seen(e), cutoff, cutoff_iso) is False
+            ]
+        self._queue.put(self._REWRITE)
 
     def get_notification_status(self) -> Dict[str, Any]:
         recent = self.get_errors_since(1)
         return {
-            "total_errors_last_hour": len(recent),
+            "total_errors_last_hour": sum(e.get("count", 1) for e in recent),
             "should_send_notification": self._should_send(),
             "last_notification_sent": (
                 json.loads(self.last_notification_file.read_text())
@@ -411,12 +697,19 @@ class EventManager:
         error_notifier: Optional[_ErrorNotifier] = None,
     ) -> None:
         self.change_tracker = change_tracker or _ChangeTracker()
+        self._owns_notifier = error_notifier is None
         self.error_notifier = error_notifier or _ErrorNotifier()
         self._current_session_id: Optional[str] = None
 
+    def close(self) -> None:
+        """Stop the error notifier's writer thread if this manager created it."""
+        if self._owns_notifier:
+            self.error_notifier.close()
+
     # ----- Session lifecycle -----
     def start_sync(self, name: str, correlation_id: Optional[str] = None) -> str:
         self.change_tracker.start_sync(name)
+        failed_sync_tracker.begin_sync_pass()
         self._current_session_id = self.change_tracker.current_session.get("session_id")
         logger.info(
             "Sync session started",
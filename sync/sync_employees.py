@@ -20,14 +20,31 @@ class EmployeeSyncer:
         self.msgraph = MSGraphAPI()
         # event_manager handles session lifecycle and change logging
         logger.info("Fetching initial data for sync...")
-        self.cluster_map = self._build_cluster_map()
-        self.role_map = self._build_role_map()
-        self.title_map = self._build_title_map()
-        self.existing_users = self._build_user_map()
-        self.home_office_map = self._build_home_office_map()
+        reference = self._load_reference_data()
+        self.cluster_map = self._build_cluster_map(reference["safetyamp_sites"])
+        self.role_map = self._build_role_map(reference["safetyamp_roles"])
+        self.title_map = self._build_title_map(reference["safetyamp_titles"])
+        self.existing_users = self._build_user_map(reference["safetyamp_users_by_id"])
+        self.home_office_map = self._build_home_office_map(reference["safetyamp_sites"])
         self.entra_users = self.msgraph.get_active_users()
 
-    def _build_cluster_map(self):
+    def _load_reference_data(self, *names):
+        """Read cached SafetyAmp lookups in one batch, fetching any that are stale.
+
+        Loads every lookup when no names are given.
+        """
+        get_all = self.api_client.get_all_paginated
+        loaders = {
+            "safetyamp_sites": lambda: get_all("/api/sites", key_field="id"),
+            "safetyamp_roles": lambda: get_all("/api/roles", key_field="id"),
+            "safetyamp_titles": lambda: get_all("/api/user_titles", key_field="id"),
+            "safetyamp_users_by_id": lambda: get_all("/api/users", key_field="id"),
+        }
+        return data_manager.get_many_cached_with_fallback(
+            [(name, loaders[name], 1) for name in names or loaders]
+        )
+
+    def _build_cluster_map(self, sites_dict):
         logger.info("Building cluster map from site clusters and sites...")
 
         clusters_dict = self.api_client.get_site_clusters()
@@ -38,11 +55,6 @@ class EmployeeSyncer:
             and cluster.get("parent_cluster_id") is not None
         }
 
-        sites_dict = data_manager.get_cached_data_with_fallback(
-            "safetyamp_sites",
-            lambda: self.api_client.get_all_paginated("/api/sites", key_field="id"),
-            max_age_hours=1,
-        )
         for site in sites_dict.values():
             ext_id = site.get("external_code")
             if ext_id and ext_id not in cluster_map:
@@ -51,12 +63,7 @@ class EmployeeSyncer:
         logger.info(f"Cluster map built with {len(cluster_map)} entries.")
         return cluster_map
 
-    def _build_role_map(self):
-        roles = data_manager.get_cached_data_with_fallback(
-            "safetyamp_roles",
-            lambda: self.api_client.get_all_paginated("/api/roles", key_field="id"),
-            max_age_hours=1,
-        )
+    def _build_role_map(self, roles):
         role_map = {
             r["name"].strip(): r["id"]
             for r in roles.values()
@@ -65,14 +72,7 @@ class EmployeeSyncer:
         logger.info(f"Role map built with {len(role_map)} entries.")
         return role_map
 
-    def _build_title_map(self):
-        titles = data_manager.get_cached_data_with_fallback(
-            "safetyamp_titles",
-            lambda: self.api_client.get_all_paginated(
-                "/api/user_titles", key_field="id"
-            ),
-            max_age_hours=1,
-        )
+    def _build_title_map(self, titles):
         title_map = {
             t["name"].strip(): t["id"]
             for t in titles.values()
@@ -81,24 +81,14 @@ class EmployeeSyncer:
         logger.info(f"Title map built with {len(title_map)} entries.")
         return title_map
 
-    def _build_user_map(self):
-        users = data_manager.get_cached_data_with_fallback(
-            "safetyamp_users_by_id",
-            lambda: self.api_client.get_all_paginated("/api/users", key_field="id"),
-            max_age_hours=1,
-        )
+    def _build_user_map(self, users):
         user_map = {
             user["emp_id"]: user for user in users.values() if user.get("emp_id")
         }
         logger.info(f"User map built with {len(user_map)} entries.")
         return user_map
 
-    def _build_home_office_map(self):
-        sites = data_manager.get_cached_data_with_fallback(
-            "safetyamp_sites",
-            lambda: self.api_client.get_all_paginated("/api/sites", key_field="id"),
-            max_age_hours=1,
-        )
+    def _build_home_office_map(self, sites):
         home_office_map = {
             site["cluster_id"]: site["id"]
             for site in sites.values()
@@ -162,26 +152,24 @@ class EmployeeSyncer:
             else:
                 new_value = str(new_raw).strip()
 
-            # Apply field-specific normalization
+            # Apply field-specific normalization; these normalizers strip their
+            # input, so the normalized new value is also the value to send
+            normalizer = None
             if key in ["mobile_phone", "work_phone"]:
-                existing_value = self.clean_phone(existing_value) or ""
-                new_value = self.clean_phone(new_value) or ""
+                normalizer = self.clean_phone
             elif key == "gender":
-                existing_value = self.normalize_gender(existing_value) or ""
-                new_value = self.normalize_gender(new_value) or ""
+                normalizer = self.normalize_gender
             elif key in ["date_of_birth", "current_hire_date"]:
-                existing_value = self.format_date(existing_value) or ""
-                new_value = self.format_date(new_value) or ""
+                normalizer = self.format_date
+            if normalizer is not None:
+                existing_value = normalizer(existing_value) or ""
+                new_value = normalizer(new_value) or ""
 
             # Only include field if values are actually different AND new value is not empty/None
             if existing_value != new_value and new_value:
-                # Use the normalized new value for the update to ensure consistency
-                if key in ["mobile_phone", "work_phone"]:
-                    updated_fields[key] = self.clean_phone(new_raw)
-                elif key == "gender":
-                    updated_fields[key] = self.normalize_gender(new_raw)
-                elif key in ["date_of_birth", "current_hire_date"]:
-                    updated_fields[key] = self.format_date(new_raw)
+                if normalizer is not None:
+                    # Reuse the normalized new value rather than normalizing again
+                    updated_fields[key] = new_value
                 else:
                     # For other fields, use the original value but ensure it's not None
                     updated_fields[key] = new_raw if new_raw is not None else ""
@@ -259,6 +247,16 @@ class EmployeeSyncer:
             "processed_employees": [],
         }
 
+        # Load failure records for this batch with a single MGET; the record
+        # cache was reset when the sync session started
+        prefetched_failures = None
+        if failed_sync_tracker.failed_sync_tracker:
+            prefetched_failures = (
+                failed_sync_tracker.failed_sync_tracker.prefetch_failed_records(
+                    "employee", [str(emp["Employee"]) for emp in employees]
+                )
+            )
+
         # Track consecutive errors to prevent infinite error loops
         consecutive_errors = 0
         max_consecutive_errors = 10
@@ -293,11 +291,16 @@ class EmployeeSyncer:
             if (
                 failed_sync_tracker.failed_sync_tracker
                 and failed_sync_tracker.failed_sync_tracker.should_skip_retry(
-                    entity_id=emp_id, entity_type="employee", current_data=payload
+                    entity_id=emp_id,
+                    entity_type="employee",
+                    current_data=payload,
+                    prefetched=prefetched_failures,
                 )
             ):
                 logger.debug(
-                    f"Skipping {full_name} (ID: {emp_id}) - problematic fields unchanged since last failure"
+                    "Skipping %s (ID: %s) - problematic fields unchanged since last failure",
+                    full_name,
+                    emp_id,
                 )
                 event_manager.log_skip(
                     "employee", emp_id, "No changes to previously failed fields"
@@ -709,7 +712,10 @@ class EmployeeSyncer:
             if sync_results["created"] > 0 or sync_results["updated"] > 0:
                 logger.info("Updating caches after sync...")
                 # Refresh user cache to include new/updated users
-                self.existing_users = self._build_user_map()
+                users = self._load_reference_data("safetyamp_users_by_id")
+                self.existing_users = self._build_user_map(
+                    users["safetyamp_users_by_id"]
+                )
                 logger.info("Cache update completed")
         except Exception as e:
             logger.error(f"Error updating cache after sync: {e}")
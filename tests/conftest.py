@@ -37,6 +37,7 @@ def mock_config():
     config.MAX_RETRY_ATTEMPTS = 3
     config.FAILED_SYNC_TRACKER_ENABLED = True
     config.FAILED_SYNC_TTL_DAYS = 7
+    config.FAILED_SYNC_INDEX_REFRESH_MINUTES = 5
     return config
 
 
@@ -7,6 +7,7 @@ Tests cover:
 - Filtering by service, method, status
 - Ring buffer eviction when exceeding max size
 - Handling Redis unavailability gracefully
+- Bounded request/response summaries
 """
 
 import pytest
@@ -109,6 +110,24 @@ class TestApiCallTracker:
         assert stored_data["status_code"] == 500
         assert stored_data["error_message"] == "Internal server error"
 
+    def test_record_api_call_truncates_summaries(self, tracker):
+        """Payload summaries should be capped at SUMMARY_MAX_LENGTH."""
+        payload = {"users": [{"id": i, "name": f"user{i}"} for i in range(500)]}
+
+        tracker.record_call(
+            service="safetyamp",
+            method="POST",
+            endpoint="/api/users",
+            status_code=201,
+            duration_ms=100,
+            request_payload=payload,
+            response_summary="ok",
+        )
+
+        stored_data = json.loads(self.mock_redis_client.lpush.call_args[0][1])
+        assert stored_data["request_summary"] == str(payload)[:200]
+        assert stored_data["response_summary"] == "ok"
+
     def test_record_api_call_trims_to_max_entries(self, tracker):
         """Ring buffer should be trimmed to max_entries after each insert."""
         tracker.record_call(
@@ -422,3 +441,44 @@ class TestApiCallTrackerIds:
         call2_data = json.loads(self.mock_redis_client.lpush.call_args_list[1][0][1])
 
         assert call1_data["id"] != call2_data["id"]
+
+
+class TestSummarize:
+    """Tests for bounded payload summaries."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "x" * 500,
+            12345,
+            None,
+            {"a": 1, "b": [1, 2, {"c": "it's"}], 3: (4, 5)},
+            [{"id": i, "tags": ["a", "b"]} for i in range(100)],
+            {},
+            [],
+        ],
+    )
+    def test_matches_truncated_str(self, value):
+        """Summaries should equal str(value)[:limit] for any payload."""
+        from services.api_call_tracker import _summarize
+
+        for limit in (5, 40, 200):
+            assert _summarize(value, limit) == str(value)[:limit]
+
+    def test_stops_rendering_once_limit_reached(self):
+        """Only the leading items of a large payload should be rendered."""
+        from services import api_call_tracker
+
+        rendered = []
+
+        class Item:
+            def __init__(self, index):
+                self.index = index
+
+            def __repr__(self):
+                rendered.append(self.index)
+                return f"Item({self.index})"
+
+        api_call_tracker._summarize([Item(i) for i in range(1000)], 50)
+
+        assert len(rendered) < 10
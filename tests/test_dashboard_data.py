@@ -4,7 +4,7 @@ Unit tests for the Dashboard Data module.
 Tests cover:
 - Sync metrics aggregation
 - Vista records count history
-- Entity counts
+- Entity counts, with memoized SafetyAmp lookups
 - Cache statistics
 - Sync duration trends
 """
@@ -107,6 +107,39 @@ class TestDashboardData:
         assert metrics["by_operation"]["created"] == 50
         assert metrics["by_operation"]["updated"] == 30
 
+    def test_get_sync_metrics_aggregates_sessions(
+        self, dashboard_data, mock_event_manager
+    ):
+        """get_sync_metrics should total sessions and average known durations."""
+        mock_event_manager.change_tracker.get_summary_report.return_value = {
+            "by_operation": {},
+            "by_entity_type": {},
+            "recent_sessions": [
+                {
+                    "total_processed": 100,
+                    "total_created": 10,
+                    "total_updated": 5,
+                    "total_errors": 4,
+                    "total_skipped": 1,
+                    "duration_seconds": 30,
+                },
+                {"total_processed": 50, "total_created": 2, "duration_seconds": 60},
+                {"total_processed": 10, "duration_seconds": 0},
+            ],
+        }
+
+        metrics = dashboard_data.get_sync_metrics()
+
+        assert metrics["total_syncs"] == 3
+        assert metrics["failed_syncs"] == 1
+        assert metrics["successful_syncs"] == 2
+        assert metrics["total_records_processed"] == 160
+        assert metrics["total_created"] == 12
+        assert metrics["total_updated"] == 5
+        assert metrics["total_errors"] == 4
+        assert metrics["total_skipped"] == 1
+        assert metrics["avg_duration_seconds"] == 45.0
+
     def test_get_sync_history_returns_list(self, dashboard_data):
         """get_sync_history should return a list of sync records."""
         history = dashboard_data.get_sync_history(limit=10)
@@ -155,6 +188,38 @@ class TestDashboardData:
         assert counts["employees"] == 3
         assert counts["jobs"] == 2
 
+    def test_entity_counts_memoize_safetyamp_lookups(self, dashboard_data):
+        """Repeated calls should reuse the paginated SafetyAmp counts."""
+        with patch("services.safetyamp_api.SafetyAmpAPI") as MockAPI:
+            api = MockAPI.return_value
+            api.get_site_clusters.return_value = {"1": {}, "2": {}}
+            api.get_assets.return_value = {"1": {}}
+            api.get_titles.return_value = {}
+
+            first = dashboard_data.get_entity_counts()
+            second = dashboard_data.get_entity_counts()
+            dashboard_data.invalidate_entity_counts()
+            dashboard_data.get_entity_counts()
+
+        assert first == second
+        assert first["departments"] == 2
+        assert first["vehicles"] == 1
+        assert api.get_assets.call_count == 2
+
+    def test_entity_counts_skip_memo_on_partial_failure(self, dashboard_data):
+        """A failed SafetyAmp lookup should not be memoized as zero."""
+        with patch("services.safetyamp_api.SafetyAmpAPI") as MockAPI:
+            api = MockAPI.return_value
+            api.get_site_clusters.side_effect = [RuntimeError("down"), {"1": {}}]
+            api.get_assets.return_value = {}
+            api.get_titles.return_value = {}
+
+            first = dashboard_data.get_entity_counts()
+            second = dashboard_data.get_entity_counts()
+
+        assert first["departments"] == 0
+        assert second["departments"] == 1
+
     def test_get_cache_stats_returns_cache_info(
         self, dashboard_data, mock_data_manager
     ):
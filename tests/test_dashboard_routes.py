@@ -5,6 +5,7 @@ Tests cover:
 - All dashboard API endpoints
 - Request parameter handling
 - Response format validation
+- Streaming CSV exports
 - Error handling
 """
 
@@ -362,6 +363,28 @@ class TestDashboardRoutes:
         data = json.loads(response.data)
         assert "database" in data or "services" in data
 
+    # --- Export Tests ---
+
+    def test_export_csv_streams_rows(self, client):
+        """CSV exports should stream a header plus one row per record."""
+        response = client.get("/api/dashboard/export/api-calls?format=csv")
+
+        assert response.status_code == 200
+        assert response.mimetype == "text/csv"
+        assert response.is_streamed
+        lines = response.get_data(as_text=True).splitlines()
+        assert lines[0].split(",")[0] == "duration_ms"
+        assert len(lines) == 2
+
+    def test_convert_to_csv_flattens_nested_values(self):
+        """Nested values should be JSON-encoded and rows joined in order."""
+        from routes.dashboard import _convert_to_csv
+
+        content = _convert_to_csv([{"a": 1, "b": {"x": 1}}, {"a": 2}])
+
+        assert content.splitlines() == ["a,b", '1,"{""x"": 1}"', "2,"]
+        assert _convert_to_csv([]) == ""
+
 
 class TestDashboardRoutesErrorHandling:
     """Tests for error handling in dashboard routes."""
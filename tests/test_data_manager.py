@@ -0,0 +1,1042 @@
+"""
+Unit tests for DataManager Redis access patterns.
+
+Tests cover:
+- Bulk reading of failed sync records with batched MGET
+- Listing failed sync keys without fetching values
+- Batched lookup of failed sync records by entity id
+- Expiry-scored index used for failure counts and pagination
+- Entity id to entity type lookup for bare record ids
+- Bulk saving of failed sync records in one transaction
+- Cache payload encoding (JSON and tagged MessagePack)
+- SCAN-based, pipelined cache inspection and invalidation
+- Hash-tagged cache keys for Redis Cluster slot colocation
+- Cache TTLs derived once in seconds
+- Cache metadata stored as a Redis hash
+- In-process LRU of recent cache reads
+- Batched multi-cache reads with per-name fallback
+- Hit, miss and refresh metrics for cache reads
+- Pooled Redis clients with health checks and retry
+"""
+
+import json
+import time
+from decimal import Decimal
+
+import pytest
+from unittest.mock import MagicMock, call, patch
+
+
+@pytest.fixture
+def mock_redis_client():
+    """Create a mock Redis client."""
+    client = MagicMock()
+    client.ping.return_value = True
+    client.get.return_value = None
+    client.set.return_value = True
+    client.setex.return_value = True
+    client.scan_iter.return_value = iter([])
+    client.mget.return_value = []
+    client.pipeline.return_value = MagicMock()
+    return client
+
+
+@pytest.fixture
+def data_manager(mock_redis_client):
+    """Create DataManager with mocked Redis."""
+    with patch("services.data_manager.redis.Redis") as MockRedis:
+        MockRedis.return_value = mock_redis_client
+        with patch("services.data_manager.config") as mock_config:
+            mock_config.REDIS_HOST = "localhost"
+            mock_config.REDIS_PORT = "6379"
+            mock_config.REDIS_DB = "0"
+            mock_config.REDIS_PASSWORD = None
+            mock_config.CACHE_TTL_HOURS = "24"
+            mock_config.CACHE_REFRESH_INTERVAL_HOURS = "1"
+            mock_config.VISTA_REFRESH_MINUTES = "60"
+            mock_config.CACHE_LOCAL_TTL_SECONDS = 0
+
+            from services.data_manager import DataManager
+
+            dm = DataManager()
+            dm.redis_client = mock_redis_client
+            return dm
+
+
+def _saved_entry(client):
+    """Unpack the last save_cache script call into (keys, ttl, payload, fields)."""
+    call = client.register_script.return_value.call_args
+    args = call.kwargs["args"]
+    return call.kwargs["keys"], args[1], args[2], dict(zip(args[3::2], args[4::2]))
+
+
+class TestFailedRecordsBulk:
+    """Tests for DataManager.get_all_failed_records_bulk()."""
+
+    def test_reads_values_with_single_mget(self, data_manager, mock_redis_client):
+        """Records should be fetched with one MGET rather than a GET per key."""
+        keys = [f"safetyamp:failed_sync:employee:{i}" for i in range(3)]
+        mock_redis_client.scan_iter.return_value = iter(keys)
+        mock_redis_client.mget.return_value = [
+            json.dumps({"entity_id": str(i)}) for i in range(3)
+        ]
+
+        records = data_manager.get_all_failed_records_bulk()
+
+        assert [r["entity_id"] for r in records] == ["0", "1", "2"]
+        mock_redis_client.mget.assert_called_once_with(keys)
+        mock_redis_client.get.assert_not_called()
+
+    def test_skips_expired_and_invalid_values(self, data_manager, mock_redis_client):
+        """Keys that expired or hold invalid JSON should be skipped."""
+        mock_redis_client.scan_iter.return_value = iter(["a", "b", "c"])
+        mock_redis_client.mget.return_value = [None, "not-json", '{"entity_id": "c"}']
+
+        records = data_manager.get_all_failed_records_bulk()
+
+        assert records == [{"entity_id": "c"}]
+
+    def test_batches_mget_calls(self, data_manager, mock_redis_client):
+        """Large key sets should be split into MGET_BATCH_SIZE chunks."""
+        data_manager.MGET_BATCH_SIZE = 2
+        mock_redis_client.scan_iter.return_value = iter(["a", "b", "c"])
+        mock_redis_client.mget.side_effect = lambda keys: ["{}"] * len(keys)
+
+        records = data_manager.get_all_failed_records_bulk()
+
+        assert len(records) == 3
+        assert mock_redis_client.mget.call_count == 2
+
+    def test_respects_limit(self, data_manager, mock_redis_client):
+        """get_all_failed_records should keep its default limit."""
+        keys = [f"k{i}" for i in range(150)]
+        mock_redis_client.scan_iter.return_value = iter(keys)
+        mock_redis_client.mget.side_effect = lambda keys: ["{}"] * len(keys)
+
+        records = data_manager.get_all_failed_records()
+
+        assert len(records) == 100
+
+    def test_returns_empty_without_redis(self, data_manager):
+        """Without Redis, bulk reads should return an empty list."""
+        data_manager.redis_client = None
+
+        assert data_manager.get_all_failed_records_bulk() == []
+
+
+class TestFailedSyncKeys:
+    """Tests for DataManager.get_failed_sync_keys()."""
+
+    def test_parses_entity_type_and_id(self, data_manager, mock_redis_client):
+        """Key names should be split into (entity_type, entity_id) pairs."""
+        mock_redis_client.scan_iter.return_value = iter(
+            [
+                "safetyamp:failed_sync:employee:123",
+                "safetyamp:failed_sync:vehicle:abc:def",
+            ]
+        )
+
+        pairs = data_manager.get_failed_sync_keys()
+
+        assert pairs == [("employee", "123"), ("vehicle", "abc:def")]
+        mock_redis_client.get.assert_not_called()
+
+    def test_returns_none_on_error(self, data_manager, mock_redis_client):
+        """Scan errors should return None so callers fall back to Redis."""
+        mock_redis_client.scan_iter.side_effect = Exception("down")
+
+        assert data_manager.get_failed_sync_keys() is None
+
+
+class TestMgetFailedSyncRecords:
+    """Tests for DataManager.mget_failed_sync_records()."""
+
+    def test_maps_ids_to_records(self, data_manager, mock_redis_client):
+        """Each id should map to its decoded record or None."""
+        mock_redis_client.mget.return_value = ['{"entity_id": "1"}', None, "bad"]
+
+        records = data_manager.mget_failed_sync_records("employee", [1, "2", "3"])
+
+        assert records == {"1": {"entity_id": "1"}, "2": None, "3": None}
+        mock_redis_client.mget.assert_called_once_with(
+            [
+                "safetyamp:failed_sync:employee:1",
+                "safetyamp:failed_sync:employee:2",
+                "safetyamp:failed_sync:employee:3",
+            ]
+        )
+        mock_redis_client.get.assert_not_called()
+
+    def test_batches_mget_calls(self, data_manager, mock_redis_client):
+        """Large id lists should be split into MGET_BATCH_SIZE chunks."""
+        data_manager.MGET_BATCH_SIZE = 2
+        mock_redis_client.mget.side_effect = lambda keys: [None] * len(keys)
+
+        records = data_manager.mget_failed_sync_records("employee", ["a", "b", "c"])
+
+        assert len(records) == 3
+        assert mock_redis_client.mget.call_count == 2
+
+    def test_returns_none_on_error(self, data_manager, mock_redis_client):
+        """Read errors should return None so callers fall back to GETs."""
+        mock_redis_client.mget.side_effect = Exception("down")
+
+        assert data_manager.mget_failed_sync_records("employee", ["1"]) is None
+
+
+class TestFailedSyncIndex:
+    """Tests for the expiry-scored failed sync index."""
+
+    def test_save_adds_index_entries(self, data_manager, mock_redis_client):
+        """Saving a record should index it globally and by entity type."""
+        pipe = mock_redis_client.pipeline.return_value
+
+        with patch("services.data_manager.time.time", return_value=1000.0):
+            assert data_manager.save_failed_sync_record("employee", "1", {}, 1)
+
+        pipe.setex.assert_called_once_with(
+            "safetyamp:failed_sync:employee:1", 86400, b"{}"
+        )
+        pipe.zadd.assert_any_call(
+            "safetyamp:failed_sync_index", {"employee:1": 87400.0}
+        )
+        pipe.zadd.assert_any_call(
+            "safetyamp:failed_sync_index:employee", {"1": 87400.0}
+        )
+        pipe.execute.assert_called_once()
+
+    def test_delete_removes_index_entries(self, data_manager, mock_redis_client):
+        """Deleting a record should remove it from both indexes."""
+        pipe = mock_redis_client.pipeline.return_value
+
+        assert data_manager.delete_failed_sync_record("employee", "1")
+
+        pipe.zrem.assert_any_call("safetyamp:failed_sync_index", "employee:1")
+        pipe.zrem.assert_any_call("safetyamp:failed_sync_index:employee", "1")
+
+    def test_count_prunes_expired_entries(self, data_manager, mock_redis_client):
+        """Counting should drop expired entries before ZCARD."""
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute.return_value = [[], 0, 5]
+
+        with patch("services.data_manager.time.time", return_value=1000.0):
+            count = data_manager.count_failed_sync_records("employee")
+
+        assert count == 5
+        pipe.zremrangebyscore.assert_called_once_with(
+            "safetyamp:failed_sync_index:employee", "-inf", 1000.0
+        )
+        mock_redis_client.scan_iter.assert_not_called()
+
+    def test_page_reads_only_requested_records(self, data_manager, mock_redis_client):
+        """A page should MGET only the members returned by ZREVRANGE."""
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute.return_value = [[], 0, ["employee:2", "vehicle:9"]]
+        mock_redis_client.mget.return_value = ['{"entity_id": "2"}', None]
+
+        records = data_manager.get_failed_sync_records_page(offset=10, limit=2)
+
+        assert records == [{"entity_id": "2"}]
+        pipe.zrevrange.assert_called_once_with("safetyamp:failed_sync_index", 10, 11)
+        mock_redis_client.mget.assert_called_once_with(
+            ["safetyamp:failed_sync:employee:2", "safetyamp:failed_sync:vehicle:9"]
+        )
+
+    def test_index_errors_return_none(self, data_manager, mock_redis_client):
+        """Index read errors should return None so callers can fall back."""
+        mock_redis_client.pipeline.side_effect = Exception("down")
+
+        assert data_manager.count_failed_sync_records() is None
+        assert data_manager.get_failed_sync_records_page() is None
+
+    def test_rebuild_scores_by_remaining_ttl(self, data_manager, mock_redis_client):
+        """Rebuilding should index existing records by their expiry time."""
+        mock_redis_client.scan_iter.return_value = iter(
+            ["safetyamp:failed_sync:employee:1", "safetyamp:failed_sync:employee:2"]
+        )
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute.side_effect = [[60, -2], []]
+
+        with patch("services.data_manager.time.time", return_value=1000.0):
+            assert data_manager.rebuild_failed_sync_index() is True
+
+        pipe.zadd.assert_any_call("safetyamp:failed_sync_index", {"employee:1": 1060.0})
+        assert pipe.zadd.call_count == 2
+
+
+class TestFailedSyncEntityType:
+    """Tests for the entity id to entity type lookup hash."""
+
+    def test_save_and_delete_maintain_lookup(self, data_manager, mock_redis_client):
+        """Saving sets the lookup entry and deleting removes it."""
+        pipe = mock_redis_client.pipeline.return_value
+        mock_redis_client.hmget.return_value = ["vehicle"]
+
+        data_manager.save_failed_sync_record("vehicle", "42", {})
+        pipe.execute.return_value = [None]
+        data_manager.delete_failed_sync_record("vehicle", "42")
+
+        pipe.hset.assert_called_once_with(
+            "safetyamp:failed_sync_by_entity_id", "42", "vehicle"
+        )
+        mock_redis_client.hdel.assert_called_once_with(
+            "safetyamp:failed_sync_by_entity_id", "42"
+        )
+
+    def test_delete_keeps_lookup_for_other_type(self, data_manager, mock_redis_client):
+        """Deleting one type should keep a lookup entry for a live other type."""
+        pipe = mock_redis_client.pipeline.return_value
+        mock_redis_client.hmget.return_value = ["employee"]
+        pipe.execute.return_value = [2000.0]
+
+        with patch("services.data_manager.time.time", return_value=1000.0):
+            data_manager.delete_failed_sync_record("vehicle", "42")
+
+        pipe.zscore.assert_called_once_with(
+            "safetyamp:failed_sync_index:employee", "42"
+        )
+        mock_redis_client.hdel.assert_not_called()
+
+    def test_lookup_checks_per_type_index(self, data_manager, mock_redis_client):
+        """A bare id resolves only while its record is still indexed."""
+        mock_redis_client.hget.return_value = "vehicle"
+        mock_redis_client.zscore.return_value = 2000.0
+
+        with patch("services.data_manager.time.time", return_value=1000.0):
+            assert data_manager.get_failed_sync_entity_type("42") == "vehicle"
+            mock_redis_client.zscore.return_value = 900.0
+            assert data_manager.get_failed_sync_entity_type("42") is None
+
+        mock_redis_client.zscore.assert_called_with(
+            "safetyamp:failed_sync_index:vehicle", "42"
+        )
+        mock_redis_client.scan_iter.assert_not_called()
+
+    def test_expiry_pruning_drops_lookup_entries(self, data_manager, mock_redis_client):
+        """Pruning expired index entries should also drop their lookup entries."""
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute.side_effect = [
+            [["employee:1", "vehicle:2"], 2, 0],
+            [900.0, 5000.0],
+        ]
+        mock_redis_client.hmget.return_value = ["employee", "employee"]
+
+        with patch("services.data_manager.time.time", return_value=1000.0):
+            assert data_manager.count_failed_sync_records() == 0
+
+        mock_redis_client.hmget.assert_called_once_with(
+            "safetyamp:failed_sync_by_entity_id", ["1", "2"]
+        )
+        mock_redis_client.hdel.assert_called_once_with(
+            "safetyamp:failed_sync_by_entity_id", "1"
+        )
+
+
+class TestSaveFailedSyncRecordsBulk:
+    """Tests for DataManager.save_failed_sync_records_bulk()."""
+
+    def test_writes_all_records_in_one_transaction(
+        self, data_manager, mock_redis_client
+    ):
+        """All records should be queued on one MULTI/EXEC pipeline."""
+        pipe = mock_redis_client.pipeline.return_value
+        records = [("employee", "1", {"a": 1}), ("vehicle", "2", {"b": 2})]
+
+        assert data_manager.save_failed_sync_records_bulk(records, ttl_days=1) == 2
+
+        mock_redis_client.pipeline.assert_called_once_with(transaction=True)
+        assert pipe.setex.call_count == 2
+        pipe.execute.assert_called_once()
+        mock_redis_client.setex.assert_not_called()
+
+    def test_returns_zero_on_error(self, data_manager, mock_redis_client):
+        """A failed transaction should report nothing saved."""
+        mock_redis_client.pipeline.return_value.execute.side_effect = Exception("x")
+
+        assert data_manager.save_failed_sync_records_bulk([("e", "1", {})]) == 0
+
+    def test_empty_batch_skips_redis(self, data_manager, mock_redis_client):
+        """An empty batch should not open a pipeline."""
+        assert data_manager.save_failed_sync_records_bulk([]) == 0
+        mock_redis_client.pipeline.assert_not_called()
+
+
+class TestCachePayloadEncoding:
+    """Tests for cache payload serialization."""
+
+    def test_round_trip_through_redis(self, data_manager, mock_redis_client, tmp_path):
+        """Saved payloads should read back unchanged."""
+        data_manager.cache_dir = tmp_path
+        data = {"1": {"name": "Site", "tags": ["a", "é"]}, "2": None}
+
+        data_manager.save_cache("sites", data)
+        _, _, stored, _ = _saved_entry(mock_redis_client)
+        mock_redis_client.get.return_value = stored
+
+        assert data_manager.get_cached_data("sites") == data
+
+    def test_save_encodes_json_once(self, data_manager, mock_redis_client, tmp_path):
+        """The Redis payload and the file cache should share one JSON encoding."""
+        from services import data_manager as module
+
+        data_manager.cache_dir = tmp_path
+        data_manager.cache_compress_min_bytes = 0
+        data = {"1": {"name": "Sité"}}
+
+        with patch.object(module, "_dumps", wraps=module._dumps) as dumps:
+            assert data_manager.save_cache("sites", data) is True
+
+        assert [c for c in dumps.call_args_list if c.args[0] is data] == [call(data)]
+        stored = _saved_entry(mock_redis_client)[2]
+        assert (tmp_path / "sites.json").read_bytes() == stored
+        data_manager.redis_client = None
+        assert data_manager.get_cached_data("sites") == data
+
+    def test_metadata_fields_are_compact_json(self):
+        """Metadata values should be compact JSON with str() for other types."""
+        from services.data_manager import _metadata_fields
+
+        fields = _metadata_fields({"keys": ["a", "b"], "rate": Decimal("1.5")})
+
+        assert fields["keys"] == b'["a","b"]'
+        assert json.loads(fields["rate"]) == "1.5"
+
+    def test_non_string_keys_match_stdlib(self):
+        """Integer keys should be stringified just as stdlib json does."""
+        from services.data_manager import _dumps, _loads
+
+        assert _loads(_dumps({1: "a"})) == json.loads(json.dumps({1: "a"}))
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Without orjson, payloads should still round-trip."""
+        from services import data_manager as module
+
+        monkeypatch.setattr(module, "orjson", None)
+
+        assert module._loads(module._dumps({"a": [1, 2]})) == {"a": [1, 2]}
+
+    def test_json_payloads_are_untagged(self):
+        """JSON payloads should stay plain so existing entries remain readable."""
+        from services.data_manager import _decode_cache_payload, _encode_cache_payload
+
+        payload = _encode_cache_payload({"a": 1}, "json")
+
+        assert json.loads(payload) == {"a": 1}
+        assert _decode_cache_payload(payload) == {"a": 1}
+
+    def test_msgpack_payloads_round_trip(self):
+        """MessagePack payloads should be tagged and keep integer map keys."""
+        pytest.importorskip("msgpack")
+        from services.data_manager import (
+            _MSGPACK_TAG,
+            _decode_cache_payload,
+            _encode_cache_payload,
+        )
+
+        payload = _encode_cache_payload({1: {"name": "Site"}}, "msgpack")
+
+        assert payload.startswith(_MSGPACK_TAG)
+        assert _decode_cache_payload(payload) == {1: {"name": "Site"}}
+
+    def test_msgspec_and_msgpack_payloads_are_interchangeable(self, monkeypatch):
+        """Either codec should read payloads written by the other."""
+        pytest.importorskip("msgspec")
+        pytest.importorskip("msgpack")
+        from services import data_manager as module
+
+        value = {1: {"name": "Site", "tags": ["a", "b"]}, "total": 2.5}
+        msgspec_payload = module._encode_cache_payload(value, "msgpack")
+
+        monkeypatch.setattr(module, "_MSGSPEC_ENCODER", None)
+        monkeypatch.setattr(module, "_MSGSPEC_DECODER", None)
+        msgpack_payload = module._encode_cache_payload(value, "msgpack")
+
+        assert module._decode_cache_payload(msgspec_payload) == value
+        monkeypatch.undo()
+        assert module._decode_cache_payload(msgpack_payload) == value
+
+    def test_msgpack_falls_back_to_json_when_missing(self, monkeypatch):
+        """Without a MessagePack codec, the msgpack setting should write JSON."""
+        from services import data_manager as module
+
+        monkeypatch.setattr(module, "msgpack", None)
+        monkeypatch.setattr(module, "_MSGSPEC_ENCODER", None)
+        monkeypatch.setattr(module, "_MSGSPEC_DECODER", None)
+        payload = module._encode_cache_payload({"a": 1}, "msgpack")
+
+        assert not payload.startswith(module._MSGPACK_TAG)
+        assert module._decode_cache_payload(payload) == {"a": 1}
+
+    def test_large_payloads_are_compressed(self):
+        """Payloads over the threshold should be zstd-tagged and round-trip."""
+        pytest.importorskip("zstandard")
+        from services.data_manager import (
+            _ZSTD_TAG,
+            _decode_cache_payload,
+            _encode_cache_payload,
+        )
+
+        value = [{"id": i, "name": f"Asset {i}"} for i in range(500)]
+        payload = _encode_cache_payload(value, "json", compress_min_bytes=1024)
+
+        assert payload.startswith(_ZSTD_TAG)
+        assert len(payload) < len(json.dumps(value))
+        assert _decode_cache_payload(payload) == value
+
+    def test_small_payloads_stay_uncompressed(self):
+        """Payloads under the threshold should be written as before."""
+        from services.data_manager import _decode_cache_payload, _encode_cache_payload
+
+        payload = _encode_cache_payload({"a": 1}, "json", compress_min_bytes=1024)
+
+        assert json.loads(payload) == {"a": 1}
+        assert _decode_cache_payload(payload) == {"a": 1}
+
+    def test_compressed_msgpack_payloads_round_trip(self):
+        """Compression should wrap MessagePack payloads as well."""
+        pytest.importorskip("zstandard")
+        pytest.importorskip("msgpack")
+        from services.data_manager import (
+            _ZSTD_TAG,
+            _decode_cache_payload,
+            _encode_cache_payload,
+        )
+
+        value = {i: {"name": f"Site {i}"} for i in range(200)}
+        payload = _encode_cache_payload(value, "msgpack", compress_min_bytes=1)
+
+        assert payload.startswith(_ZSTD_TAG)
+        assert _decode_cache_payload(payload) == value
+
+    def test_zstd_contexts_reused_per_thread(self):
+        """Each thread should build its zstd contexts once and keep them."""
+        pytest.importorskip("zstandard")
+        import threading
+
+        from services.data_manager import _zstd_codecs
+
+        assert _zstd_codecs() is _zstd_codecs()
+        other = []
+        thread = threading.Thread(target=lambda: other.append(_zstd_codecs()))
+        thread.start()
+        thread.join()
+        assert other[0] is not _zstd_codecs()
+
+    def test_compression_skipped_without_zstandard(self, monkeypatch):
+        """Without zstandard installed, large payloads should be stored raw."""
+        from services import data_manager as module
+
+        monkeypatch.setattr(module, "zstandard", None)
+        payload = module._encode_cache_payload({"a": 1}, "json", compress_min_bytes=1)
+
+        assert not payload.startswith(module._ZSTD_TAG)
+        assert module._decode_cache_payload(payload) == {"a": 1}
+
+
+class TestRedisConnectionPool:
+    """Tests for Redis client construction."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_pools(self, monkeypatch):
+        """Start each test without pools cached by earlier DataManagers."""
+        from services import data_manager as module
+
+        monkeypatch.setattr(module, "_REDIS_POOLS", {})
+
+    def _make_managers(self, count):
+        with patch("services.data_manager.redis.Redis") as MockRedis, patch(
+            "services.data_manager.redis.BlockingConnectionPool"
+        ) as MockPool, patch("services.data_manager.config") as mock_config:
+            mock_config.REDIS_HOST = "localhost"
+            mock_config.REDIS_PORT = "6379"
+            mock_config.REDIS_DB = "0"
+            mock_config.REDIS_PASSWORD = None
+            mock_config.REDIS_MAX_CONNECTIONS = 8
+            mock_config.CACHE_TTL_HOURS = "24"
+            mock_config.CACHE_REFRESH_INTERVAL_HOURS = "1"
+            mock_config.VISTA_REFRESH_MINUTES = "60"
+
+            from services.data_manager import DataManager
+
+            for _ in range(count):
+                DataManager()
+        return MockRedis, MockPool
+
+    def test_instances_reuse_process_pools(self):
+        """A second DataManager should reuse the pools of the first."""
+        MockRedis, MockPool = self._make_managers(2)
+
+        assert MockPool.call_count == 2
+        pools = [c.kwargs["connection_pool"] for c in MockRedis.call_args_list]
+        assert len(pools) == 4
+        assert pools[0] is pools[2] and pools[1] is pools[3]
+
+    def test_clients_share_blocking_pools_with_retry(self):
+        """Both clients should be built on health-checked, retrying pools."""
+        MockRedis, MockPool = self._make_managers(1)
+
+        pool_kwargs = [c.kwargs for c in MockPool.call_args_list]
+        assert [kw["decode_responses"] for kw in pool_kwargs] == [True, False]
+        for kw in pool_kwargs:
+            assert kw["max_connections"] == 8
+            assert kw["health_check_interval"] == 30
+            assert kw["retry"] is not None
+        assert all("connection_pool" in c.kwargs for c in MockRedis.call_args_list)
+
+
+class TestCacheTtl:
+    """Tests for cache TTL handling."""
+
+    def test_default_ttl_in_seconds(self, data_manager, mock_redis_client, tmp_path):
+        """Without an explicit TTL, writes should use the configured hours."""
+        data_manager.cache_dir = tmp_path
+
+        data_manager.save_cache("sites", {"1": "Site"})
+
+        _, ttl, _, fields = _saved_entry(mock_redis_client)
+        assert data_manager.cache_ttl_seconds == 24 * 3600
+        assert ttl == 24 * 3600
+        assert json.loads(fields["ttl_seconds"]) == 24 * 3600
+
+    def test_explicit_ttl_overrides_default(
+        self, data_manager, mock_redis_client, tmp_path
+    ):
+        """An explicit TTL should be used for both the data and metadata keys."""
+        data_manager.cache_dir = tmp_path
+
+        data_manager.save_cache("sites", {"1": "Site"}, ttl_seconds=90)
+
+        assert _saved_entry(mock_redis_client)[1] == 90
+
+
+class TestCacheMetadataHash:
+    """Tests for cache metadata stored as a Redis hash."""
+
+    def test_save_writes_payload_and_metadata_in_one_script(
+        self, data_manager, mock_redis_client, tmp_path
+    ):
+        """Payload and JSON-encoded metadata fields should go in one script call."""
+        data_manager.cache_dir = tmp_path
+
+        data_manager.save_cache(
+            "sites", {"1": "Site"}, metadata={"source": "sync", "items": 1}
+        )
+
+        keys, _, _, fields = _saved_entry(mock_redis_client)
+        assert keys == ["safetyamp:{sites}", "safetyamp:{sites}:metadata"]
+        mock_redis_client.register_script.return_value.assert_called_once()
+        mock_redis_client.setex.assert_not_called()
+        assert json.loads(fields["source"]) == "sync"
+        assert json.loads(fields["items"]) == 1
+        assert isinstance(json.loads(fields["last_updated"]), float)
+
+    def test_unchanged_payload_has_same_data_hash(
+        self, data_manager, mock_redis_client, tmp_path
+    ):
+        """Identical data should hash the same so the script only extends TTLs."""
+        data_manager.cache_dir = tmp_path
+
+        script = mock_redis_client.register_script.return_value
+
+        def saved_hash(data):
+            data_manager.save_cache("sites", data)
+            fields = _saved_entry(mock_redis_client)[3]
+            # The compared hash is the one stored in the metadata
+            assert script.call_args.kwargs["args"][0] == fields["data_hash"]
+            return fields["data_hash"]
+
+        first = saved_hash({"1": "Site"})
+
+        assert saved_hash({"1": "Site"}) == first
+        assert saved_hash({"1": "Other"}) != first
+
+    def test_data_hash_covers_stored_bytes(
+        self, data_manager, mock_redis_client, tmp_path
+    ):
+        """The fingerprint should be taken over the compressed payload."""
+        import hashlib
+
+        data_manager.cache_dir = tmp_path
+        data_manager.cache_compress_min_bytes = 1
+
+        data_manager.save_cache("sites", {"1": "Site" * 100})
+
+        _, _, payload, fields = _saved_entry(mock_redis_client)
+        assert payload[:1] == b"\x02"
+        assert json.loads(fields["data_hash"]) == (
+            hashlib.blake2b(payload, digest_size=16).hexdigest()
+        )
+
+    def test_validity_reads_single_field(self, data_manager, mock_redis_client):
+        """is_cache_valid should HGET last_updated instead of parsing a blob."""
+        mock_redis_client.hget.return_value = json.dumps(time.time() - 60)
+
+        assert data_manager.is_cache_valid("sites", max_age_hours=1) is True
+        mock_redis_client.hget.assert_called_once_with(
+            "safetyamp:{sites}:metadata", "last_updated"
+        )
+        mock_redis_client.get.assert_not_called()
+
+    def test_refresh_needed_without_last_refresh(self, data_manager, mock_redis_client):
+        """A missing last_refresh field should request a refresh."""
+        mock_redis_client.hget.return_value = None
+
+        assert data_manager.should_refresh_cache("sites") is True
+
+    def test_mark_refreshed_merges_fields_without_shortening_ttl(
+        self, data_manager, mock_redis_client, tmp_path
+    ):
+        """Refresh marks should update fields in place and only extend the TTL."""
+        data_manager.cache_dir = tmp_path
+        pipe = mock_redis_client.pipeline.return_value
+
+        assert data_manager.mark_cache_refreshed("sites") is True
+
+        pipe.unlink.assert_not_called()
+        mock_redis_client.setex.assert_not_called()
+        mapping = pipe.hset.call_args.kwargs["mapping"]
+        assert isinstance(json.loads(mapping["last_refresh"]), float)
+        ttl = data_manager.cache_ttl_seconds
+        assert pipe.expire.call_args_list == [
+            (("safetyamp:{sites}:metadata", ttl), {"nx": True}),
+            (("safetyamp:{sites}:metadata", ttl), {"gt": True}),
+        ]
+
+
+class TestLocalReadCache:
+    """Tests for the in-process cache of recent Redis reads."""
+
+    @pytest.fixture
+    def local_dm(self, data_manager, mock_redis_client):
+        from services.data_manager import _encode_cache_payload
+
+        data_manager._local_cache_ttl = 30
+        mock_redis_client.get.return_value = _encode_cache_payload({"1": "Site"})
+        return data_manager
+
+    def test_repeat_read_skips_redis(self, local_dm, mock_redis_client):
+        """A second read within the soft TTL should be served locally."""
+        assert local_dm.get_cached_data("sites") == {"1": "Site"}
+        assert local_dm.get_cached_data("sites") == {"1": "Site"}
+
+        mock_redis_client.get.assert_called_once_with("safetyamp:{sites}")
+
+    def test_expired_entry_reads_redis_again(self, local_dm, mock_redis_client):
+        """Entries older than the soft TTL should be refetched."""
+        with patch("services.data_manager.time.monotonic", side_effect=[0, 31, 31]):
+            local_dm.get_cached_data("sites")
+            local_dm.get_cached_data("sites")
+
+        assert mock_redis_client.get.call_count == 2
+
+    def test_invalidate_drops_local_entries(
+        self, local_dm, mock_redis_client, tmp_path
+    ):
+        """Invalidation should drop every local entry under the cache name."""
+        local_dm.cache_dir = tmp_path
+        local_dm.get_cached_data("sites")
+        local_dm.get_cached_data("sites", "a")
+        local_dm.get_cached_data("jobs")
+        mock_redis_client.scan_iter.return_value = iter([])
+
+        local_dm.invalidate_cache("sites")
+
+        assert list(local_dm._local_cache) == [("jobs", None)]
+
+    def test_save_refreshes_local_entry(self, local_dm, mock_redis_client, tmp_path):
+        """Saved data should be what later local reads return."""
+        local_dm.cache_dir = tmp_path
+        local_dm.get_cached_data("sites")
+
+        local_dm.save_cache("sites", {"2": "New"})
+
+        assert local_dm.get_cached_data("sites") == {"2": "New"}
+        mock_redis_client.get.assert_called_once()
+
+    def test_callers_get_independent_copies(self, local_dm):
+        """Changing a returned result should not affect later reads."""
+        local_dm.get_cached_data("sites")["1"] = "Changed"
+
+        assert local_dm.get_cached_data("sites") == {"1": "Site"}
+
+    def test_fresh_read_uses_local_entry_within_max_age(
+        self, local_dm, mock_redis_client, tmp_path
+    ):
+        """Fallback reads should be served locally only while within max age."""
+        local_dm.cache_dir = tmp_path
+        with patch("services.data_manager.time.time", return_value=1000.0):
+            local_dm.save_cache("sites", {"1": "Site"})
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute.reset_mock()
+        pipe.execute.return_value = [None, None]
+
+        with patch("services.data_manager.time.time", return_value=1600.0):
+            assert local_dm._get_fresh_cached_data("sites", 3600) == {"1": "Site"}
+            pipe.execute.assert_not_called()
+            local_dm._get_fresh_cached_data("sites", 300)
+        pipe.execute.assert_called_once()
+
+    def test_batch_read_serves_local_entries(self, local_dm, mock_redis_client):
+        """Names kept locally should not be read from Redis in a batch."""
+        from services.data_manager import _encode_cache_payload
+
+        local_dm._local_put(
+            "sites", None, _encode_cache_payload({"1": "Site"}), time.time()
+        )
+        pipe = mock_redis_client.pipeline.return_value
+
+        result = local_dm.get_many_cached_with_fallback([("sites", MagicMock(), 1)])
+
+        assert result == {"sites": {"1": "Site"}}
+        pipe.execute.assert_not_called()
+
+    def test_entries_are_bounded(self, local_dm):
+        """The least recently used entry should be evicted past the limit."""
+        local_dm.LOCAL_CACHE_MAX_ENTRIES = 2
+        local_dm.get_cached_data("sites", "a")
+        local_dm.get_cached_data("sites", "b")
+        local_dm.get_cached_data("sites", "a")
+        local_dm.get_cached_data("sites", "c")
+
+        assert list(local_dm._local_cache) == [("sites", "a"), ("sites", "c")]
+
+
+class TestFreshCacheReads:
+    """Tests for fused metadata and payload cache reads."""
+
+    def _stored(self, data_manager, mock_redis_client, tmp_path, data):
+        data_manager.cache_dir = tmp_path
+        data_manager.save_cache("sites", data)
+        _, _, payload, fields = _saved_entry(mock_redis_client)
+        pipe = mock_redis_client.pipeline.return_value
+        return pipe, fields["last_updated"], payload
+
+    def test_fresh_hit_uses_single_round_trip(
+        self, data_manager, mock_redis_client, tmp_path
+    ):
+        """A fresh entry should be served from one pipeline with no extra GETs."""
+        pipe, last_updated, payload = self._stored(
+            data_manager, mock_redis_client, tmp_path, {"1": "Site"}
+        )
+        pipe.execute.reset_mock()
+        pipe.execute.return_value = [last_updated, payload]
+        loader = MagicMock()
+
+        result = data_manager.get_cached_data_with_fallback("sites", loader)
+
+        assert result == {"1": "Site"}
+        pipe.execute.assert_called_once()
+        pipe.hget.assert_called_once_with("safetyamp:{sites}:metadata", "last_updated")
+        pipe.get.assert_called_once_with("safetyamp:{sites}")
+        mock_redis_client.get.assert_not_called()
+        loader.assert_not_called()
+
+    def test_expired_entry_is_not_decoded(
+        self, data_manager, mock_redis_client, tmp_path
+    ):
+        """Stale metadata should skip decoding and trigger a fresh fetch."""
+        pipe, last_updated, _ = self._stored(
+            data_manager, mock_redis_client, tmp_path, {"1": "Site"}
+        )
+        stale = json.dumps(json.loads(last_updated) - 7200)
+        pipe.execute.return_value = [stale, b"\x01broken"]
+
+        with patch("services.data_manager._decode_cache_payload") as decode:
+            result = data_manager.get_cached_data_with_fallback(
+                "sites", lambda: {"2": "New"}
+            )
+
+        decode.assert_not_called()
+        assert result == {"2": "New"}
+
+    def test_missing_metadata_falls_back_to_file_check(
+        self, data_manager, mock_redis_client, tmp_path
+    ):
+        """Entries without Redis metadata should use the existing checks."""
+        data_manager.cache_dir = tmp_path
+        mock_redis_client.pipeline.return_value.execute.return_value = [None, None]
+
+        with patch.object(
+            data_manager, "get_cached_data", return_value={"1": "Site"}
+        ), patch.object(data_manager, "_is_cache_fresh", return_value=True):
+            assert data_manager._get_fresh_cached_data("sites", 3600) == {"1": "Site"}
+
+    def test_advanced_read_uses_exact_ttl_seconds(
+        self, data_manager, mock_redis_client, tmp_path
+    ):
+        """Sub-hour TTLs should not be rounded up to a whole hour."""
+        pipe, last_updated, payload = self._stored(
+            data_manager, mock_redis_client, tmp_path, {"1": "Site"}
+        )
+        aged = json.dumps(json.loads(last_updated) - 600)
+        pipe.execute.return_value = [aged, payload]
+        loader = MagicMock(return_value={"2": "New"})
+
+        result = data_manager.get_cached_data_with_fallback_advanced(
+            "sites", None, loader, ttl_seconds=300, lock=False
+        )
+
+        assert result == {"2": "New"}
+        loader.assert_called_once()
+
+    def test_reads_record_hit_miss_and_refresh_metrics(
+        self, data_manager, mock_redis_client, tmp_path
+    ):
+        """Fallback reads should count hits, misses and refreshes per cache."""
+        from prometheus_client import REGISTRY
+
+        def sample(name):
+            value = REGISTRY.get_sample_value(name, {"cache": "sites"})
+            return value or 0.0
+
+        names = (
+            "safetyamp_cache_hits_total",
+            "safetyamp_cache_misses_total",
+            "safetyamp_cache_refresh_total",
+            "safetyamp_cache_read_latency_seconds_count",
+        )
+        before = {name: sample(name) for name in names}
+        pipe, last_updated, payload = self._stored(
+            data_manager, mock_redis_client, tmp_path, {"1": "Site"}
+        )
+        pipe.execute.return_value = [last_updated, payload]
+        data_manager.get_cached_data_with_fallback("sites", MagicMock())
+        pipe.execute.return_value = [None, None]
+        data_manager.get_cached_data_with_fallback("sites", lambda: {"2": "New"})
+
+        assert {name: sample(name) - before[name] for name in names} == {
+            "safetyamp_cache_hits_total": 1,
+            "safetyamp_cache_misses_total": 1,
+            "safetyamp_cache_refresh_total": 1,
+            "safetyamp_cache_read_latency_seconds_count": 2,
+        }
+
+
+class TestCacheKeyspaceOperations:
+    """Tests for cache info and invalidation over the keyspace."""
+
+    def test_cache_info_scans_and_pipelines(self, data_manager, mock_redis_client):
+        """Cache info should use SCAN and pipelined lookups, never KEYS."""
+        mock_redis_client.scan_iter.return_value = iter(
+            ["safetyamp:{sites}", "safetyamp:{sites}:metadata", "safetyamp:idx"]
+        )
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute.side_effect = [[3600, "string", -1, "zset"], [42, 7]]
+
+        info = data_manager.get_cache_info()
+
+        mock_redis_client.keys.assert_not_called()
+        mock_redis_client.get.assert_not_called()
+        assert info["total_keys"] == 3
+        assert info["caches"]["sites"]["size_bytes"] == 42
+        assert info["caches"]["sites"]["expires_in"] == "1h 0m"
+        assert info["caches"]["idx"]["size_bytes"] == 7
+        pipe.strlen.assert_called_once_with("safetyamp:{sites}")
+
+    def test_cache_stats_pipelines_lookups(self, data_manager, mock_redis_client):
+        """Cache stats should pipeline TTL, type and size lookups per batch."""
+        mock_redis_client.scan_iter.return_value = iter(
+            ["safetyamp:{sites}", "safetyamp:{sites}:metadata", "safetyamp:queue"]
+        )
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute.side_effect = [[3600, "string", -2, "list"], [2048, 5]]
+
+        stats = data_manager.get_cache_stats()
+
+        mock_redis_client.get.assert_not_called()
+        mock_redis_client.ttl.assert_not_called()
+        assert pipe.execute.call_count == 2
+        assert stats["caches"]["sites"]["size_bytes"] == 2048
+        assert stats["caches"]["sites"]["valid"] is True
+        assert stats["caches"]["queue"]["size_bytes"] == 5
+        assert stats["caches"]["queue"]["valid"] is False
+        assert "sites:metadata" not in stats["caches"]
+
+    def test_invalidate_pipelines_deletes(
+        self, data_manager, mock_redis_client, tmp_path
+    ):
+        """Pattern invalidation should batch UNLINKs on a pipeline."""
+        data_manager.cache_dir = tmp_path
+        data_manager.PIPELINE_BATCH_SIZE = 2
+        mock_redis_client.scan_iter.return_value = iter(["a", "b", "c"])
+        pipe = mock_redis_client.pipeline.return_value
+
+        assert data_manager.invalidate_cache("sites") is True
+
+        mock_redis_client.scan_iter.assert_called_once_with(
+            match="safetyamp:{sites}*", count=data_manager.SCAN_COUNT
+        )
+        assert pipe.unlink.call_count == 3
+        assert pipe.execute.call_count == 2
+        pipe.delete.assert_not_called()
+        mock_redis_client.delete.assert_not_called()
+
+    def test_invalidate_single_key_unlinks_data_and_metadata(
+        self, data_manager, mock_redis_client, tmp_path
+    ):
+        """Keyed invalidation should UNLINK the payload and its metadata."""
+        data_manager.cache_dir = tmp_path
+
+        assert data_manager.invalidate_cache("sites", key="42") is True
+
+        mock_redis_client.unlink.assert_called_once_with(
+            "safetyamp:{sites}:42", "safetyamp:{sites}:42:metadata"
+        )
+        mock_redis_client.delete.assert_not_called()
+
+    def test_keys_share_a_cluster_hash_tag(self, data_manager):
+        """Payload and metadata keys should hash-tag the cache name."""
+        assert data_manager._get_cache_key("sites", "42") == "safetyamp:{sites}:42"
+        assert data_manager._get_metadata_key("sites") == "safetyamp:{sites}:metadata"
+        assert data_manager._cache_name_from_key("safetyamp:{sites}:42") == "sites:42"
+
+
+class TestManyCachedReads:
+    """Tests for get_many_cached_with_fallback()."""
+
+    def test_reads_all_names_in_one_round_trip(self, data_manager, mock_redis_client):
+        """Fresh entries come from one pipeline; stale ones refetch directly."""
+        from services.data_manager import _encode_cache_payload
+
+        now = time.time()
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute.return_value = [
+            json.dumps(now - 60),
+            _encode_cache_payload({"1": "Site"}),
+            json.dumps(now - 7200),
+            _encode_cache_payload({"1": "Old"}),
+            None,
+            None,
+        ]
+        roles_loader, titles_loader = MagicMock(), MagicMock()
+        with patch.object(
+            data_manager, "get_cached_data_with_fallback", return_value={"2": "New"}
+        ) as single:
+            result = data_manager.get_many_cached_with_fallback(
+                [
+                    ("sites", MagicMock(), 1),
+                    ("roles", roles_loader, 1),
+                    ("titles", titles_loader, 1),
+                ]
+            )
+
+        assert result == {
+            "sites": {"1": "Site"},
+            "roles": {"2": "New"},
+            "titles": {"2": "New"},
+        }
+        pipe.execute.assert_called_once()
+        assert single.call_args_list == [
+            (("roles", roles_loader, 1), {"force_refresh": True}),
+            (("titles", titles_loader, 1), {"force_refresh": False}),
+        ]
+
+    def test_redis_failure_uses_single_name_path(self, data_manager, mock_redis_client):
+        """A failed batch read should fall back to per-name reads."""
+        mock_redis_client.pipeline.return_value.execute.side_effect = Exception("down")
+        with patch.object(
+            data_manager, "get_cached_data_with_fallback", return_value={}
+        ) as single:
+            data_manager.get_many_cached_with_fallback([("sites", MagicMock(), 1)])
+
+        assert single.call_args.kwargs == {"force_refresh": False}
@@ -5,6 +5,7 @@ Tests cover:
 - Pattern detection for common sync errors
 - Suggestion generation with actionable recommendations
 - Error categorization and severity assignment
+- Classifying repeated error messages once per analysis
 - Aggregating errors from multiple sources
 """
 
@@ -42,6 +43,15 @@ class TestErrorAnalyzer:
         )
         return analyzer
 
+    def test_suggestion_ids_are_stable_short_hashes(self, analyzer):
+        """Suggestion ids should be deterministic and keep the sug_ + 8 hex form."""
+        first = analyzer._generate_suggestion_id("dup:email", ["2", "1"])
+
+        assert first == analyzer._generate_suggestion_id("dup:email", ["1", "2"])
+        assert first != analyzer._generate_suggestion_id("dup:phone", ["1", "2"])
+        assert first.startswith("sug_") and len(first) == 12
+        int(first[4:], 16)
+
     def test_analyze_returns_suggestions_list(self, analyzer):
         """analyze should return a list of suggestions."""
         suggestions = analyzer.analyze()
@@ -307,6 +317,30 @@ class TestErrorAnalyzer:
         high_severity = [s for s in suggestions if s["severity"] == "high"]
         assert len(high_severity) >= 1
 
+    def test_coalesced_error_counts_every_occurrence(
+        self, analyzer, mock_event_manager
+    ):
+        """A coalesced record should count as many occurrences as it recorded."""
+        now = datetime.now(timezone.utc)
+        mock_event_manager.error_notifier.errors = [
+            {
+                # The run began before the window but is still repeating
+                "timestamp": (now - timedelta(hours=25)).isoformat(),
+                "last_timestamp": now.isoformat(),
+                "error_type": "api_error",
+                "entity_type": "employee",
+                "entity_id": "12345",
+                "error_message": "Some random error",
+                "error_details": {},
+                "count": 50,
+            }
+        ]
+
+        suggestions = analyzer.analyze()
+
+        assert suggestions[0]["occurrence_count"] == 50
+        assert suggestions[0]["severity"] == "high"
+
     def test_severity_low_for_single_occurrence(self, analyzer, mock_event_manager):
         """Single occurrence errors should have low or medium severity."""
         now = datetime.now(timezone.utc)
@@ -455,6 +489,71 @@ class TestErrorAnalyzerPatternMatching:
         field2 = analyzer._extract_field("The mobile phone has already been taken.")
         assert field2 == "mobile_phone"
 
+    def test_categorize_precedence_matches_pattern_order(self, analyzer):
+        """Earlier categories should win when a message matches several."""
+        category = analyzer._categorize_error(
+            "Duplicate entry caused connection reset", "connection_error"
+        )
+        assert category == "duplicate_field"
+
+        category2 = analyzer._categorize_error("Unknown failure", "validation_error")
+        assert category2 == "validation"
+
+        assert analyzer._categorize_error("Something odd", "api_error") == "unknown"
+
+    def test_group_errors_classifies_each_message_once(self, analyzer):
+        """Identical messages should be categorized once per analysis."""
+        errors = [
+            {
+                "error_message": "The email has already been taken.",
+                "error_type": "api_error",
+                "entity_id": str(i),
+                "timestamp": "2024-01-01T00:00:00+00:00",
+            }
+            for i in range(5)
+        ]
+
+        with patch.object(
+            analyzer, "_categorize_error", wraps=analyzer._categorize_error
+        ) as categorize:
+            groups = analyzer._group_errors(errors, [])
+
+        assert categorize.call_count == 1
+        assert len(groups["duplicate_field:email"]["affected_records"]) == 5
+        assert groups["duplicate_field:email"]["occurrences"] == 5
+
+    def test_group_errors_tracks_failed_record_window(self, analyzer):
+        """Failed records should group on their first field and earliest failure."""
+        records = [
+            {
+                "entity_id": "1",
+                "failure_reason": "duplicate_fields",
+                "failed_fields": {"email": {}, "mobile_phone": {}},
+                "first_failed_at": "2024-01-02T00:00:00+00:00",
+            },
+            {
+                "entity_id": "2",
+                "failure_reason": "duplicate_fields",
+                "failed_fields": {"email": {}},
+                "first_failed_at": "2024-01-01T00:00:00Z",
+            },
+            {
+                "entity_id": "3",
+                "failure_reason": "something_else",
+                "failed_fields": {},
+                "first_failed_at": "",
+            },
+        ]
+
+        groups = analyzer._group_errors([], records)
+
+        email_group = groups["duplicate_field:email"]
+        assert email_group["affected_records"] == {"1", "2"}
+        assert email_group["occurrences"] == 2
+        assert email_group["first_seen"].isoformat() == "2024-01-01T00:00:00+00:00"
+        assert groups["unknown:general"]["field"] is None
+        assert groups["unknown:general"]["first_seen"] is None
+
     def test_calculate_severity(self, analyzer):
         """Should calculate severity based on occurrence count."""
         assert analyzer._calculate_severity(1, "duplicate_field") == "low"
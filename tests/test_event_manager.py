@@ -0,0 +1,318 @@
+"""
+Unit tests for the EventManager error notifier.
+
+Tests cover:
+- Coalescing identical consecutive errors into a single counted record
+- Persisting error records to the on-disk error log from the writer thread
+- Running hourly notifications off the caller's thread
+- Filtering records by time window across timestamp formats
+- Skipping change session files older than the reporting window
+- Resetting per-pass failure record caches when a sync starts
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+
+@pytest.fixture
+def notifier(tmp_path):
+    """Create an error notifier writing into a temporary directory."""
+    from services.event_manager import _ErrorNotifier
+
+    notifier = _ErrorNotifier(data_dir=str(tmp_path / "errors"))
+    yield notifier
+    notifier.close()
+
+
+class TestErrorNotifierCoalescing:
+    """Tests for duplicate error coalescing."""
+
+    def test_identical_errors_are_coalesced(self, notifier):
+        """Repeats of the same error should bump a counter, not append."""
+        for _ in range(5):
+            notifier.log_error("api_error", "employee", "123", "boom")
+
+        assert len(notifier.errors) == 1
+        assert notifier.errors[0]["count"] == 5
+        assert "last_timestamp" in notifier.errors[0]
+
+    def test_notification_status_counts_repeats(self, notifier):
+        """The hourly total should include every coalesced repeat."""
+        for _ in range(50):
+            notifier.log_error("api_error", "employee", "123", "boom")
+
+        assert notifier.get_notification_status()["total_errors_last_hour"] == 50
+
+    def test_different_entity_starts_new_record(self, notifier):
+        """A different entity id should produce a separate record."""
+        notifier.log_error("api_error", "employee", "123", "boom")
+        notifier.log_error("api_error", "employee", "456", "boom")
+        notifier.log_error("api_error", "employee", "123", "boom")
+
+        assert len(notifier.errors) == 3
+        assert all(e["count"] == 1 for e in notifier.errors)
+
+    def test_errors_outside_window_are_not_coalesced(self, notifier):
+        """Repeats after the coalesce window should append a new record."""
+        notifier.log_error("api_error", "employee", "123", "boom")
+        notifier._last_ts -= notifier.COALESCE_WINDOW_SECONDS + 1
+        notifier.log_error("api_error", "employee", "123", "boom")
+
+        assert len(notifier.errors) == 2
+
+    def test_long_run_stays_in_hourly_window(self, notifier):
+        """A flood longer than the window should still count its recent repeats."""
+        for _ in range(240):  # one error every 30s for two hours
+            notifier.log_error("api_error", "employee", "123", "boom")
+            notifier._last_ts -= 30
+            notifier._run_started -= 30
+
+        assert [e["count"] for e in notifier.errors] == [10] * 24
+        # Backdate records as if the run had taken two hours of wall time
+        start = datetime.now(timezone.utc) - timedelta(hours=2)
+        total = 0
+        for i, e in enumerate(notifier.errors):
+            first = start + timedelta(minutes=5 * i)
+            e["timestamp"] = first.isoformat()
+            e["last_timestamp"] = (first + timedelta(seconds=270)).isoformat()
+            total += e["count"]
+
+        assert total == 240
+        assert notifier.get_notification_status()["total_errors_last_hour"] == 120
+
+
+class TestErrorNotifierWriter:
+    """Tests for the background writer thread."""
+
+    def _read_lines(self, notifier):
+        text = notifier.errors_file.read_text(encoding="utf-8")
+        return [json.loads(line) for line in text.splitlines()]
+
+    def test_new_record_is_persisted(self, notifier):
+        """First occurrence of an error should be appended as a JSON line."""
+        notifier.log_error("api_error", "employee", "123", "boom")
+        assert notifier.flush()
+
+        saved = self._read_lines(notifier)
+        assert len(saved) == 1
+        assert saved[0]["entity_id"] == "123"
+
+    def test_coalesced_count_survives_reload(self, notifier):
+        """The final count of a coalesced run should be restored on reload."""
+        from services.event_manager import _ErrorNotifier
+
+        for _ in range(3):
+            notifier.log_error("api_error", "employee", "123", "boom")
+        notifier.log_error("api_error", "employee", "456", "boom")
+        assert notifier.flush()
+
+        reloaded = _ErrorNotifier(data_dir=str(notifier.data_dir))
+        assert [e["count"] for e in reloaded.errors] == [3, 1]
+
+    def test_flush_writes_running_count(self, tmp_path):
+        """Flushing should persist the count of a repeat that is still running."""
+        from services.event_manager import _ErrorNotifier
+
+        data_dir = tmp_path / "errors"
+        notifier = _ErrorNotifier(data_dir=str(data_dir))
+        for _ in range(3):
+            notifier.log_error("api_error", "employee", "123", "boom")
+        assert notifier.flush()
+
+        reloaded = _ErrorNotifier(data_dir=str(data_dir))
+        assert [e["count"] for e in reloaded.errors] == [3]
+
+    def test_legacy_json_array_is_loaded(self, tmp_path):
+        """An error log written in the old JSON array format should still load."""
+        from services.event_manager import _ErrorNotifier
+
+        data_dir = tmp_path / "errors"
+        data_dir.mkdir()
+        (data_dir / "error_log.json").write_text(
+            json.dumps([{"timestamp": "2024-01-01T00:00:00+00:00"}]),
+            encoding="utf-8",
+        )
+
+        notifier = _ErrorNotifier(data_dir=str(data_dir))
+        assert len(notifier.errors) == 1
+
+    def test_hourly_notification_runs_on_writer_thread(self, notifier):
+        """Hourly notification should be queued and marked sent by the writer."""
+        notifier.log_error("api_error", "employee", "123", "boom")
+
+        assert notifier.send_hourly_notification() is True
+        assert notifier.flush()
+        assert notifier.last_notification_file.exists()
+
+    def test_hourly_notification_without_errors_is_not_queued(self, notifier):
+        """With nothing logged in the last hour there is nothing to send."""
+        assert notifier.send_hourly_notification() is False
+        assert notifier.flush()
+        assert not notifier.last_notification_file.exists()
+
+    def test_close_stops_writer_after_writing(self, notifier):
+        """Closing should persist pending counts and stop the writer thread."""
+        from services import event_manager as module
+
+        for _ in range(3):
+            notifier.log_error("api_error", "employee", "123", "boom")
+        notifier.close()
+
+        assert not notifier._writer.is_alive()
+        assert notifier not in module._open_notifiers
+        assert [r["count"] for r in self._read_lines(notifier)] == [1, 3]
+        notifier.close()  # closing twice is a no-op
+
+
+class TestErrorNotifierLazyHistory:
+    """Tests for on-demand loading of the error history."""
+
+    def _write_log(self, data_dir, records):
+        data_dir.mkdir(parents=True, exist_ok=True)
+        (data_dir / "error_log.json").write_text(
+            "".join(json.dumps(r) + "\n" for r in records), encoding="utf-8"
+        )
+
+    def test_history_not_loaded_at_startup(self, tmp_path):
+        """Constructing the notifier should not read the error log."""
+        from services.event_manager import _ErrorNotifier
+
+        self._write_log(tmp_path, [{"timestamp": "2024-01-01T00:00:00+00:00"}])
+
+        notifier = _ErrorNotifier(data_dir=str(tmp_path))
+        assert notifier._errors is None
+
+    def test_recent_errors_read_from_log_tail(self, tmp_path):
+        """get_errors_since should only return records inside the window."""
+        from datetime import datetime, timedelta, timezone
+        from services.event_manager import _ErrorNotifier
+
+        now = datetime.now(timezone.utc)
+        self._write_log(
+            tmp_path,
+            [
+                {"timestamp": (now - timedelta(days=2)).isoformat(), "entity_id": "1"},
+                {
+                    "timestamp": (now - timedelta(minutes=5)).isoformat(),
+                    "entity_id": "2",
+                },
+            ],
+        )
+
+        notifier = _ErrorNotifier(data_dir=str(tmp_path))
+        notifier.log_error("api_error", "employee", "3", "boom")
+        recent = notifier.get_errors_since(1)
+
+        assert [e["entity_id"] for e in recent] == ["2", "3"]
+        assert notifier._errors is None
+
+    def test_window_filter_handles_other_timestamp_forms(self, tmp_path):
+        """Timestamps not written by the notifier should still be parsed."""
+        from datetime import datetime, timedelta, timezone
+        from services.event_manager import _ErrorNotifier
+
+        plus_two = timezone(timedelta(hours=2))
+        now = datetime.now(timezone.utc)
+        old = now - timedelta(hours=3)
+        recent = now - timedelta(minutes=5)
+        self._write_log(
+            tmp_path,
+            [
+                {"timestamp": old.isoformat(), "entity_id": "1"},
+                {"timestamp": old.astimezone(plus_two).isoformat(), "entity_id": "2"},
+                {"timestamp": recent.isoformat(), "entity_id": "3"},
+                {
+                    "timestamp": recent.astimezone(plus_two).isoformat(),
+                    "entity_id": "4",
+                },
+                {"timestamp": "not a timestamp", "entity_id": "5"},
+            ],
+        )
+
+        notifier = _ErrorNotifier(data_dir=str(tmp_path))
+
+        assert [e["entity_id"] for e in notifier.get_errors_since(1)] == ["3", "4"]
+
+    def test_full_history_loaded_on_access(self, tmp_path):
+        """Accessing errors should merge on-disk history with new records."""
+        from services.event_manager import _ErrorNotifier
+
+        self._write_log(tmp_path, [{"timestamp": "2024-01-01T00:00:00+00:00"}])
+
+        notifier = _ErrorNotifier(data_dir=str(tmp_path))
+        notifier.log_error("api_error", "employee", "3", "boom")
+
+        assert len(notifier.errors) == 2
+
+
+class TestChangeTrackerRecentChanges:
+    """Tests for aggregating recent changes from session files."""
+
+    def _write_session(self, output_dir, name, end_time, mtime):
+        import os
+
+        path = output_dir / f"{name}.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "session_id": name,
+                    "summary": {"end_time": end_time.isoformat()},
+                    "changes": {"created": [{"timestamp": end_time.isoformat()}]},
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_old_session_files_are_not_read(self, tmp_path, monkeypatch):
+        """Files last written before the window should be skipped unread."""
+        from datetime import datetime, timedelta, timezone
+        from pathlib import Path
+        from services.event_manager import _ChangeTracker
+
+        tracker = _ChangeTracker(output_dir=str(tmp_path))
+        now = datetime.now(timezone.utc)
+        recent = now - timedelta(hours=1)
+        old = now - timedelta(days=3)
+        self._write_session(tmp_path, "sync_2", recent, recent.timestamp())
+        self._write_session(tmp_path, "sync_1", old, old.timestamp())
+        read = []
+        original = Path.read_text
+
+        def tracking_read(path, *args, **kwargs):
+            read.append(path.name)
+            return original(path, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", tracking_read)
+
+        changes = tracker.get_recent_changes(24)
+
+        assert [c["session_id"] for c in changes] == ["sync_2"]
+        assert read == ["sync_2.json"]
+
+
+class TestEventManagerSessions:
+    """Tests for sync session lifecycle hooks."""
+
+    def test_start_sync_resets_failure_record_cache(
+        self, notifier, tmp_path, monkeypatch
+    ):
+        """Every sync pass should start with an empty failure record cache."""
+        from unittest.mock import MagicMock
+
+        from services.event_manager import EventManager, _ChangeTracker
+        from utils import failed_sync_tracker
+
+        tracker = MagicMock()
+        monkeypatch.setattr(failed_sync_tracker, "failed_sync_tracker", tracker)
+        manager = EventManager(
+            change_tracker=_ChangeTracker(output_dir=str(tmp_path / "changes")),
+            error_notifier=notifier,
+        )
+
+        manager.start_sync("jobs")
+
+        tracker.reset_record_cache.assert_called_once_with()
@@ -0,0 +1,558 @@
+"""
+Unit tests for the FailedSyncTracker.
+
+Tests cover:
+- Raw tokens for short scalar fields and hashing of larger values
+- Failure statistics aggregation
+- Local failure key index used to skip Redis lookups
+- Failure recording and error message truncation
+- Canonical JSON encoding for payload hashes
+- Failure categorization
+- Per-pass caching of failure record lookups
+- Batched prefetching of failure records
+- Retry skip shortcuts for missing hashes and field ordering
+- Index-backed failure counts and pagination
+- Resolving bare record ids without scanning failures
+- Decoding JSON error responses once per recorded failure
+- Bulk retry marking
+"""
+
+import hashlib
+from unittest.mock import MagicMock
+
+import pytest
+
+from utils.failed_sync_tracker import FailedSyncTracker
+
+
+def _blake2b(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@pytest.fixture
+def mock_data_manager():
+    """Mocked DataManager with no failure records."""
+    data_manager = MagicMock()
+    data_manager.get_failed_sync_record.return_value = None
+    data_manager.get_all_failed_records.return_value = []
+    data_manager.save_failed_sync_record.return_value = True
+    data_manager.delete_failed_sync_record.return_value = True
+    data_manager.count_failed_sync_records.return_value = None
+    data_manager.get_failed_sync_records_page.return_value = None
+    data_manager.get_failed_sync_entity_type.return_value = None
+    return data_manager
+
+
+@pytest.fixture
+def tracker(mock_data_manager, mock_config):
+    """Create a FailedSyncTracker backed by mocks."""
+    return FailedSyncTracker(mock_data_manager, mock_config)
+
+
+class TestComputeFieldHash:
+    """Tests for field-level hashing."""
+
+    def test_none_and_empty_share_empty_hash(self, tracker):
+        """None, empty and blank strings should share one token."""
+        assert tracker.compute_field_hash(None) == "raw:"
+        assert tracker.compute_field_hash("") == "raw:"
+        assert tracker.compute_field_hash("   ") == "raw:"
+
+    def test_short_scalars_stored_raw(self, tracker):
+        """Short scalar values should be compared without hashing."""
+        assert tracker.compute_field_hash(42) == "raw:42"
+        assert tracker.compute_field_hash(True) == "raw:True"
+        assert tracker.compute_field_hash("a@b.com") == "raw:a@b.com"
+
+    def test_bool_and_int_differ(self, tracker):
+        """True and 1 compare equal but must not share a token."""
+        assert tracker.compute_field_hash(1) != tracker.compute_field_hash(True)
+
+    def test_long_and_container_values_are_hashed(self, tracker):
+        """Long strings and containers should use a 16-byte BLAKE2b digest."""
+        long_value = "x" * (tracker.MAX_RAW_VALUE_LENGTH + 1)
+
+        assert tracker.compute_field_hash(long_value) == _blake2b(long_value.encode())
+        assert len(tracker.compute_field_hash([1, 2])) == 32
+        assert len(tracker.compute_hash({"a": 1})) == 32
+
+    def test_string_values_are_stripped(self, tracker):
+        """Surrounding whitespace should not affect the hash."""
+        assert tracker.compute_field_hash(" a@b.com ") == tracker.compute_field_hash(
+            "a@b.com"
+        )
+
+
+class TestFailureStats:
+    """Tests for failure statistics aggregation."""
+
+    def test_stats_use_bulk_reader(self, tracker, mock_data_manager):
+        """get_failure_stats should read all records with the bulk reader."""
+        mock_data_manager.get_all_failed_records_bulk.return_value = [
+            {
+                "entity_type": "employee",
+                "failure_reason": "duplicate_fields",
+                "first_failed_at": "2024-01-02T00:00:00+00:00",
+            },
+            {
+                "entity_type": "employee",
+                "failure_reason": "validation_error",
+                "first_failed_at": "2024-01-01T00:00:00+00:00",
+            },
+            {"entity_type": "vehicle", "failure_reason": "duplicate_fields"},
+        ]
+
+        stats = tracker.get_failure_stats()
+
+        mock_data_manager.get_all_failed_records_bulk.assert_called_once_with(
+            entity_type=None
+        )
+        assert stats["total"] == 3
+        assert stats["by_entity_type"] == {"employee": 2, "vehicle": 1}
+        assert stats["by_reason"] == {"duplicate_fields": 2, "validation_error": 1}
+        assert stats["oldest_failure"] == "2024-01-01T00:00:00+00:00"
+
+    def test_stats_bucket_missing_fields_as_unknown(self, tracker, mock_data_manager):
+        """Records without a type or reason should be counted as unknown."""
+        mock_data_manager.get_all_failed_records_bulk.return_value = [
+            {"first_failed_at": ""},
+            {"entity_type": "employee"},
+        ]
+
+        stats = tracker.get_failure_stats()
+
+        assert stats["by_entity_type"] == {"unknown": 1, "employee": 1}
+        assert stats["by_reason"] == {"unknown": 2}
+        assert stats["oldest_failure"] is None
+
+    def test_stats_empty(self, tracker, mock_data_manager):
+        """No failures should produce zeroed stats."""
+        mock_data_manager.get_all_failed_records_bulk.return_value = []
+
+        stats = tracker.get_failure_stats()
+
+        assert stats == {
+            "total": 0,
+            "by_entity_type": {},
+            "by_reason": {},
+            "oldest_failure": None,
+        }
+
+
+class TestFailedKeyIndex:
+    """Tests for the local failure key index."""
+
+    def test_lookup_hits_redis_without_index(self, tracker, mock_data_manager):
+        """Before the index is built, every check should consult Redis."""
+        assert tracker.should_skip_retry("1", "employee", {}) is False
+        mock_data_manager.get_failed_sync_record.assert_called_once_with(
+            "employee", "1"
+        )
+
+    def test_unknown_entity_skips_redis(self, tracker, mock_data_manager):
+        """Entities absent from the index should not trigger a Redis lookup."""
+        mock_data_manager.get_failed_sync_keys.return_value = [("employee", "2")]
+        assert tracker.refresh_failed_key_index() is True
+
+        assert tracker.should_skip_retry("1", "employee", {}) is False
+        mock_data_manager.get_failed_sync_record.assert_not_called()
+
+    def test_known_entity_checks_redis(self, tracker, mock_data_manager):
+        """Entities in the index should still be compared against Redis."""
+        mock_data_manager.get_failed_sync_keys.return_value = [("employee", "1")]
+        mock_data_manager.get_failed_sync_record.return_value = {
+            "failed_fields": {
+                "email": {"value_hash": tracker.compute_field_hash("a@b.com")}
+            }
+        }
+        tracker.refresh_failed_key_index()
+
+        assert tracker.should_skip_retry("1", "employee", {"email": "a@b.com"})
+
+    def test_record_and_clear_update_index(self, tracker, mock_data_manager):
+        """Recording adds to the index and clearing removes from it."""
+        mock_data_manager.get_failed_sync_keys.return_value = []
+        tracker.refresh_failed_key_index()
+
+        tracker.record_failure("1", "employee", {}, {"message": "bad"}, 422)
+        assert ("employee", "1") in tracker._known_failed_keys
+
+        tracker.clear_failure("1", "employee")
+        assert ("employee", "1") not in tracker._known_failed_keys
+
+    def test_failed_refresh_drops_index(self, tracker, mock_data_manager):
+        """If Redis cannot be scanned, lookups should fall back to Redis."""
+        mock_data_manager.get_failed_sync_keys.return_value = None
+
+        assert tracker.refresh_failed_key_index() is False
+        assert tracker._known_failed_keys is None
+
+
+class TestRecordFailure:
+    """Tests for failure recording."""
+
+    def _saved_metadata(self, mock_data_manager):
+        return mock_data_manager.save_failed_sync_record.call_args.kwargs["metadata"]
+
+    def test_dict_error_stored_as_json(self, tracker, mock_data_manager):
+        """Dict error responses should be stored as JSON, not Python repr."""
+        error = {"message": "The email has already been taken."}
+
+        tracker.record_failure("1", "employee", {}, error, 422)
+
+        stored = self._saved_metadata(mock_data_manager)["last_error_message"]
+        assert stored == '{"message": "The email has already been taken."}'
+
+    def test_payload_hash_only_without_field_hashes(self, tracker, mock_data_manager):
+        """The full payload is hashed only when no field-level errors exist."""
+        data = {"email": "a@b.com", "name": "x"}
+        error = {"errors": {"email": ["The email has already been taken."]}}
+
+        tracker.record_failure("1", "employee", data, error, 422)
+        assert self._saved_metadata(mock_data_manager)["full_payload_hash"] == ""
+
+        tracker.record_failure("1", "employee", data, "Server error", 500)
+        assert self._saved_metadata(mock_data_manager)[
+            "full_payload_hash"
+        ] == tracker.compute_hash(data)
+
+    def test_error_message_capped_in_bytes(self, tracker, mock_data_manager):
+        """Stored messages should be capped by UTF-8 byte length."""
+        tracker.record_failure("1", "employee", {}, "é" * 400, 500)
+
+        stored = self._saved_metadata(mock_data_manager)["last_error_message"]
+        assert len(stored.encode("utf-8")) <= tracker.MAX_ERROR_MESSAGE_BYTES
+        assert stored == "é" * 250
+
+
+class TestCanonicalJson:
+    """Tests for canonical JSON encoding used by payload hashes."""
+
+    def test_stdlib_fallback_matches_orjson(self, monkeypatch):
+        """Both encoders must yield identical bytes so hashes agree."""
+        from utils import failed_sync_tracker as module
+
+        value = {"b": [1, 2.5, None, True], "a": {"z": "é", "y": "x"}}
+        with_orjson = module._canonical_json(value)
+        monkeypatch.setattr(module, "orjson", None)
+
+        assert module._canonical_json(value) == with_orjson
+
+    def test_payload_hash_ignores_key_order(self, tracker):
+        """Full payload hashes should not depend on dict insertion order."""
+        assert tracker.compute_hash({"a": 1, "b": 2}) == tracker.compute_hash(
+            {"b": 2, "a": 1}
+        )
+
+
+class TestCategorizeFailure:
+    """Tests for failure categorization."""
+
+    @pytest.mark.parametrize(
+        "error_response,expected",
+        [
+            (
+                {"errors": {"email": ["The email has already been taken."]}},
+                "duplicate_fields",
+            ),
+            ({"message": "The name field is REQUIRED."}, "missing_required"),
+            ("Invalid phone number", "validation_error"),
+            ({"message": "Something else"}, "unknown_422"),
+            ({"code": "duplicate"}, "duplicate_fields"),
+        ],
+    )
+    def test_categories(self, tracker, error_response, expected):
+        """Error text should map to the expected category."""
+        assert tracker._categorize_failure(error_response, 422) == expected
+
+    def test_priority_is_preserved(self, tracker):
+        """Duplicate errors win over earlier-positioned lower-priority matches."""
+        error = {
+            "errors": {
+                "name": ["The name is required."],
+                "email": ["The email has already been taken."],
+            }
+        }
+
+        assert tracker._categorize_failure(error, 422) == "duplicate_fields"
+
+    def test_non_422_uses_http_status(self, tracker):
+        """Non-422 failures should be categorized by status code."""
+        assert tracker._categorize_failure("duplicate", 500) == "http_500"
+
+
+class TestRecordCache:
+    """Tests for the per-pass failure record cache."""
+
+    def test_repeat_checks_hit_redis_once(self, tracker, mock_data_manager):
+        """Repeated checks for one entity should reuse the cached record."""
+        tracker.should_skip_retry("1", "employee", {})
+        tracker.should_skip_retry("1", "employee", {})
+
+        mock_data_manager.get_failed_sync_record.assert_called_once()
+
+    def test_reset_forces_fresh_lookup(self, tracker, mock_data_manager):
+        """A new sync pass should re-read records from Redis."""
+        tracker.should_skip_retry("1", "employee", {})
+        tracker.reset_record_cache()
+        tracker.should_skip_retry("1", "employee", {})
+
+        assert mock_data_manager.get_failed_sync_record.call_count == 2
+
+    def test_record_and_clear_update_cache(self, tracker, mock_data_manager):
+        """Recording caches the new record and clearing invalidates it."""
+        tracker.should_skip_retry("1", "employee", {"email": "a@b.com"})
+        error = {"errors": {"email": ["The email has already been taken."]}}
+        tracker.record_failure("1", "employee", {"email": "a@b.com"}, error, 422)
+
+        assert tracker.should_skip_retry("1", "employee", {"email": "a@b.com"})
+
+        tracker.clear_failure("1", "employee")
+        assert not tracker.should_skip_retry("1", "employee", {"email": "a@b.com"})
+
+    def test_cache_is_bounded(self, tracker):
+        """The cache should evict the least recently used entries."""
+        tracker._RECORD_CACHE_SIZE = 2
+        for entity_id in ("1", "2", "3"):
+            tracker.should_skip_retry(entity_id, "employee", {})
+
+        assert list(tracker._record_cache) == [("employee", "2"), ("employee", "3")]
+
+
+class TestPrefetchFailedRecords:
+    """Tests for batched failure record prefetching."""
+
+    def test_prefetch_uses_single_mget(self, tracker, mock_data_manager):
+        """Prefetched records should satisfy checks without per-entity GETs."""
+        record = {
+            "failed_fields": {
+                "email": {"value_hash": tracker.compute_field_hash("a@b.com")}
+            }
+        }
+        mock_data_manager.mget_failed_sync_records.return_value = {
+            "1": record,
+            "2": None,
+        }
+
+        prefetched = tracker.prefetch_failed_records("employee", ["1", "2"])
+
+        assert tracker.should_skip_retry(
+            "1", "employee", {"email": "a@b.com"}, prefetched=prefetched
+        )
+        assert not tracker.should_skip_retry("2", "employee", {}, prefetched=prefetched)
+        mock_data_manager.mget_failed_sync_records.assert_called_once_with(
+            "employee", ["1", "2"]
+        )
+        mock_data_manager.get_failed_sync_record.assert_not_called()
+
+    def test_prefetch_skips_ids_missing_from_index(self, tracker, mock_data_manager):
+        """Only entities in the key index should be requested from Redis."""
+        mock_data_manager.get_failed_sync_keys.return_value = [("employee", "2")]
+        tracker.refresh_failed_key_index()
+        mock_data_manager.mget_failed_sync_records.return_value = {"2": None}
+
+        prefetched = tracker.prefetch_failed_records("employee", ["1", "2"])
+
+        assert prefetched == {"1": None, "2": None}
+        mock_data_manager.mget_failed_sync_records.assert_called_once_with(
+            "employee", ["2"]
+        )
+
+    def test_failed_prefetch_falls_back_to_lookup(self, tracker, mock_data_manager):
+        """If the MGET fails, checks should fall back to per-entity lookups."""
+        mock_data_manager.mget_failed_sync_records.return_value = None
+
+        prefetched = tracker.prefetch_failed_records("employee", ["1"])
+        tracker.should_skip_retry("1", "employee", {}, prefetched=prefetched)
+
+        assert prefetched == {}
+        mock_data_manager.get_failed_sync_record.assert_called_once()
+
+
+class TestShouldSkipRetry:
+    """Tests for should_skip_retry comparison shortcuts."""
+
+    def test_missing_payload_hash_skips_hashing(self, tracker, mock_data_manager):
+        """Without a stored payload hash, the payload should not be hashed."""
+        mock_data_manager.get_failed_sync_record.return_value = {"failed_fields": {}}
+        tracker.compute_hash = MagicMock()
+
+        assert tracker.should_skip_retry("1", "employee", {"a": 1}) is False
+        tracker.compute_hash.assert_not_called()
+
+    def test_unchanged_payload_is_skipped(self, tracker, mock_data_manager):
+        """A matching full payload hash should still skip the retry."""
+        data = {"a": 1}
+        mock_data_manager.get_failed_sync_record.return_value = {
+            "full_payload_hash": tracker.compute_hash(data)
+        }
+
+        assert tracker.should_skip_retry("1", "employee", data) is True
+
+    def test_scalar_mismatch_checked_before_containers(
+        self, tracker, mock_data_manager
+    ):
+        """A changed scalar field should short-circuit before hashing lists."""
+        mock_data_manager.get_failed_sync_record.return_value = {
+            "failed_fields": {
+                "roles": {"value_hash": "x"},
+                "email": {"value_hash": tracker.compute_field_hash("old@b.com")},
+            }
+        }
+        hashed = []
+        original = tracker.compute_field_hash
+
+        def recording_hash(value):
+            hashed.append(value)
+            return original(value)
+
+        tracker.compute_field_hash = recording_hash
+
+        data = {"roles": [{"id": 1}], "email": "new@b.com"}
+        assert tracker.should_skip_retry("1", "employee", data) is False
+        assert hashed == ["new@b.com"]
+
+
+class TestIndexedQueries:
+    """Tests for counts and pages served by the failed sync index."""
+
+    def test_count_uses_index(self, tracker, mock_data_manager):
+        """The count should come from the index without reading records."""
+        mock_data_manager.count_failed_sync_records.return_value = 7
+
+        assert tracker.get_failed_count("employee") == 7
+        mock_data_manager.get_all_failed_records.assert_not_called()
+
+    def test_count_falls_back_to_scan(self, tracker, mock_data_manager):
+        """Without the index, the count should fall back to reading records."""
+        mock_data_manager.get_all_failed_records.return_value = [{}, {}]
+
+        assert tracker.get_failed_count() == 2
+
+    def test_page_uses_index(self, tracker, mock_data_manager):
+        """Pages should come from the index without reading every record."""
+        mock_data_manager.get_failed_sync_records_page.return_value = [{"a": 1}]
+
+        assert tracker.get_failed_records("employee", limit=10, offset=20) == [{"a": 1}]
+        mock_data_manager.get_failed_sync_records_page.assert_called_once_with(
+            entity_type="employee", offset=20, limit=10
+        )
+        mock_data_manager.get_all_failed_records.assert_not_called()
+
+    def test_page_falls_back_to_sorted_scan(self, tracker, mock_data_manager):
+        """Without the index, records are sorted by last_failed_at."""
+        mock_data_manager.get_all_failed_records.return_value = [
+            {"last_failed_at": "2024-01-01"},
+            {"last_failed_at": "2024-01-03"},
+            {"last_failed_at": "2024-01-02"},
+        ]
+
+        records = tracker.get_failed_records(limit=2)
+
+        assert [r["last_failed_at"] for r in records] == ["2024-01-03", "2024-01-02"]
+
+
+class TestRecordIdResolution:
+    """Tests for resolving record ids in admin actions."""
+
+    def test_bare_id_resolved_without_scan(self, tracker, mock_data_manager):
+        """A bare entity id should be resolved via the lookup hash."""
+        mock_data_manager.get_failed_sync_entity_type.return_value = "vehicle"
+
+        assert tracker.dismiss_record("42") is True
+
+        mock_data_manager.delete_failed_sync_record.assert_called_once_with(
+            "vehicle", "42"
+        )
+        mock_data_manager.get_all_failed_records.assert_not_called()
+
+    def test_unknown_bare_id_is_rejected(self, tracker, mock_data_manager):
+        """An id missing from the lookup hash should not be found."""
+        assert tracker.mark_for_retry("42") is False
+        assert tracker.dismiss_record("42") is False
+        mock_data_manager.get_all_failed_records.assert_not_called()
+
+    def test_qualified_id_skips_lookup(self, tracker, mock_data_manager):
+        """Ids of the form entity_type:entity_id need no lookup."""
+        mock_data_manager.get_failed_sync_record.return_value = {"entity_id": "7"}
+
+        assert tracker.mark_for_retry("employee:7") is True
+        mock_data_manager.get_failed_sync_entity_type.assert_not_called()
+
+
+class TestErrorResponseParsing:
+    """Tests for decoding error responses once per failure."""
+
+    def test_json_string_decoded_once(self, tracker, mock_data_manager, monkeypatch):
+        """A JSON string response should be decoded a single time."""
+        from utils import failed_sync_tracker as module
+
+        calls = []
+        original = module._parse_error_response
+
+        def counting_parse(value):
+            calls.append(value)
+            return original(value)
+
+        monkeypatch.setattr(module, "_parse_error_response", counting_parse)
+        error = '{"errors": {"email": ["The email has already been taken."]}}'
+
+        tracker.record_failure("1", "employee", {"email": "a@b.com"}, error, 422)
+
+        metadata = mock_data_manager.save_failed_sync_record.call_args.kwargs[
+            "metadata"
+        ]
+        assert list(metadata["failed_fields"]) == ["email"]
+        assert metadata["failure_reason"] == "duplicate_fields"
+        assert metadata["last_error_message"] == error
+        assert calls == [error]
+
+    def test_invalid_json_string_returned_unchanged(self):
+        """Non-JSON strings should pass through for text categorization."""
+        from utils.failed_sync_tracker import _parse_error_response
+
+        assert _parse_error_response("Invalid phone") == "Invalid phone"
+        assert _parse_error_response({"a": 1}) == {"a": 1}
+
+    def test_message_field_follows_priority(self, tracker):
+        """General messages map to the first listed field they mention."""
+        extract = tracker.extract_failed_fields_from_error
+        message = "The Mobile Phone and EMAIL have already been taken."
+
+        assert extract({"message": message}) == {"email": message}
+        assert extract({"message": "Work phone invalid"}) == {
+            "work_phone": "Work phone invalid"
+        }
+        assert extract({"message": "Server error"}) == {"_general": "Server error"}
+
+
+class TestMarkAllForRetry:
+    """Tests for bulk retry marking."""
+
+    def test_records_share_one_timestamp(self, tracker, mock_data_manager):
+        """All records marked in one call should share a retry timestamp."""
+        mock_data_manager.get_all_failed_records.return_value = [
+            {"entity_type": "employee", "entity_id": str(i)} for i in range(3)
+        ]
+        mock_data_manager.save_failed_sync_records_bulk.return_value = 3
+
+        assert tracker.mark_all_for_retry() == 3
+
+        records = mock_data_manager.save_failed_sync_records_bulk.call_args.args[0]
+        stamps = {metadata["retry_requested_at"] for _, _, metadata in records}
+        assert len(stamps) == 1
+
+    def test_saves_in_one_bulk_call(self, tracker, mock_data_manager):
+        """Records should be written with one bulk save, skipping bad entries."""
+        mock_data_manager.get_all_failed_records.return_value = [
+            {"entity_type": "employee", "entity_id": "1"},
+            {"entity_type": "employee"},
+        ]
+        mock_data_manager.save_failed_sync_records_bulk.return_value = 1
+
+        assert tracker.mark_all_for_retry() == 1
+
+        mock_data_manager.save_failed_sync_records_bulk.assert_called_once()
+        mock_data_manager.save_failed_sync_record.assert_not_called()
+        records = mock_data_manager.save_failed_sync_records_bulk.call_args.args[0]
+        assert [(etype, eid) for etype, eid, _ in records] == [("employee", "1")]
@@ -0,0 +1,125 @@
+"""
+Unit tests for health check aggregation.
+
+Tests cover:
+- Concurrent execution of independent subchecks
+- Short-lived caching of health check results
+- Connection reuse for the Samsara probe
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utils import health
+
+CHECK_NAMES = ("database", "safetyamp", "samsara", "cache", "failed_syncs")
+
+
+@pytest.fixture(autouse=True)
+def reset_health_cache():
+    """Start each test without a cached health result."""
+    health._last_result = (0.0, None)
+    yield
+    health._last_result = (0.0, None)
+
+
+def _patch_checks(fn):
+    return [patch.object(health, f"check_{name}", fn) for name in CHECK_NAMES]
+
+
+class TestRunHealthChecks:
+    """Tests for run_health_checks()."""
+
+    def test_checks_run_concurrently(self):
+        """All subchecks should be in flight at the same time."""
+        barrier = threading.Barrier(len(CHECK_NAMES), timeout=5)
+
+        def check():
+            barrier.wait()
+            return {"status": "healthy"}
+
+        patches = _patch_checks(check)
+        for p in patches:
+            p.start()
+        try:
+            start = time.time()
+            result = health.run_health_checks()
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert result["status"] == "healthy"
+        assert set(result["checks"]) == set(CHECK_NAMES)
+        assert time.time() - start < 5
+
+    def test_unhealthy_check_degrades_overall(self):
+        """Any check that is not healthy or disabled should degrade status."""
+        patches = _patch_checks(lambda: {"status": "healthy"})
+        patches.append(
+            patch.object(health, "check_samsara", lambda: {"status": "unhealthy"})
+        )
+        for p in patches:
+            p.start()
+        try:
+            result = health.run_health_checks()
+        finally:
+            for p in reversed(patches):
+                p.stop()
+
+        assert result["status"] == "degraded"
+        assert result["checks"]["samsara"] == {"status": "unhealthy"}
+
+
+class TestHealthCheckCache:
+    """Tests for caching run_health_checks() results."""
+
+    def test_result_reused_within_ttl(self):
+        """Probes within the TTL should not re-run the checks."""
+        run = MagicMock(return_value={"status": "healthy", "checks": {}})
+        with patch.object(health, "_run_health_checks", run), patch.object(
+            health.config, "HEALTH_CHECK_CACHE_SECONDS", 60
+        ):
+            first = health.run_health_checks()
+            second = health.run_health_checks()
+
+        assert first is second
+        run.assert_called_once()
+
+    def test_result_refreshed_after_ttl(self):
+        """A zero TTL should run the checks on every call."""
+        run = MagicMock(return_value={"status": "healthy", "checks": {}})
+        with patch.object(health, "_run_health_checks", run), patch.object(
+            health.config, "HEALTH_CHECK_CACHE_SECONDS", 0
+        ):
+            health.run_health_checks()
+            health.run_health_checks()
+
+        assert run.call_count == 2
+
+
+class TestCheckSamsara:
+    """Tests for check_samsara()."""
+
+    def test_uses_shared_session(self):
+        """Probes should go through the module-level keep-alive session."""
+        with patch.object(health, "_samsara_session") as session:
+            session.get.return_value.raise_for_status.return_value = None
+
+            assert health.check_samsara()["status"] == "healthy"
+            health.check_samsara()
+
+        assert session.get.call_count == 2
+        assert session.get.call_args.kwargs["params"] == {"limit": 1}
+
+    def test_http_error_is_degraded(self):
+        """HTTP errors should report the probe as degraded."""
+        with patch.object(health, "_samsara_session") as session:
+            session.get.return_value.raise_for_status.side_effect = Exception("401")
+
+            result = health.check_samsara()
+
+        assert result["status"] == "degraded"
+        assert result["error"] == "401"
@@ -0,0 +1,179 @@
+"""
+Unit tests for logger configuration.
+
+Tests cover:
+- Shared handlers configured once on the root logger
+- Queue-based handoff of records to the file and console handlers
+- Console handler gated on LOG_TO_CONSOLE
+- Structured JSON log formatting
+- Buffered file writes flushed when the log queue drains
+"""
+
+import json
+import logging
+import logging.handlers
+import queue
+
+from utils import logger as logger_module
+from utils.logger import get_logger
+
+
+class TestGetLogger:
+    """Tests for get_logger()."""
+
+    def test_named_loggers_add_no_handlers(self):
+        """Named loggers should propagate to the shared root handlers."""
+        first = get_logger("test_logger_a")
+        second = get_logger("test_logger_b")
+
+        assert first.handlers == []
+        assert second.handlers == []
+        assert first.propagate and second.propagate
+
+    def test_root_handlers_created_once(self):
+        """Repeated calls should not add more root handlers."""
+        get_logger("test_logger_c")
+        count = len(logging.getLogger().handlers)
+
+        get_logger("test_logger_d")
+        get_logger("test_logger_c")
+
+        assert len(logging.getLogger().handlers) == count
+
+    def test_same_name_returns_same_logger(self):
+        """A name should always map to the same logger instance."""
+        assert get_logger("test_logger_e") is get_logger("test_logger_e")
+
+    def test_root_uses_queue_handler(self):
+        """Callers should only enqueue records; a listener does the I/O."""
+        get_logger("test_logger_f")
+
+        queue_handlers = [
+            h
+            for h in logging.getLogger().handlers
+            if isinstance(h, logging.handlers.QueueHandler)
+        ]
+        assert len(queue_handlers) == 1
+        assert any(
+            isinstance(h, logging.FileHandler) for h in logger_module._listener.handlers
+        )
+
+    def test_build_formatter_follows_setting(self, monkeypatch):
+        """Only the formatter for the configured mode should be built."""
+        monkeypatch.setattr(
+            logger_module.settings, "STRUCTURED_LOGGING_ENABLED", True, raising=False
+        )
+        assert isinstance(
+            logger_module._build_formatter(), logger_module._JsonFormatter
+        )
+
+        monkeypatch.setattr(
+            logger_module.settings, "STRUCTURED_LOGGING_ENABLED", False, raising=False
+        )
+        assert not isinstance(
+            logger_module._build_formatter(), logger_module._JsonFormatter
+        )
+
+    def test_console_handler_follows_setting(self, monkeypatch, tmp_path):
+        """The console handler should only be built when LOG_TO_CONSOLE is set."""
+        formatter = logging.Formatter("%(message)s")
+
+        for enabled in (True, False):
+            monkeypatch.setattr(
+                logger_module.settings, "LOG_TO_CONSOLE", enabled, raising=False
+            )
+            handlers = logger_module._build_handlers(
+                tmp_path / "app.log", queue.SimpleQueue(), formatter
+            )
+            console = [h for h in handlers if not isinstance(h, logging.FileHandler)]
+
+            assert isinstance(handlers[0], logger_module._BufferedFileHandler)
+            assert len(console) == int(enabled)
+            for handler in handlers:
+                handler.close()
+
+    def test_new_loggers_use_configured_level(self):
+        """New loggers should get the level resolved at configuration time."""
+        logger = get_logger("test_logger_g")
+
+        assert logging.getLevelName(logger.level) == logger_module._default_level
+
+
+class TestJsonFormatter:
+    """Tests for the structured log formatter."""
+
+    def _record(self, **extra):
+        record = logging.LogRecord(
+            "sync", logging.INFO, __file__, 1, "hi %s", ("x",), None
+        )
+        for key, value in extra.items():
+            setattr(record, key, value)
+        return record
+
+    def test_formats_message_and_extras(self):
+        """Messages and known extras should be emitted as compact JSON."""
+        line = logger_module._JsonFormatter().format(self._record(sync_type="users"))
+        payload = json.loads(line)
+
+        assert payload["message"] == "hi x"
+        assert payload["sync_type"] == "users"
+        assert payload["timestamp"].endswith("+00:00")
+        assert ": " not in line
+
+    def test_only_known_extras_are_emitted(self):
+        """Unrecognised record attributes should not leak into the payload."""
+        line = logger_module._JsonFormatter().format(
+            self._record(entity_type="employee", duration_seconds=1.5, other="x")
+        )
+        payload = json.loads(line)
+
+        assert payload["entity_type"] == "employee"
+        assert payload["duration_seconds"] == 1.5
+        assert "other" not in payload
+        assert "session_id" not in payload
+
+    def test_unserializable_extras_use_str(self, monkeypatch):
+        """Extras that are not JSON types should fall back to str()."""
+        for module in (logger_module.orjson, None):
+            monkeypatch.setattr(logger_module, "orjson", module)
+            line = logger_module._JsonFormatter().format(
+                self._record(metrics={"at": object})
+            )
+            assert json.loads(line)["metrics"]["at"] == str(object)
+
+
+class TestBufferedFileHandler:
+    """Tests for the queue-aware buffered file handler."""
+
+    def _handler(self, tmp_path, log_queue):
+        handler = logger_module._BufferedFileHandler(tmp_path / "app.log", log_queue)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        return handler
+
+    def _record(self, message):
+        return logging.LogRecord("t", logging.INFO, __file__, 1, message, None, None)
+
+    def test_flush_deferred_while_queue_has_records(self, tmp_path):
+        """Records should stay buffered while more are queued."""
+        log_queue = queue.SimpleQueue()
+        log_queue.put("pending")
+        handler = self._handler(tmp_path, log_queue)
+
+        handler.handle(self._record("first"))
+        assert (tmp_path / "app.log").read_text() == ""
+
+        log_queue.get()
+        handler.handle(self._record("second"))
+        assert (tmp_path / "app.log").read_text() == "first\nsecond\n"
+        handler.close()
+
+    def test_close_flushes_buffer(self, tmp_path):
+        """Closing should write out anything still buffered."""
+        log_queue = queue.SimpleQueue()
+        log_queue.put("pending")
+        handler = self._handler(tmp_path, log_queue)
+
+        handler.handle(self._record("last"))
+        handler.close()
+
+        assert (tmp_path / "app.log").read_text() == "last\n"
@@ -0,0 +1,63 @@
+"""
+Unit tests for the MetricsCollector.
+
+Tests cover:
+- Memoized collector lookups
+- Concurrent first-time registration
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from utils import metrics as metrics_module
+from utils.metrics import MetricsCollector
+
+
+class TestCollectorLookup:
+    """Tests for get-or-create collector lookups."""
+
+    def test_repeat_lookup_skips_registry(self):
+        """A collector resolved once should be served from the local cache."""
+        collector = MetricsCollector()
+        counter = collector.get_counter("test_memo_counter", "Test counter")
+
+        with patch.object(metrics_module, "REGISTRY") as registry:
+            assert collector.get_counter("test_memo_counter", "Test counter") is counter
+            registry._names_to_collectors.__getitem__.assert_not_called()
+
+    def test_existing_registry_collector_is_reused(self):
+        """A collector registered elsewhere should be found and cached."""
+        gauge = MetricsCollector().get_gauge("test_memo_gauge", "Test gauge")
+        collector = MetricsCollector()
+
+        assert collector.get_gauge("test_memo_gauge", "Test gauge") is gauge
+        assert collector._collectors["test_memo_gauge"] is gauge
+
+    def test_type_mismatch_still_raises(self):
+        """Cached collectors of another type should still be rejected."""
+        collector = MetricsCollector()
+        collector.get_histogram("test_memo_histogram", "Test histogram")
+
+        with pytest.raises(ValueError):
+            collector.get_counter("test_memo_histogram", "Test histogram")
+
+    def test_concurrent_first_lookups_register_once(self):
+        """Threads racing on a new name should all get the same collector."""
+        collector = MetricsCollector()
+        barrier = threading.Barrier(8)
+        results = []
+
+        def lookup():
+            barrier.wait()
+            results.append(collector.get_counter("test_race_counter", "Race counter"))
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 8
+        assert all(result is results[0] for result in results)
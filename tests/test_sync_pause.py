@@ -602,6 +602,30 @@ class TestSyncPauseSecurity:
                 data = response.get_json()
                 assert "rate limit" in data["error"].lower()
 
+    def test_rate_limit_tracker_evicts_least_recent_clients(
+        self, dashboard_blueprint, auth_headers
+    ):
+        """The rate limit tracker should stay bounded as new clients arrive."""
+        from routes import dashboard as dashboard_module
+
+        app, mock_dm = dashboard_blueprint
+
+        with patch.dict("os.environ", {"DASHBOARD_API_TOKEN": "test-token-12345"}):
+            with patch.object(dashboard_module, "MAX_RATE_LIMIT_KEYS", 2):
+                with app.test_client() as client:
+                    for ip in ("10.0.0.1", "10.0.0.2", "10.0.0.3"):
+                        response = client.post(
+                            "/api/dashboard/sync-pause",
+                            headers=auth_headers,
+                            json={"paused": True},
+                            environ_base={"REMOTE_ADDR": ip},
+                        )
+                        assert response.status_code == 200
+
+        keys = list(dashboard_module._rate_limit_tracker)
+        assert len(keys) == 2
+        assert not any(key.endswith(":10.0.0.1") for key in keys)
+        assert keys[-1].endswith(":10.0.0.3")
 
 class TestSyncWorkerPauseIntegration:
     """Tests for sync worker pause behavior."""
@@ -8,10 +8,13 @@ Provides helper functions to:
 - Format data for charts
 """
 
+import threading
+import time
 from collections import defaultdict
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from config import config
 from utils.logger import get_logger
 from utils.health import (
     check_database,
@@ -50,6 +53,9 @@ class DashboardData:
         """
         self.event_manager = event_manager
         self.data_manager = data_manager
+        # (fetched_at, counts) for the paginated SafetyAmp lookups
+        self._safetyamp_counts_cache: Optional[Tuple[float, Dict[str, int]]] = None
+        self._safetyamp_counts_lock = threading.Lock()
 
     def get_sync_metrics(self, hours: int = 24) -> Dict[str, Any]:
         """
@@ -71,30 +77,37 @@ class DashboardData:
             by_operation = summary.get("by_operation", {})
 
             total_syncs = len(sessions)
-            total_processed = sum(s.get("total_processed", 0) for s in sessions)
-            total_created = sum(s.get("total_created", 0) for s in sessions)
-            total_updated = sum(s.get("total_updated", 0) for s in sessions)
-            total_errors = sum(s.get("total_errors", 0) for s in sessions)
-            total_skipped = sum(s.get("total_skipped", 0) for s in sessions)
+
+            # Accumulate every total in a single pass over the sessions
+            total_processed = total_created = total_updated = 0
+            total_errors = total_skipped = failed_syncs = 0
+            duration_sum = 0
+            duration_count = 0
+            for session in sessions:
+                get = session.get
+                total_processed += get("total_processed", 0)
+                total_created += get("total_created", 0)
+                total_updated += get("total_updated", 0)
+                total_skipped += get("total_skipped", 0)
+                session_errors = get("total_errors", 0)
+                total_errors += session_errors
+                if session_errors > 0:
+                    failed_syncs += 1
+                duration = get("duration_seconds")
+                if duration:
+                    duration_sum += duration
+                    duration_count += 1
 
             # Calculate success rate
             success_rate = self._calculate_success_rate(total_processed, total_errors)
 
             # Calculate average duration
-            durations = [
-                s.get("duration_seconds", 0)
-                for s in sessions
-                if s.get("duration_seconds")
-            ]
-            avg_duration = sum(durations) / len(durations) if durations else 0
+            avg_duration = duration_sum / duration_count if duration_count else 0
 
             return {
                 "total_syncs": total_syncs,
-                "successful_syncs": total_syncs
-                - len([s for s in sessions if s.get("total_errors", 0) > 0]),
-                "failed_syncs": len(
-                    [s for s in sessions if s.get("total_errors", 0) > 0]
-                ),
+                "successful_syncs": total_syncs - failed_syncs,
+                "failed_syncs": failed_syncs,
                 "total_records_processed": total_processed,
                 "total_created": total_created,
                 "total_updated": total_updated,
@@ -180,39 +193,70 @@ class DashboardData:
         except Exception as e:
             logger.error(f"Error getting entity counts from data manager: {e}")
 
-        # Get department and vehicle counts from SafetyAmp API
-        try:
-            from services.safetyamp_api import SafetyAmpAPI
+        counts.update(self._get_safetyamp_counts())
+        return counts
 
-            api = SafetyAmpAPI()
+    def invalidate_entity_counts(self) -> None:
+        """Drop memoized SafetyAmp counts so the next call refetches them."""
+        with self._safetyamp_counts_lock:
+            self._safetyamp_counts_cache = None
 
-            # Get departments (clusters) count
-            try:
-                clusters = api.get_site_clusters()
-                counts["departments"] = len(clusters) if clusters else 0
-            except Exception as e:
-                logger.warning(f"Could not get department count from SafetyAmp: {e}")
+    def _get_safetyamp_counts(self) -> Dict[str, int]:
+        """
+        Get department, vehicle and title counts from the SafetyAmp API.
 
-            # Get vehicles (assets) count
-            try:
-                assets = api.get_assets()
-                counts["vehicles"] = len(assets) if assets else 0
-            except Exception as e:
-                logger.warning(f"Could not get vehicle count from SafetyAmp: {e}")
+        Each count walks a paginated endpoint, so complete results are
+        memoized for ENTITY_COUNTS_CACHE_SECONDS and shared by callers.
+        """
+        max_age = getattr(config, "ENTITY_COUNTS_CACHE_SECONDS", 300)
+        with self._safetyamp_counts_lock:
+            cached = self._safetyamp_counts_cache
+            if cached and time.monotonic() - cached[0] < max_age:
+                return dict(cached[1])
 
-            # Get titles count
+            counts = {"departments": 0, "vehicles": 0, "titles": 0}
+            complete = False
             try:
-                titles = api.get_titles()
-                counts["titles"] = len(titles) if titles else 0
-            except Exception as e:
-                logger.warning(f"Could not get title count from SafetyAmp: {e}")
+                from services.safetyamp_api import SafetyAmpAPI
+
+                api = SafetyAmpAPI()
+                complete = True
+
+                # Get departments (clusters) count
+                try:
+                    clusters = api.get_site_clusters()
+                    counts["departments"] = len(clusters) if clusters else 0
+                except Exception as e:
+                    complete = False
+                    logger.warning(
+                        f"Could not get department count from SafetyAmp: {e}"
+                    )
 
-        except ImportError:
-            logger.warning("SafetyAmpAPI not available for entity counts")
-        except Exception as e:
-            logger.error(f"Error getting entity counts from SafetyAmp API: {e}")
+                # Get vehicles (assets) count
+                try:
+                    assets = api.get_assets()
+                    counts["vehicles"] = len(assets) if assets else 0
+                except Exception as e:
+                    complete = False
+                    logger.warning(f"Could not get vehicle count from SafetyAmp: {e}")
+
+                # Get titles count
+                try:
+                    titles = api.get_titles()
+                    counts["titles"] = len(titles) if titles else 0
+                except Exception as e:
+                    complete = False
+                    logger.warning(f"Could not get title count from SafetyAmp: {e}")
+
+            except ImportError:
+                logger.warning("SafetyAmpAPI not available for entity counts")
+            except Exception as e:
+                logger.error(f"Error getting entity counts from SafetyAmp API: {e}")
 
-        return counts
+            # Partial results are returned but not memoized
+            if complete and max_age > 0:
+                self._safetyamp_counts_cache = (time.monotonic(), dict(counts))
+            return counts
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """
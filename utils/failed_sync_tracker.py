@@ -2,12 +2,92 @@
 
 import hashlib
 import json
+import re
+import threading
+from collections import Counter, OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set, Tuple
 from utils.logger import get_logger
 
+try:
+    # orjson is optional; stdlib json produces identical canonical bytes
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 logger = get_logger("failed_sync_tracker")
 
+_blake2b = hashlib.blake2b
+
+
+def _digest(data: bytes) -> str:
+    """Hex digest for change detection.
+
+    Hashes are only compared for equality and are not a security boundary,
+    so a 16-byte BLAKE2b digest is used: faster than SHA-256 on short inputs
+    and half the stored size.
+    """
+    return _blake2b(data, digest_size=16, usedforsecurity=False).hexdigest()
+
+
+# 422 failure categories, matched case-insensitively in a single pass.
+# When several match, the category listed first wins.
+_FAILURE_CATEGORY_RE = re.compile(
+    r"(?P<duplicate_fields>already been taken|duplicate)"
+    r"|(?P<missing_required>required|missing)"
+    r"|(?P<validation_error>invalid|validation)",
+    re.IGNORECASE,
+)
+_FAILURE_CATEGORY_PRIORITY = (
+    "duplicate_fields",
+    "missing_required",
+    "validation_error",
+)
+
+# Fields inferred from a general 422 message, matched case-insensitively in
+# a single pass. When several are mentioned, the field listed first wins.
+_MESSAGE_FIELD_PRIORITY = ("email", "mobile_phone", "work_phone", "emp_id")
+_MESSAGE_FIELD_RE = re.compile(
+    "|".join(
+        f"(?P<{field}>{re.escape(field.replace('_', ' '))})"
+        for field in _MESSAGE_FIELD_PRIORITY
+    ),
+    re.IGNORECASE,
+)
+
+
+def _canonical_json(value: Any) -> bytes:
+    """Serialize to canonical JSON bytes (sorted keys, compact, UTF-8).
+
+    Hashes are taken over these bytes rather than a cache encoding such as
+    MessagePack: those preserve insertion order, so equal payloads built in
+    a different key order would hash differently, and stored hashes would
+    stop matching whenever the cache serializer changed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass  # e.g. non-str keys or oversized ints; stdlib handles these
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def _parse_error_response(error_response: Any) -> Any:
+    """Decode a JSON string error response; other values are returned as-is.
+
+    Strings that are not valid JSON are returned unchanged.
+    """
+    if not isinstance(error_response, str):
+        return error_response
+    try:
+        if orjson is not None:
+            return orjson.loads(error_response)
+        return json.loads(error_response)
+    except ValueError:
+        return error_response
+
 
 class FailedSyncTracker:
     """
@@ -17,6 +97,16 @@ class FailedSyncTracker:
     the last failure, preventing wasted API calls for unchanged data.
     """
 
+    # Short scalar field values are stored as "raw:<value>" instead of hashed
+    RAW_VALUE_PREFIX = "raw:"
+    MAX_RAW_VALUE_LENGTH = 256
+    # Stored form of a None/empty field value (normalized to "")
+    _EMPTY_HASH = RAW_VALUE_PREFIX
+    # Storage cap for last_error_message
+    MAX_ERROR_MESSAGE_BYTES = 500
+    # Upper bound on cached failure record lookups
+    _RECORD_CACHE_SIZE = 4096
+
     def __init__(self, data_manager, config):
         """
         Initialize tracker with reference to data_manager for Redis operations.
@@ -29,27 +119,130 @@ class FailedSyncTracker:
         self.config = config
         self.enabled = config.FAILED_SYNC_TRACKER_ENABLED
         self.ttl_days = config.FAILED_SYNC_TTL_DAYS
+        self.index_refresh_seconds = int(config.FAILED_SYNC_INDEX_REFRESH_MINUTES) * 60
+
+        # Local index of (entity_type, entity_id) pairs with a failure record.
+        # None until the first refresh, in which case every lookup hits Redis.
+        self._known_failed_keys: Optional[Set[Tuple[str, str]]] = None
+        self._index_lock = threading.Lock()
+        self._index_stop = threading.Event()
+        self._index_thread: Optional[threading.Thread] = None
+
+        # LRU of failure record lookups (None = no record), reset per sync pass
+        self._record_cache: "OrderedDict[Tuple[str, str], Optional[Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._record_cache_lock = threading.Lock()
+
+    # ---------- Failure key index ----------
+    def refresh_failed_key_index(self) -> bool:
+        """
+        Rebuild the local failure key index from Redis.
+
+        Returns:
+            True if the index was refreshed, False if Redis was unavailable
+            (the index is then dropped so lookups fall back to Redis)
+        """
+        pairs = self.data_manager.get_failed_sync_keys()
+        with self._index_lock:
+            self._known_failed_keys = set(pairs) if pairs is not None else None
+        return pairs is not None
+
+    def start_index_refresh(self) -> None:
+        """Populate the failure key index and keep it fresh in the background.
+
+        Periodic refreshes pick up records written or expired by other replicas.
+        """
+        self.refresh_failed_key_index()
+        if self._index_thread is not None or self.index_refresh_seconds <= 0:
+            return
+        self._index_thread = threading.Thread(
+            target=self._index_refresh_loop,
+            name="failed-sync-index-refresh",
+            daemon=True,
+        )
+        self._index_thread.start()
+
+    def stop_index_refresh(self) -> None:
+        """Stop the background index refresh thread."""
+        self._index_stop.set()
+
+    def _index_refresh_loop(self) -> None:
+        while not self._index_stop.wait(self.index_refresh_seconds):
+            try:
+                self.refresh_failed_key_index()
+            except Exception as e:
+                logger.warning(f"Failed sync key index refresh failed: {e}")
+
+    def _index_add(self, entity_type: str, entity_id: str) -> None:
+        with self._index_lock:
+            if self._known_failed_keys is not None:
+                self._known_failed_keys.add((entity_type, str(entity_id)))
+
+    def _index_discard(self, entity_type: str, entity_id: str) -> None:
+        with self._index_lock:
+            if self._known_failed_keys is not None:
+                self._known_failed_keys.discard((entity_type, str(entity_id)))
+
+    # ---------- Failure record cache ----------
+    def reset_record_cache(self) -> None:
+        """Drop cached failure record lookups; call at the start of each sync pass."""
+        with self._record_cache_lock:
+            self._record_cache.clear()
+
+    def _cache_record(
+        self, entity_type: str, entity_id: str, record: Optional[Dict[str, Any]]
+    ) -> None:
+        key = (entity_type, str(entity_id))
+        with self._record_cache_lock:
+            self._record_cache[key] = record
+            self._record_cache.move_to_end(key)
+            if len(self._record_cache) > self._RECORD_CACHE_SIZE:
+                self._record_cache.popitem(last=False)
+
+    def _invalidate_record(self, entity_type: str, entity_id: str) -> None:
+        with self._record_cache_lock:
+            self._record_cache.pop((entity_type, str(entity_id)), None)
+
+    def _get_failure_record(
+        self, entity_type: str, entity_id: str
+    ) -> Optional[Dict[str, Any]]:
+        key = (entity_type, str(entity_id))
+        with self._record_cache_lock:
+            if key in self._record_cache:
+                self._record_cache.move_to_end(key)
+                return self._record_cache[key]
+        record = self.data_manager.get_failed_sync_record(entity_type, entity_id)
+        self._cache_record(entity_type, entity_id, record)
+        return record
 
     def compute_field_hash(self, value: Any) -> str:
         """
-        Compute SHA-256 hash of a field value for change detection.
+        Compute the change-detection token of a field value.
+
+        Short scalar values are returned as "raw:<value>" so they can be
+        compared without hashing; dicts, lists and long values are hashed
+        with BLAKE2b.
 
         Args:
             value: Field value to hash (any JSON-serializable type)
 
         Returns:
-            Hexadecimal hash string
+            "raw:"-prefixed value or hexadecimal hash string
         """
-        if value is None:
-            value = ""
+        if value is None or value == "":
+            return self._EMPTY_HASH
 
-        # Normalize value to string for consistent hashing
         if isinstance(value, (dict, list)):
-            normalized = json.dumps(value, sort_keys=True)
+            return _digest(_canonical_json(value))
+
+        if isinstance(value, (bool, int, float)):
+            normalized = str(value)
         else:
             normalized = str(value).strip()
-
-        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        if len(normalized) <= self.MAX_RAW_VALUE_LENGTH:
+            return self.RAW_VALUE_PREFIX + normalized
+        return _digest(normalized.encode("utf-8"))
 
     def compute_hash(self, data: Dict[str, Any]) -> str:
         """
@@ -61,8 +254,9 @@ class FailedSyncTracker:
         Returns:
             Hexadecimal hash string
         """
-        normalized = json.dumps(data, sort_keys=True)
-        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        # Payloads are ~1 KB, so encoding in one shot and hashing the bytes is
+        # cheaper than streaming JSONEncoder.iterencode() chunks into the hasher
+        return _digest(_canonical_json(data))
 
     def extract_failed_fields_from_error(self, error_response: Any) -> Dict[str, str]:
         """
@@ -88,13 +282,13 @@ class FailedSyncTracker:
 
         # Handle string responses
         if isinstance(error_response, str):
-            try:
-                error_response = json.loads(error_response)
-            except (json.JSONDecodeError, ValueError):
+            parsed = _parse_error_response(error_response)
+            if isinstance(parsed, str):
                 logger.warning(
                     f"Could not parse error response as JSON: {error_response}"
                 )
                 return failed_fields
+            error_response = parsed
 
         if not isinstance(error_response, dict):
             return failed_fields
@@ -111,8 +305,9 @@ class FailedSyncTracker:
         if not failed_fields and "message" in error_response:
             # Try to infer field from message (e.g., "The email has already been taken.")
             message = error_response["message"]
-            for field in ["email", "mobile_phone", "work_phone", "emp_id"]:
-                if field.replace("_", " ") in message.lower():
+            mentioned = {m.lastgroup for m in _MESSAGE_FIELD_RE.finditer(message)}
+            for field in _MESSAGE_FIELD_PRIORITY:
+                if field in mentioned:
                     failed_fields[field] = message
                     break
 
@@ -122,8 +317,52 @@ class FailedSyncTracker:
 
         return failed_fields
 
+    def prefetch_failed_records(
+        self, entity_type: str, entity_ids: List[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Load failure records for a batch of entities with a single MGET.
+
+        Entities absent from the local key index are resolved to None without
+        touching Redis. Results also seed the per-pass record cache.
+
+        Args:
+            entity_type: Type of entity (e.g., "employee", "vehicle")
+            entity_ids: Identifiers of the entities about to be synced
+
+        Returns:
+            Dict mapping entity_id to failure record (None if none exists);
+            empty if the tracker is disabled or the read failed
+        """
+        if not self.enabled:
+            return {}
+
+        ids = [str(entity_id) for entity_id in entity_ids]
+        known_failed_keys = self._known_failed_keys
+        if known_failed_keys is not None:
+            lookup_ids = [i for i in ids if (entity_type, i) in known_failed_keys]
+        else:
+            lookup_ids = ids
+
+        fetched = {}
+        if lookup_ids:
+            fetched = self.data_manager.mget_failed_sync_records(
+                entity_type, lookup_ids
+            )
+            if fetched is None:
+                return {}
+
+        prefetched = {i: fetched.get(i) for i in ids}
+        for entity_id, record in prefetched.items():
+            self._cache_record(entity_type, entity_id, record)
+        return prefetched
+
     def should_skip_retry(
-        self, entity_id: str, entity_type: str, current_data: Dict[str, Any]
+        self,
+        entity_id: str,
+        entity_type: str,
+        current_data: Dict[str, Any],
+        prefetched: Optional[Dict[str, Optional[Dict[str, Any]]]] = None,
     ) -> bool:
         """
         Determine if a retry should be skipped based on field-level change detection.
@@ -135,6 +374,8 @@ class FailedSyncTracker:
             entity_id: Unique identifier for the entity
             entity_type: Type of entity (e.g., "employee", "vehicle")
             current_data: Current payload data to check
+            prefetched: Optional result of prefetch_failed_records(); entities
+                present in it are not looked up again
 
         Returns:
             True to skip retry, False to attempt sync
@@ -142,47 +383,73 @@ class FailedSyncTracker:
         if not self.enabled:
             return False
 
+        # Fast exit for the common case: no failure known for this entity
+        known_failed_keys = self._known_failed_keys
+        if (
+            known_failed_keys is not None
+            and (entity_type, str(entity_id)) not in known_failed_keys
+        ):
+            return False
+
         # Get previous failure record
-        failure_record = self.data_manager.get_failed_sync_record(
-            entity_type, entity_id
-        )
+        if prefetched is not None and str(entity_id) in prefetched:
+            failure_record = prefetched[str(entity_id)]
+        else:
+            failure_record = self._get_failure_record(entity_type, entity_id)
 
         if not failure_record:
             return False  # No previous failure, don't skip
 
-        # Check if any problematic fields have changed
+        # Check if any problematic fields have changed. Debug messages below use
+        # %-style arguments so nothing is formatted unless DEBUG is enabled.
         failed_fields = failure_record.get("failed_fields", {})
 
         if not failed_fields:
             # No field-level tracking, compare full payload
-            current_hash = self.compute_hash(current_data)
             previous_hash = failure_record.get("full_payload_hash", "")
+            if not previous_hash:
+                # Nothing to compare against; no need to hash the payload
+                return False
 
-            if current_hash != previous_hash:
+            if self.compute_hash(current_data) != previous_hash:
                 logger.debug(
-                    f"Full payload changed for {entity_type} {entity_id}, will retry"
+                    "Full payload changed for %s %s, will retry", entity_type, entity_id
                 )
                 return False
             else:
                 logger.debug(
-                    f"Full payload unchanged for {entity_type} {entity_id}, skipping retry"
+                    "Full payload unchanged for %s %s, skipping retry",
+                    entity_type,
+                    entity_id,
                 )
                 return True
 
-        # Field-level comparison
-        for field_name, field_info in failed_fields.items():
-            current_value = current_data.get(field_name)
-            current_hash = self.compute_field_hash(current_value)
+        # Field-level comparison; scalars first so a mismatch is found before
+        # any dict/list field has to be serialized
+        get_value = current_data.get
+        field_hash = self.compute_field_hash
+        field_items = failed_fields.items()
+        if len(failed_fields) > 1:
+            field_items = sorted(
+                field_items,
+                key=lambda item: isinstance(get_value(item[0]), (dict, list)),
+            )
+        for field_name, field_info in field_items:
             previous_hash = field_info.get("value_hash", "")
 
-            if current_hash != previous_hash:
+            if not previous_hash or field_hash(get_value(field_name)) != previous_hash:
                 logger.debug(
-                    f"Field '{field_name}' changed for {entity_type} {entity_id}, will retry"
+                    "Field '%s' changed for %s %s, will retry",
+                    field_name,
+                    entity_type,
+                    entity_id,
                 )
                 return False  # At least one problematic field changed, should retry
 
         logger.debug(
-            f"All problematic fields unchanged for {entity_type} {entity_id}, skipping retry"
+            "All problematic fields unchanged for %s %s, skipping retry",
+            entity_type,
+            entity_id,
         )
         return True  # All problematic fields unchanged, skip retry
 
@@ -209,15 +476,20 @@ class FailedSyncTracker:
         if not self.enabled:
             return
 
+        # Decode once; field extraction and categorization share the result
+        parsed_error = _parse_error_response(error_response)
+
         # Extract which fields caused the failure
-        failed_fields = self.extract_failed_fields_from_error(error_response)
+        failed_fields = self.extract_failed_fields_from_error(parsed_error)
 
         # Compute hashes for failed fields
         field_hashes = {}
+        field_hash = self.compute_field_hash
+        get_value = data.get
         for field_name, error_msg in failed_fields.items():
-            field_value = data.get(field_name)
+            field_value = get_value(field_name)
             field_hashes[field_name] = {
-                "value_hash": self.compute_field_hash(field_value),
+                "value_hash": field_hash(field_value),
                 "error": error_msg,
                 "value": (
                     str(field_value)[:100] if field_value is not None else None
@@ -236,8 +508,9 @@ class FailedSyncTracker:
             "entity_id": entity_id,
             "entity_type": entity_type,
             "failed_fields": field_hashes,
-            "full_payload_hash": self.compute_hash(data),
-            "failure_reason": self._categorize_failure(error_response, http_status),
+            # Only read by should_skip_retry when there are no field hashes
+            "full_payload_hash": "" if field_hashes else self.compute_hash(data),
+            "failure_reason": self._categorize_failure(parsed_error, http_status),
             "first_failed_at": (
                 existing_record.get("first_failed_at", now) if existing_record else now
             ),
@@ -247,7 +520,7 @@ class FailedSyncTracker:
             ),
             "http_status": http_status,
             "operation": operation,
-            "last_error_message": str(error_response)[:500],  # Truncate for storage
+            "last_error_message": self._truncate_error_message(error_response),
         }
 
         # Save to Redis with configured TTL
@@ -259,6 +532,8 @@ class FailedSyncTracker:
         )
 
         if success:
+            self._index_add(entity_type, entity_id)
+            self._cache_record(entity_type, entity_id, failure_metadata)
             logger.info(
                 f"Recorded failure for {entity_type} {entity_id}: "
                 f"{len(failed_fields)} field(s), attempt #{failure_metadata['attempt_count']}"
@@ -266,6 +541,30 @@ class FailedSyncTracker:
         else:
             logger.warning(f"Failed to record failure for {entity_type} {entity_id}")
 
+    def _truncate_error_message(self, error_response: Any) -> str:
+        """
+        Render an error response for storage, capped at MAX_ERROR_MESSAGE_BYTES.
+
+        Dicts/lists are JSON-encoded rather than repr()'d, and the cap is applied
+        to UTF-8 bytes so multi-byte characters cannot inflate stored size.
+
+        Args:
+            error_response: Error response from API
+
+        Returns:
+            Truncated error message string
+        """
+        if isinstance(error_response, str):
+            text = error_response
+        elif isinstance(error_response, (dict, list)):
+            text = json.dumps(error_response, ensure_ascii=False, default=str)
+        else:
+            text = str(error_response)
+        encoded = text.encode("utf-8")
+        if len(encoded) <= self.MAX_ERROR_MESSAGE_BYTES:
+            return text
+        return encoded[: self.MAX_ERROR_MESSAGE_BYTES].decode("utf-8", "ignore")
+
     def _categorize_failure(self, error_response: Any, http_status: int) -> str:
         """
         Categorize the type of failure for better tracking.
@@ -280,23 +579,37 @@ class FailedSyncTracker:
         if http_status != 422:
             return f"http_{http_status}"
 
-        # Parse error response
+        # Collect the text to scan; for dicts scan the messages directly
+        # instead of serializing the whole structure
         if isinstance(error_response, str):
-            error_text = error_response.lower()
+            texts = [error_response]
         elif isinstance(error_response, dict):
-            error_text = json.dumps(error_response).lower()
+            texts = []
+            message = error_response.get("message")
+            if isinstance(message, str):
+                texts.append(message)
+            errors = error_response.get("errors")
+            if isinstance(errors, dict):
+                for messages in errors.values():
+                    if isinstance(messages, str):
+                        texts.append(messages)
+                    elif isinstance(messages, list):
+                        texts.extend(m for m in messages if isinstance(m, str))
+            if not texts:
+                texts = [json.dumps(error_response)]
         else:
-            error_text = str(error_response).lower()
+            texts = [str(error_response)]
 
         # Categorize based on error message patterns
-        if "already been taken" in error_text or "duplicate" in error_text:
-            return "duplicate_fields"
-        elif "required" in error_text or "missing" in error_text:
-            return "missing_required"
-        elif "invalid" in error_text or "validation" in error_text:
-            return "validation_error"
-        else:
-            return "unknown_422"
+        best = len(_FAILURE_CATEGORY_PRIORITY)
+        for text in texts:
+            for match in _FAILURE_CATEGORY_RE.finditer(text):
+                best = min(best, _FAILURE_CATEGORY_PRIORITY.index(match.lastgroup))
+                if best == 0:
+                    return _FAILURE_CATEGORY_PRIORITY[0]
+        if best < len(_FAILURE_CATEGORY_PRIORITY):
+            return _FAILURE_CATEGORY_PRIORITY[best]
+        return "unknown_422"
 
     def clear_failure(self, entity_id: str, entity_type: str) -> None:
         """
@@ -312,6 +625,8 @@ class FailedSyncTracker:
         success = self.data_manager.delete_failed_sync_record(entity_type, entity_id)
 
         if success:
+            self._index_discard(entity_type, entity_id)
+            self._invalidate_record(entity_type, entity_id)
             logger.debug(f"Cleared failure record for {entity_type} {entity_id}")
         else:
             logger.warning(
@@ -328,7 +643,9 @@ class FailedSyncTracker:
         Returns:
             Dictionary with stats (total, by_reason, oldest_failure, etc.)
         """
-        all_failures = self.data_manager.get_all_failed_records(entity_type=entity_type)
+        all_failures = self.data_manager.get_all_failed_records_bulk(
+            entity_type=entity_type
+        )
 
         if not all_failures:
             return {
@@ -338,29 +655,17 @@ class FailedSyncTracker:
                 "oldest_failure": None,
             }
 
-        by_entity_type = {}
-        by_reason = {}
-        oldest_timestamp = None
-
-        for failure in all_failures:
-            # Count by entity type
-            etype = failure.get("entity_type", "unknown")
-            by_entity_type[etype] = by_entity_type.get(etype, 0) + 1
-
-            # Count by failure reason
-            reason = failure.get("failure_reason", "unknown")
-            by_reason[reason] = by_reason.get(reason, 0) + 1
-
-            # Track oldest failure
-            first_failed = failure.get("first_failed_at")
-            if first_failed:
-                if oldest_timestamp is None or first_failed < oldest_timestamp:
-                    oldest_timestamp = first_failed
+        by_entity_type = Counter(f.get("entity_type", "unknown") for f in all_failures)
+        by_reason = Counter(f.get("failure_reason", "unknown") for f in all_failures)
+        oldest_timestamp = min(
+            (f["first_failed_at"] for f in all_failures if f.get("first_failed_at")),
+            default=None,
+        )
 
         return {
             "total": len(all_failures),
-            "by_entity_type": by_entity_type,
-            "by_reason": by_reason,
+            "by_entity_type": dict(by_entity_type),
+            "by_reason": dict(by_reason),
             "oldest_failure": oldest_timestamp,
         }
 
@@ -381,6 +686,12 @@ class FailedSyncTracker:
         Returns:
             List of failed record details
         """
+        page = self.data_manager.get_failed_sync_records_page(
+            entity_type=entity_type, offset=offset, limit=limit
+        )
+        if page is not None:
+            return page
+
         all_failures = self.data_manager.get_all_failed_records(entity_type=entity_type)
 
         # Sort by last_failed_at descending
@@ -399,9 +710,28 @@ class FailedSyncTracker:
         Returns:
             Count of failed records
         """
+        count = self.data_manager.count_failed_sync_records(entity_type=entity_type)
+        if count is not None:
+            return count
+
         all_failures = self.data_manager.get_all_failed_records(entity_type=entity_type)
         return len(all_failures)
 
+    def _parse_record_id(self, record_id: str) -> Optional[Tuple[str, str]]:
+        """Resolve a record id to (entity_type, entity_id).
+
+        Record ids have the format "entity_type:entity_id"; a bare entity id
+        is resolved through the entity id lookup hash instead of a scan.
+        """
+        if ":" in record_id:
+            entity_type, entity_id = record_id.split(":", 1)
+            return entity_type, entity_id
+
+        entity_type = self.data_manager.get_failed_sync_entity_type(record_id)
+        if not entity_type:
+            return None
+        return entity_type, record_id
+
     def mark_for_retry(self, record_id: str) -> bool:
         """
         Mark a specific record for retry by clearing its failure status.
@@ -416,19 +746,10 @@ class FailedSyncTracker:
             return False
 
         try:
-            # Parse record_id (format: "entity_type:entity_id")
-            if ":" in record_id:
-                entity_type, entity_id = record_id.split(":", 1)
-            else:
-                # Try to find the record by ID alone
-                all_failures = self.data_manager.get_all_failed_records()
-                for failure in all_failures:
-                    if failure.get("entity_id") == record_id:
-                        entity_type = failure.get("entity_type")
-                        entity_id = record_id
-                        break
-                else:
-                    return False
+            parsed = self._parse_record_id(record_id)
+            if not parsed:
+                return False
+            entity_type, entity_id = parsed
 
             # Mark for retry by updating the record with retry flag
             record = self.data_manager.get_failed_sync_record(entity_type, entity_id)
@@ -445,6 +766,7 @@ class FailedSyncTracker:
                 ttl_days=self.ttl_days,
             )
 
+            self._invalidate_record(entity_type, entity_id)
             logger.info(f"Marked {entity_type} {entity_id} for retry")
             return True
 
@@ -466,25 +788,18 @@ class FailedSyncTracker:
             return False
 
         try:
-            # Parse record_id (format: "entity_type:entity_id")
-            if ":" in record_id:
-                entity_type, entity_id = record_id.split(":", 1)
-            else:
-                # Try to find the record by ID alone
-                all_failures = self.data_manager.get_all_failed_records()
-                for failure in all_failures:
-                    if failure.get("entity_id") == record_id:
-                        entity_type = failure.get("entity_type")
-                        entity_id = record_id
-                        break
-                else:
-                    return False
+            parsed = self._parse_record_id(record_id)
+            if not parsed:
+                return False
+            entity_type, entity_id = parsed
 
             success = self.data_manager.delete_failed_sync_record(
                 entity_type, entity_id
             )
 
             if success:
+                self._index_discard(entity_type, entity_id)
+                self._invalidate_record(entity_type, entity_id)
                 logger.info(f"Dismissed failed record for {entity_type} {entity_id}")
 
             return success
@@ -507,22 +822,23 @@ class FailedSyncTracker:
             return 0
 
         all_failures = self.data_manager.get_all_failed_records(entity_type=entity_type)
-        count = 0
+        updates = []
+        now = datetime.now(timezone.utc).isoformat()
 
         for failure in all_failures:
             etype = failure.get("entity_type")
             eid = failure.get("entity_id")
             if etype and eid:
                 failure["retry_requested"] = True
-                failure["retry_requested_at"] = datetime.now(timezone.utc).isoformat()
-                self.data_manager.save_failed_sync_record(
-                    entity_type=etype,
-                    entity_id=eid,
-                    metadata=failure,
-                    ttl_days=self.ttl_days,
-                )
-                count += 1
+                failure["retry_requested_at"] = now
+                updates.append((etype, eid, failure))
 
+        # One MULTI/EXEC for all records instead of a round trip per record
+        count = self.data_manager.save_failed_sync_records_bulk(
+            updates, ttl_days=self.ttl_days
+        )
+
+        self.reset_record_cache()
         logger.info(f"Marked {count} records for retry")
         return count
 
@@ -543,7 +859,13 @@ def initialize_tracker(data_manager, config) -> FailedSyncTracker:
         Initialized FailedSyncTracker instance
     """
     global failed_sync_tracker
+    if failed_sync_tracker is not None:
+        failed_sync_tracker.stop_index_refresh()
     failed_sync_tracker = FailedSyncTracker(data_manager, config)
+    if failed_sync_tracker.enabled:
+        # Index records saved before the expiry-scored index existed
+        data_manager.rebuild_failed_sync_index()
+        failed_sync_tracker.start_index_refresh()
     enabled_status = "enabled" if config.FAILED_SYNC_TRACKER_ENABLED else "disabled"
     logger.info(
         f"Failed sync tracker initialized ({enabled_status}, TTL: {config.FAILED_SYNC_TTL_DAYS} days)"
@@ -551,6 +873,16 @@ def initialize_tracker(data_manager, config) -> FailedSyncTracker:
     return failed_sync_tracker
 
 
+def begin_sync_pass() -> None:
+    """Reset per-pass state of the global tracker at the start of a sync pass.
+
+    Failure records may have changed since the previous pass, so cached
+    lookups are dropped for every syncer, prefetching or not.
+    """
+    if failed_sync_tracker is not None:
+        failed_sync_tracker.reset_record_cache()
+
+
 def get_tracker() -> Optional[FailedSyncTracker]:
     """
     Get the global failed sync tracker instance.
@@ -1,6 +1,9 @@
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
+import threading
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from sqlalchemy import text
 from utils.logger import get_logger
 from services.viewpoint_api import ViewpointAPI
@@ -13,6 +16,10 @@ from config import config
 
 logger = get_logger("health")
 
+# Keep-alive session reused across Samsara probes to skip TCP/TLS setup
+_samsara_session = requests.Session()
+_samsara_session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
+
 
 def check_database() -> Dict[str, Any]:
     start = time.time()
@@ -59,7 +66,9 @@ def check_samsara() -> Dict[str, Any]:
             "Authorization": f"Bearer {config.SAMSARA_API_KEY}",
             "Accept": "application/json",
         }
-        resp = requests.get(url, headers=headers, params={"limit": 1}, timeout=5)
+        resp = _samsara_session.get(
+            url, headers=headers, params={"limit": 1}, timeout=5
+        )
         resp.raise_for_status()
         return {"status": "healthy", "latency_ms": (time.time() - start) * 1000}
     except Exception as e:
@@ -136,14 +145,45 @@ def check_failed_syncs() -> Dict[str, Any]:
         }
 
 
+# Last (monotonic time, result) of run_health_checks, shared by all probes
+_last_result: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+_result_lock = threading.Lock()
+
+
 def run_health_checks() -> Dict[str, Any]:
-    checks = {
-        "database": check_database(),
-        "safetyamp": check_safetyamp(),
-        "samsara": check_samsara(),
-        "cache": check_cache(),
-        "failed_syncs": check_failed_syncs(),
+    """Run all health checks, reusing a result computed within the cache TTL.
+
+    Probes arriving while a run is in progress wait for it instead of starting
+    their own, so frequent probes cost at most one run per TTL window.
+    """
+    global _last_result
+    with _result_lock:
+        checked_at, result = _last_result
+        if (
+            result is not None
+            and time.monotonic() - checked_at < config.HEALTH_CHECK_CACHE_SECONDS
+        ):
+            return result
+        result = _run_health_checks()
+        _last_result = (time.monotonic(), result)
+        return result
+
+
+def _run_health_checks() -> Dict[str, Any]:
+    # Checks are independent and I/O bound; run them concurrently so the total
+    # latency is that of the slowest check rather than the sum
+    check_fns = {
+        "database": check_database,
+        "safetyamp": check_safetyamp,
+        "samsara": check_samsara,
+        "cache": check_cache,
+        "failed_syncs": check_failed_syncs,
     }
+    with ThreadPoolExecutor(
+        max_workers=len(check_fns), thread_name_prefix="health-check"
+    ) as executor:
+        futures = {name: executor.submit(fn) for name, fn in check_fns.items()}
+        checks = {name: future.result() for name, future in futures.items()}
 
     # Determine overall status
     # Do NOT mark overall unhealthy solely due to database issues to avoid liveness failures.
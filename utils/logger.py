@@ -1,22 +1,28 @@
+import atexit
 import logging
+import logging.handlers
 import json
+import queue
+import threading
 from pathlib import Path
 from datetime import datetime, timezone
 from config import settings
 
+try:
+    # orjson is optional; stdlib json is used when unavailable
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 # Get absolute project root (where .env lives)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 
 class _JsonFormatter(logging.Formatter):
-    def format(self, record: logging.LogRecord) -> str:
-        payload = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-        }
-        for extra_key in (
+    # Intersecting with the record's __dict__ keys is one C-level set
+    # operation instead of a hasattr/getattr pair per key per record
+    _EXTRA_KEYS = frozenset(
+        {
             "sync_type",
             "session_id",
             "operation",
@@ -24,40 +30,135 @@ class _JsonFormatter(logging.Formatter):
             "error_type",
             "metrics",
             "duration_seconds",
-        ):
-            if hasattr(record, extra_key):
-                payload[extra_key] = getattr(record, extra_key)
-        return json.dumps(payload, separators=(",", ":"))
+        }
+    )
+
+    def format(self, record: logging.LogRecord) -> str:
+        now = datetime.now(timezone.utc)
+        payload = {
+            # orjson serializes aware datetimes exactly like isoformat()
+            "timestamp": now if orjson is not None else now.isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        attrs = record.__dict__
+        for extra_key in attrs.keys() & self._EXTRA_KEYS:
+            payload[extra_key] = attrs[extra_key]
+        if orjson is not None:
+            try:
+                return orjson.dumps(payload, default=str).decode("utf-8")
+            except TypeError:
+                payload["timestamp"] = now.isoformat()
+        return json.dumps(payload, separators=(",", ":"), default=str)
 
 
-def get_logger(name: str) -> logging.Logger:
-    log_file = PROJECT_ROOT / "output" / "logs" / "safetyamp_sync.log"
-    log_file.parent.mkdir(parents=True, exist_ok=True)
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler with a large write buffer that flushes once the queue drains.
 
-    logger = logging.getLogger(name)
+    StreamHandler flushes after every record; under load that is one write
+    syscall per line. Deferring the flush until the listener has no queued
+    records batches writes while still flushing promptly when idle.
+    """
+
+    def __init__(self, filename, log_queue, buffer_size: int = 64 * 1024):
+        self._log_queue = log_queue
+        self._buffer_size = buffer_size
+        super().__init__(filename, mode="a")
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self._buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
 
-    if logger.handlers:
-        return logger  # Prevent re-adding handlers
+    def flush(self) -> None:
+        if self._log_queue.empty():
+            super().flush()
 
-    logger.setLevel(settings.LOG_LEVEL.upper())
+    def close(self) -> None:
+        self.acquire()
+        try:
+            if self.stream:
+                self.stream.flush()
+        finally:
+            self.release()
+        super().close()
 
-    text_formatter = logging.Formatter(
+
+# Handlers are created once; named loggers only set their level and
+# propagate records to the root logger, whose QueueHandler hands them to a
+# background QueueListener so callers never block on file or console I/O.
+_configured = False
+_configure_lock = threading.Lock()
+_listener = None
+_default_level = "INFO"
+
+
+def _build_formatter() -> logging.Formatter:
+    """Build the single formatter shared by every handler."""
+    if settings.STRUCTURED_LOGGING_ENABLED:
+        return _JsonFormatter()
+    return logging.Formatter(
         "[%(asctime)s] [%(levelname)s] [%(name)s]: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
-    json_formatter = _JsonFormatter()
 
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setFormatter(
-        text_formatter if not settings.STRUCTURED_LOGGING_ENABLED else json_formatter
-    )
 
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(
-        text_formatter if not settings.STRUCTURED_LOGGING_ENABLED else json_formatter
-    )
+def _build_handlers(log_file: Path, log_queue, formatter) -> list:
+    """Build the handlers the queue listener writes to.
+
+    The console handler is only created when LOG_TO_CONSOLE is set, so
+    containerized runs write each record once, to the log file.
+    """
+    file_handler = _BufferedFileHandler(log_file, log_queue)
+    file_handler.setFormatter(formatter)
+    handlers = [file_handler]
+
+    if settings.LOG_TO_CONSOLE:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
+
+    return handlers
+
+
+def _configure_root_logger() -> None:
+    global _configured, _listener, _default_level
+    with _configure_lock:
+        if _configured:
+            return
+
+        log_file = PROJECT_ROOT / "output" / "logs" / "safetyamp_sync.log"
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+
+        formatter = _build_formatter()
+
+        log_queue = queue.SimpleQueue()
+
+        _listener = logging.handlers.QueueListener(
+            log_queue,
+            *_build_handlers(log_file, log_queue, formatter),
+            respect_handler_level=True,
+        )
+        _listener.start()
+        atexit.register(_listener.stop)
+
+        logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+        _default_level = settings.LOG_LEVEL.upper()
+        _configured = True
+
+
+def get_logger(name: str) -> logging.Logger:
+    if not _configured:
+        _configure_root_logger()
+
+    logger = logging.getLogger(name)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    if logger.level == logging.NOTSET:
+        logger.setLevel(_default_level)
 
     return logger
@@ -1,4 +1,5 @@
-from typing import List, Optional
+import threading
+from typing import Any, Callable, Dict, List, Optional
 from prometheus_client import (
     Counter,
     Gauge,
@@ -18,6 +19,12 @@ class MetricsCollector:
         # Pre-populated metrics are initialized lazily on first access
         self._initialized: bool = False
 
+        # Collectors resolved by this instance, keyed by requested name, so
+        # repeat lookups skip the registry's private name map
+        self._collectors: Dict[str, Any] = {}
+        # Guards first-time resolution; lookups of known names never take it
+        self._lock = threading.Lock()
+
         # Well-known metrics exposed as attributes after initialization
         self.sync_operations_total: Optional[Counter] = None
         self.sync_duration_seconds: Optional[Histogram] = None
@@ -32,6 +39,10 @@ class MetricsCollector:
         self.cache_last_updated_ts: Optional[Gauge] = None
         self.cache_items_total: Optional[Gauge] = None
         self.cache_ttl_seconds: Optional[Gauge] = None
+        self.cache_hits_total: Optional[Counter] = None
+        self.cache_misses_total: Optional[Counter] = None
+        self.cache_refresh_total: Optional[Counter] = None
+        self.cache_read_latency_seconds: Optional[Histogram] = None
 
         # Domain metrics
         self.changes_total: Optional[Counter] = None
@@ -49,29 +60,43 @@ class MetricsCollector:
         except KeyError:
             return None
 
-    def get_counter(
-        self, name: str, description: str, labelnames: Optional[List[str]] = None
-    ) -> Counter:
-        existing = self._get_existing(name)
-        if isinstance(existing, Counter):
-            return existing
-        if existing is not None:
+    def _get_or_create(self, name: str, kind: type, factory: Callable[[], Any]):
+        # Hot path: collectors this instance already resolved are served from
+        # the local dict without touching the registry or taking a lock
+        collector = self._collectors.get(name)
+        if collector is None:
+            # Only first lookups serialize, so concurrent callers cannot both
+            # miss and race to register the same name
+            with self._lock:
+                collector = self._collectors.get(name)
+                if collector is None:
+                    collector = self._get_existing(name)
+                    if collector is None:
+                        collector = factory()
+                    self._collectors[name] = collector
+        if not isinstance(collector, kind):
             raise ValueError(
                 f"A collector named '{name}' is already registered with a different type"
             )
-        return Counter(name, description, labelnames=labelnames or [])
+        return collector
+
+    def get_counter(
+        self, name: str, description: str, labelnames: Optional[List[str]] = None
+    ) -> Counter:
+        return self._get_or_create(
+            name,
+            Counter,
+            lambda: Counter(name, description, labelnames=labelnames or []),
+        )
 
     def get_gauge(
         self, name: str, description: str, labelnames: Optional[List[str]] = None
     ) -> Gauge:
-        existing = self._get_existing(name)
-        if isinstance(existing, Gauge):
-            return existing
-        if existing is not None:
-            raise ValueError(
-                f"A collector named '{name}' is already registered with a different type"
-            )
-        return Gauge(name, description, labelnames=labelnames or [])
+        return self._get_or_create(
+            name,
+            Gauge,
+            lambda: Gauge(name, description, labelnames=labelnames or []),
+        )
 
     def get_histogram(
         self,
@@ -80,18 +105,14 @@ class MetricsCollector:
         labelnames: Optional[List[str]] = None,
         buckets: Optional[List[float]] = None,
     ) -> Histogram:
-        existing = self._get_existing(name)
-        if isinstance(existing, Histogram):
-            return existing
-        if existing is not None:
-            raise ValueError(
-                f"A collector named '{name}' is already registered with a different type"
-            )
-        if buckets is not None:
-            return Histogram(
-                name, description, labelnames=labelnames or [], buckets=buckets
-            )
-        return Histogram(name, description, labelnames=labelnames or [])
+        def create() -> Histogram:
+            if buckets is not None:
+                return Histogram(
+                    name, description, labelnames=labelnames or [], buckets=buckets
+                )
+            return Histogram(name, description, labelnames=labelnames or [])
+
+        return self._get_or_create(name, Histogram, create)
 
     # ---------- High-level initialization ----------
     def initialize_defaults(self) -> None:
@@ -153,6 +174,27 @@ class MetricsCollector:
             "Configured TTL seconds for a given cache (remaining TTL when saved)",
             labelnames=["cache"],
         )
+        self.cache_hits_total = self.get_counter(
+            "safetyamp_cache_hits_total",
+            "Reads served from a fresh cache entry",
+            labelnames=["cache"],
+        )
+        self.cache_misses_total = self.get_counter(
+            "safetyamp_cache_misses_total",
+            "Reads that found no fresh cache entry",
+            labelnames=["cache"],
+        )
+        self.cache_refresh_total = self.get_counter(
+            "safetyamp_cache_refresh_total",
+            "Cache refreshes from the source fetch function",
+            labelnames=["cache"],
+        )
+        self.cache_read_latency_seconds = self.get_histogram(
+            "safetyamp_cache_read_latency_seconds",
+            "Time to read and decode a cache entry",
+            labelnames=["cache"],
+            buckets=[0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0],
+        )
 
         # Domain metrics
         self.changes_total = self.get_counter(